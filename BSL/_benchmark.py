@@ -0,0 +1,360 @@
+"""
+Small benchmarks for the hot paths of the transpiler. None of them need a Maya
+session, they only need the collected Bifrost data in res/bifrost. Run them
+from the script editor:
+    from BSL import _benchmark
+    _benchmark.lexer()
+
+Every function prints its result and returns the raw number so they can be
+compared across changes.
+"""
+import time
+import tracemalloc
+
+from BSL import _constants
+
+
+def _large_source(i_copies=50):
+    """
+    Builds a big BSL source by repeating all the syntax chapters
+    """
+    sa_chapters = [path.read_text() for path in sorted((_constants.PATH_BASE/"bsl"/"syntax").glob("*.bf"))]
+    return "\n".join(i_copies * sa_chapters)
+
+
+def _generated_program(i_statements=20000):
+    """
+    Builds one big compound full of arithmetic, roughly what generated code looks like
+    """
+    sa_lines = ["compound generated(){"]
+    for i in range(i_statements):
+        sa_lines.append(f"    INT x{i} = ({i}i + {i + 1}i) * 2i - {i % 7}i;")
+    sa_lines.append("}")
+    return "\n".join(sa_lines)
+
+
+def _strings_and_comments(i_blocks=200):
+    """
+    Builds a source that is mostly long strings and commented out code
+    """
+    s_string = 40 * "some text with an \\\"escaped\\\" quote and a\\ttab "
+    s_block = "/*\n" + 100 * "    INT x = 1i + 2i;  // old code\n" + "*/"
+    s_inline = "\n".join(50 * ["// a comment that explains a lot of things about the code below"])
+
+    sa_parts = []
+    for i in range(i_blocks):
+        sa_parts.append(f'string s{i} = "{s_string}";')
+        sa_parts.append(s_block)
+        sa_parts.append(s_inline)
+    return "\n".join(sa_parts)
+
+
+def _best_of(i_runs, fn):
+    f_best = None
+    result = None
+    for _ in range(i_runs):
+        f_start = time.perf_counter()
+        result = fn()
+        f_time = time.perf_counter() - f_start
+        f_best = f_time if f_best is None else min(f_best, f_time)
+    return f_best, result
+
+
+def lexer(i_copies=50, i_runs=3):
+    """
+    Tokens per second of the plain lexer (no parsing) over a large source
+    """
+    from BSL import _grammar
+
+    s_source = _large_source(i_copies)
+    lexer_ = _grammar.get_lexer()
+
+    def _run():
+        lexer_.input(s_source)
+        lexer_.lineno = 1
+        i_count = 0
+        while lexer_.token():
+            i_count += 1
+        return i_count
+
+    f_time, i_tokens = _best_of(i_runs, _run)
+    print(f"lexer: {i_tokens} tokens, {len(s_source)} chars in {f_time:.3f}s ({i_tokens / f_time:,.0f} tokens/s)")
+    return i_tokens / f_time
+
+
+def lexer_strings_and_comments(i_blocks=200, i_runs=3):
+    """
+    Throughput of the STRING and COMMENT scanners
+    """
+    from BSL import _grammar
+
+    s_source = _strings_and_comments(i_blocks)
+    lexer_ = _grammar.get_lexer()
+
+    def _run():
+        lexer_.input(s_source)
+        lexer_.lineno = 1
+        i_count = 0
+        while lexer_.token():
+            i_count += 1
+        return i_count
+
+    f_time, i_tokens = _best_of(i_runs, _run)
+    f_mb = len(s_source) / 1024 / 1024
+    print(f"strings/comments: {f_mb:.1f} MB, {i_tokens} tokens in {f_time:.3f}s ({f_mb / f_time:.1f} MB/s)")
+    return f_mb / f_time
+
+
+def type_resolution(i_runs=3):
+    """
+    Calls per second of the type checks overload resolution is built on. Every
+    numeric scalar/vector/matrix type against every other one, as strings like
+    the resolvers pass them
+    """
+    from BSL import _type
+
+    sa_types = [t.s for t in _type.PROMOTION_PRIORITY_LIST]
+    sa_types += [f"array<{s}>" for s in sa_types]
+
+    def _run():
+        i_count = 0
+        for s_target in sa_types:
+            for s_value in sa_types:
+                _type.compatibility(s_target, s_value)
+                i_count += 1
+            _type.promotable_to_one_of(_type.Type(s_target), sa_types[::7])
+            i_count += 1
+        return i_count
+
+    f_time, i_calls = _best_of(i_runs, _run)
+    print(f"type resolution: {i_calls} calls in {f_time:.3f}s ({i_calls / f_time:,.0f} calls/s)")
+    return i_calls / f_time
+
+
+def overload_resolution(i_repeats=20, i_runs=3):
+    """
+    Calls per second of Overlord.resolve_inputs_and_outputs when a script calls the
+    same functions with the same types over and over, like big graphs do. Needs
+    the nodes.json, so this initializes the Overlord if nobody did yet
+    """
+    from BSL import _type
+    from BSL._overlord import Overlord
+
+    if Overlord.functions() is None:
+        Overlord.init()
+
+    calls = []
+    for s_func, d_data in Overlord.functions().items():
+        sa_input_types = d_data["default_overload"][0]
+        if sa_input_types and "auto" not in sa_input_types:
+            calls.append((s_func, sa_input_types))
+
+    def _run():
+        for _ in range(i_repeats):
+            for s_func, sa_input_types in calls:
+                Overlord.resolve_inputs_and_outputs(s_func, [_type.Type.of(s) for s in sa_input_types])
+        return i_repeats * len(calls)
+
+    Overlord.clear_resolved()
+    f_time, i_calls = _best_of(i_runs, _run)
+    d_stats = Overlord.resolve_stats()
+    print(f"overload resolution: {i_calls} calls in {f_time:.3f}s ({i_calls / f_time:,.0f} calls/s), "
+          f"hit rate {d_stats['hit_rate']:.1%}")
+    return i_calls / f_time
+
+
+def batch_resolution(i_jobs=1, i_runs=3):
+    """
+    Calls per second of Overlord.resolve_batch for every overloaded function against
+    all its default and suggested input types, compared to resolving them one by one
+    """
+    from BSL._overlord import Overlord
+
+    if Overlord.functions() is None:
+        Overlord.init()
+
+    calls = []
+    for s_func, d_data in Overlord.functions().items():
+        sa_input_types = d_data["default_overload"][0]
+        if sa_input_types and "auto" not in sa_input_types:
+            calls.append((s_func, sa_input_types))
+            calls.append((s_func, ["Math::float3"] * len(sa_input_types)))
+
+    def _run_single():
+        Overlord.clear_resolved()
+        return [Overlord.resolve_structured(s_func, sa_input_types) for s_func, sa_input_types in calls]
+
+    def _run_batch():
+        Overlord.clear_resolved()
+        return Overlord.resolve_batch(calls, i_jobs)
+
+    f_single, _ = _best_of(i_runs, _run_single)
+    f_batch, _ = _best_of(i_runs, _run_batch)
+    print(f"batch resolution: {len(calls)} calls, one by one {f_single:.3f}s, "
+          f"batched {f_batch:.3f}s ({i_jobs} processes)")
+    return len(calls) / f_batch
+
+
+def data_store(i_lookups=100, i_runs=3):
+    """
+    Startup cost of the nodes.json: decoding all of it against opening the compact
+    store and looking up i_lookups functions, like a small script would
+    """
+    import json
+    from BSL import _bifres
+
+    path_nodes = _constants.PATH_BIFROST_NODES
+    _bifres._load_json(path_nodes, True)  # make sure the store is up to date
+    sa_funcs = list(json.loads(path_nodes.read_text()))[:i_lookups]
+
+    def _run_store():
+        nodes = _bifres._load_json(path_nodes, True)
+        return [nodes[s_func] for s_func in sa_funcs]
+
+    f_json, _ = _best_of(i_runs, lambda: json.loads(path_nodes.read_text()))
+    f_store, _ = _best_of(i_runs, _run_store)
+    print(f"data store: json {f_json * 1000:.1f}ms, store + {len(sa_funcs)} lookups {f_store * 1000:.1f}ms")
+    return f_store
+
+
+def graph_build(s_file="bsl/syntax/b_expressions1.bf", i_runs=3):
+    """
+    Time it takes to build the graph IR of a BSL file, and how big it gets. No vnn
+    commands get fired, so this runs without Maya
+    """
+    from BSL import _bifcmds
+    from BSL._overlord import Overlord
+    from BSL._visitor_ast import Ast
+
+    if Overlord.functions() is None:
+        Overlord.init()
+
+    s_source = (_constants.PATH_BASE/s_file).read_text()
+
+    def _run():
+        with _bifcmds.Graph(None, "/") as graph:
+            for x in Ast.run(s_source):
+                x.to_vnn(graph)
+        return graph.ir().stats()
+
+    f_time, d_stats = _best_of(i_runs, _run)
+    print(f"graph build: {d_stats['nodes']} nodes, {d_stats['connections']} connections, "
+          f"{d_stats['values']} values in {f_time:.3f}s")
+    return d_stats
+
+
+def emission(s_file="bsl/syntax/b_expressions1.bf", i_runs=3):
+    """
+    Time it takes to build a BSL file and lower it into a _bifrecord.Recorder, and the
+    vnn commands that took. Thats everything a real build does except for Maya itself
+    """
+    from BSL import _bifcmds, _bifrecord
+    from BSL._overlord import Overlord
+    from BSL._visitor_ast import Ast
+
+    if Overlord.functions() is None:
+        Overlord.init()
+
+    s_source = (_constants.PATH_BASE/s_file).read_text()
+
+    def _run():
+        recorder = _bifrecord.Recorder()
+        with _bifcmds.Graph("bifrostGraphShape1", "/", backend=recorder) as graph:
+            for x in Ast.run(s_source):
+                x.to_vnn(graph)
+        return recorder.stats()
+
+    f_time, d_stats = _best_of(i_runs, _run)
+    s_commands = ", ".join(f"{s} {i}" for s, i in d_stats.items() if s.startswith("vnn"))
+    print(f"emission: {d_stats['total']} commands in {f_time:.3f}s ({s_commands})")
+    return d_stats
+
+
+def connect_commands(s_file="bsl/syntax/b_expressions1.bf"):
+    """
+    vnn commands it takes to lower the connections of a BSL file, with the port flag
+    toggled around every connection and with sources of a known type connected directly
+    (_constants.DIRECT_CONNECT)
+    """
+    from BSL import _bifcmds, _bifrecord
+    from BSL._overlord import Overlord
+    from BSL._visitor_ast import Ast
+
+    if Overlord.functions() is None:
+        Overlord.init()
+
+    s_source = (_constants.PATH_BASE/s_file).read_text()
+
+    def _run(b_direct):
+        b_before = _constants.DIRECT_CONNECT
+        _constants.DIRECT_CONNECT = b_direct
+        try:
+            recorder = _bifrecord.Recorder()
+            with _bifcmds.Graph("bifrostGraphShape1", "/", backend=recorder) as graph:
+                for x in Ast.run(s_source):
+                    x.to_vnn(graph)
+        finally:
+            _constants.DIRECT_CONNECT = b_before
+        d_stats = recorder.stats()
+        return d_stats["vnnConnect"] + d_stats.get("vnnPort", 0), d_stats["total"]
+
+    i_before, i_total_before = _run(False)
+    i_after, i_total_after = _run(True)
+    print(f"connect commands: {i_before} -> {i_after} ({i_total_before} -> {i_total_after} commands in total)")
+    return i_before, i_after
+
+
+def json_export(s_file="bsl/syntax/h_using.bf", i_runs=3):
+    """
+    Time it takes to write the graph IR of a BSL file as a Bifrost compound json
+    """
+    import json
+    from BSL import _bifcmds, _bifjson
+    from BSL._overlord import Overlord
+    from BSL._visitor_ast import Ast
+
+    if Overlord.functions() is None:
+        Overlord.init()
+
+    with _bifcmds.Graph(None, "/") as graph:
+        for x in Ast.run((_constants.PATH_BASE/s_file).read_text()):
+            x.to_vnn(graph)
+
+    f_time, s_json = _best_of(i_runs, lambda: json.dumps(_bifjson.to_json(graph.ir()), indent=4))
+    print(f"json export: {len(graph.ir().connections())} connections, {len(s_json) / 1024:.0f} KB in {f_time * 1000:.1f}ms")
+    return f_time
+
+
+def parse_tree_memory(i_statements=20000):
+    """
+    Peak memory (tracemalloc) of parsing a large generated program into the parse tree
+    """
+    from BSL import _grammar
+
+    parser = _grammar.get_parser()
+    s_source = _generated_program(i_statements)
+
+    tracemalloc.start()
+    try:
+        tree = parser.parse(s_source)
+        _, i_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del tree
+    print(f"parse tree: {i_statements} statements, peak {i_peak / 1024 / 1024:.1f} MB")
+    return i_peak
+
+
+if __name__ == "__main__":
+    lexer()
+    lexer_strings_and_comments()
+    type_resolution()
+    overload_resolution()
+    batch_resolution()
+    data_store()
+    graph_build()
+    emission()
+    connect_commands()
+    json_export()
+    parse_tree_memory()
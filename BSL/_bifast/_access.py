@@ -1,11 +1,6 @@
 from BSL._bifast import _node as _ast_node, _memory, _slice as _ast_slice, _call as _ast_call, _scope as _ast_scope
 from BSL import _type, _error, _bifcmds
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class AccessRHS_Default(_ast_node.Node):
     def __init__(self, parser_node, key, value_or_type):
@@ -99,8 +94,8 @@ class AccessRHS(_ast_node.Node):
         if type_value.is_array():
             if type_access.is_array():
                 i_dim = type_access.s.count("<")
-                return _type.Type(i_dim * "array<" + type_value.s[6:-1] + i_dim * ">")
-            return _type.Type(type_value.s[6:-1])
+                return _type.Type.of(i_dim * "array<" + type_value.s[6:-1] + i_dim * ">")
+            return _type.Type.of(type_value.s[6:-1])
 
         raise NotImplementedError("This shouldn't have happened... o_O")
 
@@ -124,7 +119,7 @@ class AccessRHS(_ast_node.Node):
                 graph.connect(value, get_from_string//"string")
                 graph.connect(node//"out_indices", get_from_string//"index")
                 build_string = graph.create_node("Core::String::build_string")
-                cmds.vnnPort(graph._graph, f"{build_string}.strings", 0, 1, clear=2)
+                graph.clear_port_flags(build_string//"strings", 2)
                 graph.connect(get_from_string//"character", build_string//"strings")
                 self._vnn_result = build_string//"joined"
 
@@ -210,7 +205,7 @@ class AccessLHS(_ast_node.Node):
             self._method = "array"
             if type_access.is_array():
                 self._type = type_value
-            self._type = _type.Type(type_value.s[6:-1])
+            self._type = _type.Type.of(type_value.s[6:-1])
             return
 
         raise NotImplementedError("This shouldn't have happened... o_O")
@@ -9,7 +9,7 @@ class AssignLHS_TypeName(_ast_node.Node):
     def __init__(self, parser_node, s_name, s_type):
         super().__init__(parser_node)
         self._s_name = s_name
-        self._type = _type.Type(s_type, {})
+        self._type = _type.Type.of(s_type, {})
 
     def copy(self, d_map):
         if self not in d_map:
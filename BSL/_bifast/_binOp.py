@@ -1,11 +1,6 @@
 from BSL import _type, _bifcmds
 from BSL._bifast import _node as _ast_node
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class BinOp(_ast_node.Node):
     def __init__(self, parser_node, lhs, rhs, op, type):
@@ -29,7 +24,7 @@ class BinOp(_ast_node.Node):
     @classmethod
     def resolve_value_type(cls, value):
         if isinstance(value, str):
-            value = _type.Type(value)
+            value = _type.Type.of(value)
 
         if isinstance(value, _type.Type):
             if value.is_node():
@@ -91,14 +86,14 @@ class MathOp(BinOp):
                 # Instead, I'll create a compound with set string ports that will auto loop
                 # and produce the array in question.
 
-                return True, _type.Type(i_dim * "array<" + "string" + i_dim * ">")
+                return True, _type.Type.of(i_dim * "array<" + "string" + i_dim * ">")
 
         if type_lhs_base.is_field() or type_rhs_base.is_field():
             if not (type_lhs_base.is_field() and type_rhs_base.is_field()):
                 return False, f"Operation '{op}' unsupported between '{type_lhs}' and '{type_rhs}'"
             if "VectorField" in type_lhs_base.s or "VectorField" in type_rhs_base.s:
-                return True, _type.Type(i_dim * "array<" + "Core::Fields::VectorField" + i_dim * ">")
-            return True, _type.Type(i_dim * "array<" + "Core::Fields::ScalarField" + i_dim * ">")
+                return True, _type.Type.of(i_dim * "array<" + "Core::Fields::VectorField" + i_dim * ">")
+            return True, _type.Type.of(i_dim * "array<" + "Core::Fields::ScalarField" + i_dim * ">")
 
         # numeric +/- numeric
         if type_lhs.is_numeric() and type_rhs.is_numeric():
@@ -116,7 +111,7 @@ class MathOp(BinOp):
             s_suffix = type_lhs.array_dim() * ">"
             s_base = _type.get_numeric_base_type(type_lhs_base, type_rhs_base).s
 
-            return True, _type.Type(s_prefix + s_base + s_suffix)
+            return True, _type.Type.of(s_prefix + s_base + s_suffix)
 
         # array +/- numeric
         if (type_lhs.is_array() or type_rhs.is_array()) and (type_lhs.is_numeric() or type_rhs.is_numeric()):
@@ -128,7 +123,7 @@ class MathOp(BinOp):
             s_suffix = type_arr.array_dim() * ">"
             s_base = _type.get_numeric_base_type(type_num, type_arr_base).s
 
-            return True, _type.Type(s_prefix + s_base + s_suffix)
+            return True, _type.Type.of(s_prefix + s_base + s_suffix)
 
         return False, f"Operation '{op}' not supported between '{type_lhs}' and '{type_rhs}'"
 
@@ -333,7 +328,7 @@ class Compare(_ast_node.Node):
         #   equal/not_equal and greater/less, etc
         #   Adding this for now so I can move forward
         #   May be able to use the overlord here
-        return True, _type.Type(s_prefix + "bool" + s_suffix)
+        return True, _type.Type.of(s_prefix + "bool" + s_suffix)
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -432,4 +427,4 @@ class Logic(MathOp):
             s_prefix += "Math::"
             s_suffix = str(i_mtx_dim[0]) + (f"x{i_mtx_dim[1]}" if i_mtx_dim[1] != -1 else "") + s_suffix
 
-        return True, _type.Type(s_prefix + "bool" + s_suffix)
+        return True, _type.Type.of(s_prefix + "bool" + s_suffix)
@@ -3,17 +3,12 @@ from BSL import _type, _error, _bifcmds, _file_io, _constants, _bifres, _bifast
 from BSL._overlord import Overlord
 import json
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class Argument(_ast_node.Node):
     def __init__(self, parser_node, s_name, value):
         super().__init__(parser_node)
         if isinstance(value, str):
-            value = _ast_value.Value(parser_node, None, _type.Type(value))
+            value = _ast_value.Value(parser_node, None, _type.Type.of(value))
         self._value = value
         self._type = value.value_type()
         self._s_name = s_name
@@ -85,7 +80,7 @@ class CallAssociative(_ast_node.Node, _MixinCall):
         return all([arg.is_consant() for arg in self._values])
 
     def value_type(self) -> _type.Type:
-        return _type.Type("__NODE", node_data=self.outputs())
+        return _type.Type.of("__NODE", node_data=self.outputs())
 
     @classmethod
     def _get_type(cls, s_name, values):
@@ -127,7 +122,7 @@ class CallAssociative(_ast_node.Node, _MixinCall):
                         second = arg_types.pop(0)
                         arg_types.insert(0, _VF if first == _VF or second.s == _VF else _SF)
 
-            return True, _type.Type(f"array<{arg_types[0].s}>")
+            return True, _type.Type.of(f"array<{arg_types[0].s}>")
 
         set_array_dims = set()
         for i, t in enumerate(arg_types):
@@ -190,7 +185,7 @@ class CallAssociative(_ast_node.Node, _MixinCall):
 
             s_type = f"Math::{base_types[0].s}{rows}" + (f"x{cols}" if cols > 1 else "")
             arr_dim = (list(set_array_dims) + [0])[0]
-            return True, _type.Type(arr_dim * "array<" + s_type + arr_dim * ">")
+            return True, _type.Type.of(arr_dim * "array<" + s_type + arr_dim * ">")
 
         # I believe all others (min, max, add, subtract, multiply, divide)
         # follow the rules established in the binOps
@@ -202,7 +197,7 @@ class CallAssociative(_ast_node.Node, _MixinCall):
         i_arr_dim = (list(set_array_dims) + [0])[0]
         s_prefix = i_arr_dim * "array<"
         s_suffix = i_arr_dim * ">"
-        return True, _type.Type(s_prefix + arg_types[0].s + s_suffix)
+        return True, _type.Type.of(s_prefix + arg_types[0].s + s_suffix)
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -267,7 +262,7 @@ class CallNative(_ast_node.Node, _MixinCall):
 
         status, result = None, None
         for sa_input_types, sa_output_types in zip(saa_input_types, saa_output_types):
-            input_types = [_type.Type(s) for s in sa_input_types if s]
+            input_types = [_type.Type.of(s) for s in sa_input_types if s]
             # validate args and kwargs
             status, result = _validate_arguments(sa_input_names, input_types, args, kwargs)
             if status:
@@ -300,11 +295,11 @@ class CallNative(_ast_node.Node, _MixinCall):
         sa_input_names, sa_output_names = Overlord.get_port_names(s_name)
         self._kwargs = sorted(kwargs, key=lambda arg: sa_input_names.index(arg.name()))
         self._sa_output_types = sa_output_types
-        self._input_types = [_type.Type(s) for s in sa_input_types]
+        self._input_types = [_type.Type.of(s) for s in sa_input_types]
         self._parm_types = [t.copy() for t in parm_types if t]
         self._arg_types = [arg.value_type() for arg in self._args + self._kwargs]
 
-        self._d_outputs = {k: _type.Type(v) for k, v in zip(sa_output_names, sa_output_types)}
+        self._d_outputs = {k: _type.Type.of(v) for k, v in zip(sa_output_names, sa_output_types)}
 
     def copy(self, d_map):
         if self not in d_map:
@@ -319,7 +314,7 @@ class CallNative(_ast_node.Node, _MixinCall):
         return all([arg.is_consant() for arg in self._args + self._kwargs])
 
     def value_type(self) -> _type.Type:
-        return _type.Type("__NODE", node_data=self.outputs())
+        return _type.Type.of("__NODE", node_data=self.outputs())
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -328,15 +323,19 @@ class CallNative(_ast_node.Node, _MixinCall):
         graph = graph  # type: _bifcmds.Graph
         node = graph.create_node(s_type=self._s_name)
 
+        # the Overlord already resolved what comes out, connecting those doesnt need the port flags
+        for s_port, output_type in self._d_outputs.items():
+            graph.set_known_type(node//s_port, output_type.s)
+
         # todo: disable all fan-in ports
 
         if self._s_name == "build_string" or self._s_name.endswith("::build_string"):
-            cmds.vnnPort(graph._graph, f"{node}.strings", 0, 1, clear=2)
+            graph.clear_port_flags(node//"strings", 2)
 
         elif self._s_name == "terminal" or self._s_name.endswith("::terminal"):
-            cmds.vnnPort(graph._graph, f"{node}.final", 0, 1, clear=2)
-            cmds.vnnPort(graph._graph, f"{node}.proxy", 0, 1, clear=2)
-            cmds.vnnPort(graph._graph, f"{node}.diagnostic", 0, 1, clear=2)
+            graph.clear_port_flags(node//"final", 2)
+            graph.clear_port_flags(node//"proxy", 2)
+            graph.clear_port_flags(node//"diagnostic", 2)
 
         sa_input_names, sa_output_names = Overlord.get_port_names(self._s_name)
 
@@ -405,7 +404,7 @@ class CallScope(_ast_node.Node, _MixinCall):
         result_ = None
         error_ = None
         for sa_input_types, output_types in d_overloads.items():
-            input_types = [_type.Type(s) for s in sa_input_types]
+            input_types = [_type.Type.of(s) for s in sa_input_types]
 
             _it_copy = input_types.copy()
             status, result = _validate_arguments(sa_input_names, _it_copy, args, kwargs)
@@ -447,11 +446,11 @@ class CallScope(_ast_node.Node, _MixinCall):
         # sa_output_types = [t.s for t in scope.output_types()]
 
         # self._input_types = [arg.value_type() for arg in scope.parameters()]
-        self._input_types = input_types#[_type.Type(t.s) for t in input_types]
+        self._input_types = input_types#[_type.Type.of(t.s) for t in input_types]
         self._parm_types = [t for t in parm_types if t]
         self._arg_types = [arg.value_type() for arg in args + kwargs]
 
-        self._d_outputs = {k: _type.Type(v) for k, v in zip(sa_output_names, sa_output_types)}
+        self._d_outputs = {k: _type.Type.of(v) for k, v in zip(sa_output_names, sa_output_types)}
 
     def copy(self, d_map):
         if self not in d_map:
@@ -464,7 +463,7 @@ class CallScope(_ast_node.Node, _MixinCall):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type("__NODE", node_data=self.outputs())
+        return _type.Type.of("__NODE", node_data=self.outputs())
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -551,7 +550,7 @@ class CallType(_ast_node.Node, _MixinCall):
                 continue
 
             # todo: permit lossy conversion
-            x_compat(v=value.value_type(), t=_type.Type(self._d_type_data[s_port]))
+            x_compat(v=value.value_type(), t=_type.Type.of(self._d_type_data[s_port]))
 
     def copy(self, d_map):
         if self not in d_map:
@@ -561,7 +560,7 @@ class CallType(_ast_node.Node, _MixinCall):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type(self._s_name)
+        return _type.Type.of(self._s_name)
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -571,7 +570,7 @@ class CallType(_ast_node.Node, _MixinCall):
         node = graph.create_value_node(s_type=self.value_type().s)
 
         sa_input_names = list(self._d_type_data.keys())
-        port_types = [_type.Type(s) for s in list(self._d_type_data.values())]
+        port_types = [_type.Type.of(s) for s in list(self._d_type_data.values())]
 
         sa_values = len(sa_input_names) * [None]
         for i, (arg, s_key) in enumerate(zip(self._args, sa_input_names)):
@@ -1,16 +1,11 @@
 from BSL._bifast import _node as _ast_node, _call as _ast_call
 from BSL import _type, _bifcmds
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class LoopParameter(_ast_node.Node):
     @classmethod
     def create(cls, parser_node, s_name, s_type, default, b_iteration_target):
-        type = _type.Type(s_type)
+        type = _type.Type.of(s_type)
 
         if not type.is_array() and b_iteration_target:
             return False, "Non-array type designated as iteration target"
@@ -22,7 +17,7 @@ class LoopParameter(_ast_node.Node):
     def __init__(self, parser_node, s_name, s_type, default, b_iteration_target):
         super().__init__(parser_node)
         self._s_name = s_name
-        self._type = _type.Type(s_type)
+        self._type = _type.Type.of(s_type)
         self._default = default
         self._b_iteration_target = b_iteration_target
 
@@ -52,7 +47,7 @@ class LoopResult(_ast_node.Node):
     def __init__(self, parser_node, s_name, s_type, b_iteration_target, s_state_port):
         super().__init__(parser_node)
         self._s_name = s_name
-        self._type = _type.Type(s_type)
+        self._type = _type.Type.of(s_type)
         self._b_iteration_target = b_iteration_target
         self._s_state_port = s_state_port
 
@@ -89,7 +84,7 @@ class LoopIndex(_ast_node.Node):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type("long")
+        return _type.Type.of("long")
 
     def is_constant(self) -> bool:
         return False
@@ -130,7 +125,7 @@ class _Loop(_ast_node.Node, _ast_call._MixinCall):
         return self._sa_terminal
 
     def value_type(self) -> _type.Type:
-        return _type.Type("__NODE", node_data=self.outputs())
+        return _type.Type.of("__NODE", node_data=self.outputs())
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -145,7 +140,7 @@ class _Loop(_ast_node.Node, _ast_call._MixinCall):
             graph.add_out_port(node/"input", parm.name(), s_type=parm.value_type().s)
             if parm.is_iteration_target():
                 memory.define(parm.name(), s_type=parm.value_type().s, value=node/"input"//parm.name())
-                cmds.vnnCompound(graph._graph, node, setPortMetaDataValue=(parm.name(), "iterationTarget", "true"))
+                graph.set_port_meta_data(node, parm.name(), "iterationTarget", "true")
             else:
                 memory.define(parm.name(), s_type=parm.value_type().s[6:-1], value=node/"input"//parm.name())
 
@@ -159,10 +154,10 @@ class _Loop(_ast_node.Node, _ast_call._MixinCall):
             memory.define_setonly(res.name(), s_type=res.value_type().s, target=node/"output"//res.name())
 
             if res.is_iteration_target() and not isinstance(self, LoopForEach):
-                cmds.vnnCompound(graph._graph, node, setPortMetaDataValue=(res.name(), "iterationTarget", "true"))
+                graph.set_port_meta_data(node, res.name(), "iterationTarget", "true")
 
             elif res.state():
-                cmds.vnnCompound(graph._graph, node, setPortMetaDataValue=(res.name(), "statePort", res.state()))
+                graph.set_port_meta_data(node, res.name(), "statePort", res.state())
 
         if self._max_iterations is not None:
             memory.define("max_iterations", s_type="long", value=node/"input"//"max_iterations")
@@ -172,7 +167,7 @@ class _Loop(_ast_node.Node, _ast_call._MixinCall):
             graph.connect(value_mi, node//"max_iterations")
 
         else:
-            cmds.vnnCompound(graph._graph, node, deletePort="max_iterations")
+            graph.delete_port(node, "max_iterations")
 
         memory.define("#", s_type="long", value=node/"input"//"current_index")
         if self._current_index is not None:
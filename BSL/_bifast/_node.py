@@ -1,7 +1,45 @@
-from BSL import _type
+import functools
+
+from BSL import _type, _error
+
+
+def _subtree(node):
+    """
+    node and every node below it, found through their attributes
+    """
+    nodes = []
+    set_seen = set()
+    todo = [node]
+    while todo:
+        x = todo.pop()
+        if isinstance(x, Node):
+            if id(x) in set_seen:
+                continue
+            set_seen.add(id(x))
+            nodes.append(x)
+            todo.extend(vars(x).values())
+        elif isinstance(x, (list, tuple, set)):
+            todo.extend(x)
+        elif isinstance(x, dict):
+            todo.extend(x.values())
+    return nodes
+
+
+def _with_location(to_vnn):
+    @functools.wraps(to_vnn)
+    def _to_vnn(self, graph):
+        with graph.location(self._parser_node):
+            return to_vnn(self, graph)
+    return _to_vnn
 
 
 class Node:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # connections made while a node builds itself point back at its source, see Graph.location()
+        if "to_vnn" in cls.__dict__:
+            cls.to_vnn = _with_location(cls.__dict__["to_vnn"])
+
     def __init__(self, parser_node):
         self._parser_node = parser_node
         self._vnn_result = None
@@ -12,7 +50,30 @@ class Node:
         raise NotImplementedError(self.__class__.__name__)
 
     def to_json(self):
-        raise NotImplementedError(self.__class__.__name__)
+        """
+        The Bifrost compound file of the graph this node builds, as a dict. Builds it in
+        a graph of its own, nothing gets created in Maya. The nodes keep what they built
+        before, so they can still go into a vnn graph afterwards
+        """
+        if self._json_result:
+            return self._json_result
+
+        from BSL import _bifcmds, _bifjson
+
+        # to_vnn() returns what a node built already, that has to be from this graph
+        results = [(node, node._vnn_result) for node in _subtree(self)]
+        for node, _ in results:
+            node._vnn_result = None
+
+        try:
+            with _bifcmds.Graph(None, "/") as graph:
+                self.to_vnn(graph)
+        finally:
+            for node, result in results:
+                node._vnn_result = result
+
+        self._json_result = _bifjson.to_json(graph.ir())
+        return self._json_result
 
     def to_xml(self):
         raise NotImplementedError(self.__class__.__name__)
@@ -1,10 +1,5 @@
 from BSL._bifast import _node as _ast_node
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class OverloadType(_ast_node.Node):
     def __init__(self, parser_node, s_name, sa_types):
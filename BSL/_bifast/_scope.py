@@ -2,17 +2,12 @@ from BSL import _type, _bifcmds
 from BSL._bifast import _node as _ast_node
 from BSL._bifast import _call as _ast_call
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class ScopeParameter(_ast_node.Node):
     def __init__(self, parser_node, s_name, s_type, default=None):
         super().__init__(parser_node)
         self._s_name = s_name
-        self._type = _type.Type(s_type)
+        self._type = _type.Type.of(s_type)
         self._default = default
 
     def copy(self, d_map):
@@ -34,7 +29,7 @@ class ScopeResult(_ast_node.Node):
     def __init__(self, parser_node, s_name, s_type, s_feedback=None):
         super().__init__(parser_node)
         self._s_name = s_name
-        self._type = _type.Type(s_type)
+        self._type = _type.Type.of(s_type)
         self._s_feedback = s_feedback
 
     def copy(self, d_map):
@@ -74,7 +69,7 @@ class Scope(_ast_node.Node, _ast_call._MixinCall):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type("__NODE", node_data=self.outputs())
+        return _type.Type.of("__NODE", node_data=self.outputs())
 
     def is_constant(self) -> bool:
         # return all([value.is_constant() if value else False for value in self._args])
@@ -115,7 +110,7 @@ class Scope(_ast_node.Node, _ast_call._MixinCall):
             memory.define_setonly(result.name(), s_type=result.value_type().s, target=compound/"output"//result.name())
 
             if result.feedback():
-                cmds.vnnCompound(graph._graph, compound, setPortMetaDataValue=(result.name(), "feedbackPort", result.feedback()))
+                graph.set_port_meta_data(compound, result.name(), "feedbackPort", result.feedback())
 
         graph.push_context2(compound, memory)
 
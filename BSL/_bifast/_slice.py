@@ -1,11 +1,6 @@
 from BSL import _type, _bifcmds
 from BSL._bifast import _node as _ast_node
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class Slice(_ast_node.Node):
     def __init__(self, parser_node, start, stop, step):
@@ -25,7 +20,7 @@ class Slice(_ast_node.Node):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type("array<long>")
+        return _type.Type.of("array<long>")
 
     def to_vnn(self, graph):
         graph = graph  # type: _bifcmds.Graph
@@ -1,11 +1,6 @@
 from BSL import _type, _bifcmds
 from BSL._bifast import _node as _ast_node, _value as  _ast_value
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class Not(_ast_node.Node):
     @classmethod
@@ -121,7 +116,7 @@ class Negate(_ast_node.Node):
             s_suffix = f"{i_dim}{s_suffix}"
             s_prefix += "Math::"
 
-        return True, _type.Type(s_prefix + s_base + s_suffix)
+        return True, _type.Type.of(s_prefix + s_base + s_suffix)
 
     def is_constant(self):
         return self._value.is_constant()
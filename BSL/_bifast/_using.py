@@ -1,11 +1,6 @@
 from BSL import _bifcmds
 from BSL._bifast import _node as _ast_node
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class Using(_ast_node.Node):
     def __init__(self, parser_node, node):
@@ -2,17 +2,12 @@ from BSL import _type, _bifcmds
 from BSL._bifast import _node as _ast_node
 from BSL._bifast import _memory as _static_memory
 
-try:
-    from maya import cmds
-except:
-    pass
-
 
 class Value(_ast_node.Node):
     def __init__(self, parser_node, value, type_value):
         super().__init__(parser_node)
         self._value = value
-        self._type = type_value if isinstance(type_value, _type.Type) else _type.Type(type_value)
+        self._type = type_value if isinstance(type_value, _type.Type) else _type.Type.of(type_value)
 
     def copy(self, d_map):
         if self not in d_map:
@@ -50,7 +45,7 @@ class Variable(_ast_node.Node):
         elif isinstance(s_type, _type.Type):
             self._type = s_type
         else:
-            self._type = _type.Type(s_type)
+            self._type = _type.Type.of(s_type)
 
     def copy(self, d_map):
         if self not in d_map:
@@ -119,7 +114,7 @@ class Vector(_ast_node.Node):
         s_base = f"Math::{type_component}{len(values)}"
         s_suffix = array_dim * ">"
 
-        return True, _type.Type(s_prefix + s_base + s_suffix)
+        return True, _type.Type.of(s_prefix + s_base + s_suffix)
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -227,7 +222,7 @@ class Matrix(_ast_node.Node):
         s_prefix = array_dim * "array<"
         s_base = f"Math::{type_component.s}{i_rows}x{i_cols}"
         s_suffix = array_dim * ">"
-        return True, _type.Type(s_prefix + s_base + s_suffix)
+        return True, _type.Type.of(s_prefix + s_base + s_suffix)
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -365,7 +360,7 @@ class Array(_ast_node.Node):
             s_prefix = ia_dims[0] * "array<" + s_prefix
             s_suffix += ia_dims[0] * ">"
 
-            return True, cls(parser_node, values, _type.Type(s_prefix + s_base + s_suffix))
+            return True, cls(parser_node, values, _type.Type.of(s_prefix + s_base + s_suffix))
 
         if any(ba_numeric):
             return False, "Mixed numeric and non numeric values"
@@ -379,14 +374,14 @@ class Array(_ast_node.Node):
 
     def copy(self, d_map):
         if self not in d_map:
-            d_map[self] = Array(self._parser_node, [v.copy(d_map) for v in self._values], _type.Type(self._type_value.s))
+            d_map[self] = Array(self._parser_node, [v.copy(d_map) for v in self._values], _type.Type.of(self._type_value.s))
         return d_map[self]
 
     def is_constant(self) -> bool:
         return all([v.is_constant() for v in self._values])
 
     def value_type(self) -> _type.Type:
-        return _type.Type("array<" + self._type_value.s + ">")
+        return _type.Type.of("array<" + self._type_value.s + ">")
 
     def to_vnn(self, graph):
         if self._vnn_result:
@@ -421,7 +416,7 @@ class EmptyArray(_ast_node.Node):
     def __init__(self, parser_node, value_count, type_value):
         super().__init__(parser_node)
         self._value_count = value_count
-        self._type_value = type_value if isinstance(type_value, _type.Type) else _type.Type(type_value)
+        self._type_value = type_value if isinstance(type_value, _type.Type) else _type.Type.of(type_value)
 
     def copy(self, d_map):
         if self not in d_map:
@@ -429,7 +424,7 @@ class EmptyArray(_ast_node.Node):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type("array<" + self._type_value.s + ">")
+        return _type.Type.of("array<" + self._type_value.s + ">")
 
     def is_constant(self) -> bool:
         return self._value_count.is_constant()
@@ -459,7 +454,7 @@ class Object(_ast_node.Node):
         return d_map[self]
 
     def value_type(self) -> _type.Type:
-        return _type.Type("Object")
+        return _type.Type.of("Object")
 
     def is_constant(self) -> bool:
         for k, v in self._keys_and_values:
@@ -495,7 +490,7 @@ class Enum(_ast_node.Node):
     def __init__(self, parser_node, s_value, s_type):
         super().__init__(parser_node)
         self._s_value = s_value
-        self._type = _type.Type(s_type)
+        self._type = _type.Type.of(s_type)
 
     def copy(self, d_map):
         if self not in d_map:
@@ -1,10 +1,17 @@
+import contextlib
 import time
 
-from maya import cmds
-
+from BSL import _constants
 from BSL import _error
 from BSL import _file_io
 from BSL import _bifres
+from BSL import _graph_ir
+from BSL._graph_ir import NodeType, BifPath
+
+try:
+    from maya import cmds
+except:
+    cmds = None
 
 
 TYPES = _file_io.get_type_dict()
@@ -12,53 +19,6 @@ ENUMS = _bifres.ENUMS
 NODES = _bifres.NODES
 
 
-class NodeType:
-    kCompound = "BifrostGraph,Core::Graph,compound"  # xml: AminoVnn_Compound
-
-    kAdd = "BifrostGraph,Core::Math,add"
-    kSubtract = "BifrostGraph,Core::Math,subtract"
-    kMultiply = "BifrostGraph,Core::Math,multiply"
-    kDivide = "BifrostGraph,Core::Math,divide"
-    kPower = "BifrostGraph,Core::Math,power"
-
-    kAnd = "BifrostGraph,Core::Logic,and"
-    kOr = "BifrostGraph,Core::Logic,or"
-    kNot = "BifrostGraph,Core::Logic,not"
-    kEqual = "BifrostGraph,Core::Logic,equal"
-    kNotEqual = "BifrostGraph,Core::Logic,not_equal"
-    kGreater = "BifrostGraph,Core::Logic,greater"
-    kGreaterOrEqual = "BifrostGraph,Core::Logic,greater_or_equal"
-    kLess = "BifrostGraph,Core::Logic,less"
-    kLessOrEqual = "BifrostGraph,Core::Logic,less_or_equal"
-
-    kInput = "_input"
-    kOutput = "_output"
-
-    kBuildArray = "BifrostGraph,Core::Array,build_array"
-    kSetInArray = "BifrostGraph,Core::Array,set_in_array"
-    kSetProperty = "BifrostGraph,Core::Object,set_property"
-
-
-class BifPath(str):
-    def __truediv__(self, other):
-        return self.__class__("/" + (self + "/" + str(other)).strip("/"))
-
-    def __floordiv__(self, other):
-        return self.__class__("/" + (self + "." + str(other)).strip("/"))
-
-    @property
-    def name(self):
-        if "." in self:
-            return self.partition(".")[2]
-        return self.rpartition("/")[2]
-
-    @property
-    def parent(self):
-        if "." in self:
-            return self.__class__("/" + self.partition(".")[0].strip("/"))
-        return self.__class__("/" + self.rpartition("/")[0].strip("/"))
-
-
 class Memory:
     def __init__(self):
         self._data = {}
@@ -125,26 +85,173 @@ class Memory:
         return s
 
 
+def _format_location(parser_node):
+    # the parser node a connection was made for, see Graph.location()
+    if getattr(parser_node, "lineno", -1) < 0:
+        return ""
+    return f"\n    at File \"{parser_node.filename}\", line {parser_node.lineno}"
+
+
+def lower_to_vnn(ir, s_graph, backend=None):
+    """
+    Replays a GraphIR as vnn commands into s_graph. Nodes first, then their ports,
+    then values and metadata of those ports and the connections last, so nothing
+    depends on the order things were added in. Returns {IR path: vnn path}
+
+    The commands go to maya.cmds, or to backend if given (see _bifrecord.Recorder)
+    """
+    backend = backend or cmds
+    if backend is None:
+        raise _error.Error("There is no maya.cmds here, lower into a backend like _bifrecord.Recorder() instead")
+
+    d_real = {}
+
+    def _real(path):
+        # a port, a node we created or something inside a node we created
+        s_node, s_dot, s_port = str(path).partition(".")
+        sa_rest = []
+        while s_node not in d_real and s_node not in ("", "/"):
+            s_node, _, s_name = s_node.rpartition("/")
+            s_node = s_node or "/"
+            sa_rest.insert(0, s_name)
+
+        path = BifPath(d_real.get(s_node, s_node))
+        for s_name in sa_rest:
+            path = path/s_name
+        return BifPath(path + s_dot + s_port)
+
+    nodes = ir.nodes()
+
+    backend.vnnChangeBracket(s_graph, open=True)
+    try:
+        for node in nodes:
+            if node.b_implicit:
+                d_real[node.path] = node.path if node.parent is None else d_real[node.parent.path]/node.name
+                continue
+
+            context = _real(node.parent.path)
+            if node.is_io():
+                s_name = backend.vnnCompound(s_graph, context, addIONode=node.s_type == NodeType.kInput)[0]
+            else:
+                s_name = backend.vnnCompound(s_graph, context, addNode=node.s_type)[0]
+            real = d_real[node.path] = context/s_name
+
+            if node.s_display is not None:
+                data = f"{{show=1;format=\"{node.s_display}\"}}"
+                backend.vnnNode(s_graph, real, setMetaDataFromString=f"NodeValueDisplay={data};")
+
+            for key, value in node.d_meta.items():
+                backend.vnnNode(s_graph, real, setMetaData=(key, value))
+
+        for node in nodes:
+            for port in node.d_ports.values():
+                if port.b_input:
+                    backend.vnnNode(s_graph, d_real[node.path], createInputPort=(port.s_name, port.s_type))
+                else:
+                    backend.vnnNode(s_graph, d_real[node.path], createOutputPort=(port.s_name, port.s_type))
+
+            for s_port, s_type in node.d_port_types.items():
+                backend.vnnNode(s_graph, d_real[node.path], setPortDataType=(s_port, s_type))
+
+        for node in nodes:
+            real = d_real[node.path]
+            for s_port, d_meta in node.d_port_meta.items():
+                for key, value in d_meta.items():
+                    backend.vnnCompound(s_graph, real, setPortMetaDataValue=(s_port, key, value))
+
+            for s_port in node.sa_deleted_ports:
+                backend.vnnCompound(s_graph, real, deletePort=s_port)
+
+            for s_port, i_flags in node.d_port_flags.items():
+                backend.vnnPort(s_graph, real//s_port, 0, 1, clear=i_flags)
+
+            for s_port, value in node.d_values.items():
+                backend.vnnNode(s_graph, real, setPortDefaultValues=(s_port, value))
+
+        # with DIRECT_CONNECT fan-outs (one source after another, see Graph.connect_many()) share
+        # one set/clear of the flag and sources of a known type dont need it at all
+        connections = ir.connections()
+        locations = ir.locations()
+        i = 0
+        while i < len(connections):
+            src = connections[i][0]
+            i_end = i + 1
+            while _constants.DIRECT_CONNECT and i_end < len(connections) and connections[i_end][0] == src:
+                i_end += 1
+
+            b_flag = not _constants.DIRECT_CONNECT or ir.known_type(src) == "auto"
+            real_src = _real(src)
+            if b_flag:
+                try:
+                    backend.vnnPort(s_graph, real_src, 1, 1, set=16)
+                except Exception:
+                    raise _error.BfRuntimeError(f"Cannot set port flag 16 on '{real_src}'{_format_location(locations[i])}")
+
+            for i_conn in range(i, i_end):
+                tgt = _real(connections[i_conn][1])
+                try:
+                    backend.vnnConnect(s_graph, real_src, tgt)
+                except Exception:
+                    raise _error.BfRuntimeError(f"Cannot connect '{real_src}' -> '{tgt}'{_format_location(locations[i_conn])}")
+
+            if b_flag:
+                try:
+                    backend.vnnPort(s_graph, real_src, 1, 1, clear=16)
+                except Exception:
+                    raise _error.BfRuntimeError(f"Cannot clear port flag 16 on '{real_src}'{_format_location(locations[i_end - 1])}")
+            i = i_end
+
+    finally:
+        backend.vnnChangeBracket(s_graph, close=True)
+
+    d_terminals = {_real(node): flags for node, flags in ir.terminals().items()}
+    for s_node in sorted(d_terminals):
+        for flag in "DPF":
+            backend.vnnNode(s_graph, s_node, setStateFlag=(flag, False))
+
+        for flag in d_terminals[s_node]:
+            try:
+                backend.vnnNode(s_graph, s_node, setStateFlag=(flag, True))
+            except:
+                print("meeeep")
+
+    return d_real
+
+
 class Graph:
-    def __init__(self, graph, parent):
+    """
+    Builds a GraphIR out of the _bifast nodes. If graph is the name of a Bifrost graph,
+    leaving the with block lowers it into that graph. Without one it only builds the
+    IR, see ir(), which doesnt need Maya. backend takes the vnn commands instead of
+    maya.cmds, see _bifrecord
+    """
+    def __init__(self, graph, parent, backend=None):
         self._graph = graph
+        self._backend = backend
+        self._ir = _graph_ir.GraphIR(parent)
         self._contexts = [BifPath(parent)]
         self._memory_scope = [Memory()]
-        self._d_terminals = {}
+        self._locations = [None]
 
     def __enter__(self):
         self._time_start = time.time()
-        cmds.vnnChangeBracket(self._graph, open=True)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        cmds.vnnChangeBracket(self._graph, close=True)
+        # a half built graph stays out of Bifrost
+        if exc_type is not None:
+            return
 
-        for s_node in sorted(self._d_terminals):
-            self._set_terminal(s_node, self._d_terminals[s_node])
+        # without a graph this only built the IR, like Node.to_json() does
+        if not self._graph:
+            return
 
+        lower_to_vnn(self._ir, self._graph, self._backend)
         print(f"Graph took: {time.time()-self._time_start:.02f} seconds")
 
+    def ir(self):
+        return self._ir
+
     @classmethod
     def resolve_node_type(cls, s_type):
         if "," not in s_type:
@@ -197,12 +304,12 @@ class Graph:
 
         # create IO node
         if s_type in [NodeType.kInput, NodeType.kOutput]:
-            node = context/cmds.vnnCompound(self._graph, context, addIONode=s_type == NodeType.kInput)[0]
+            node = self._ir.add_node(s_type, context)
 
         # create node of specific type
         else:
             s_type = self.resolve_node_type(s_type)
-            node = context/cmds.vnnCompound(self._graph, context, addNode=s_type)[0]
+            node = self._ir.add_node(s_type, context)
 
         # if a name is given, decide whether to rename the node or set the node display value
         if s_name and s_name != node.name:
@@ -216,6 +323,7 @@ class Graph:
     def create_value_node(self, s_type, s_name=None, context=None):
         node = self.create_node(f"BifrostGraph,Core::Constants,float", s_name=s_name, context=context)
         self.set_meta_data(node, "valuenode_type", s_type)
+        self.set_known_type(node//"output", s_type)
         return node
 
     def create_compound_node(self, s_name=None, inputs=None, outputs=None, context=None, _type=NodeType.kCompound):
@@ -473,29 +581,43 @@ class Graph:
         }[s_type]
         return self.create_compound_node(s_name, inputs=inputs, outputs=outputs, context=context, _type=s_type)
 
-    def connect(self, src, tgt):
+    def connect(self, src, tgt, s_type=None):
+        """
+        s_type is the type src is known to have, if it is then lowering connects it with a
+        single command. Connecting only fails once it gets lowered, see lower_to_vnn()
+        """
+        if s_type is not None:
+            self._ir.set_known_type(src, s_type)
+        self._ir.connect(src, tgt, self._locations[-1])
+
+    def connect_many(self, src, targets, s_type=None):
+        """
+        Connects src to all targets, they get lowered together
+        """
+        for tgt in targets:
+            self.connect(src, tgt, s_type)
+
+    @contextlib.contextmanager
+    def location(self, parser_node):
+        """
+        Connections made inside the with block come from parser_node, lowering names it
+        when one of them fails
+        """
+        self._locations.append(parser_node)
         try:
-            cmds.vnnPort(self._graph, src, 1, 1, set=16)
-            cmds.vnnConnect(self._graph, src, tgt)
-            cmds.vnnPort(self._graph, src, 1, 1, clear=16)
+            yield
+        finally:
+            self._locations.pop()
 
-        except Exception as e:
-            raise _error.BfRuntimeError(f"Cannot connect '{src}' -> '{tgt}'")
-            # print(src, "->", tgt)
-            # print(f"   source: {self.get_type(src)}")
-            # print(f"   target: {self.get_type(tgt)}")
+    def set_known_type(self, port, s_type):
+        self._ir.set_known_type(port, s_type)
 
     def rename(self, node, s_name, b_auto_rename=True):
         if node.name == s_name:
             return node
 
         if "." in node:
-            sa_ports = cmds.vnnCompound(self._graph, node.parent, listPorts=True)
-            if s_name in sa_ports:
-                raise Exception("Port exists! Auto rename only works for nodes")
-
-            cmds.vnnCompound(self._graph, node.parent, renamePort=(node.name, s_name))
-            return node.parent // s_name
+            return self._ir.rename_port(node, s_name)
 
         self.set_node_value_display(node, s_name)
         return node
@@ -515,12 +637,11 @@ class Graph:
         # return node.parent / s_name
 
     def set_node_value_display(self, node, s_expr):
-        data = f"{{show=1;format=\"{s_expr}\"}}"
-        cmds.vnnNode(self._graph, node, setMetaDataFromString=f"NodeValueDisplay={data};")
+        self._ir.set_display(node, s_expr)
 
     def add_in_port(self, node, s_name, s_type="auto", value=None):
         s_type = self.resolve_port_type(s_type)
-        cmds.vnnNode(self._graph, node, createInputPort=(s_name, s_type))
+        self._ir.add_port(node, s_name, s_type, b_input=True)
         if value:
             self.set_value(node, s_name, value=value)
 
@@ -528,7 +649,7 @@ class Graph:
 
     def add_out_port(self, node, s_name, s_type="auto"):
         s_type = self.resolve_port_type(s_type)
-        cmds.vnnNode(self._graph, node, createOutputPort=(s_name, s_type))
+        self._ir.add_port(node, s_name, s_type, b_input=False)
         return node//s_name
 
     def set_value(self, node, s_port=None, value=None):
@@ -544,7 +665,7 @@ class Graph:
             s_port = node.name
             node = node.parent
 
-        cmds.vnnNode(self._graph, node, setPortDefaultValues=(s_port, value))
+        self._ir.set_value(node, s_port, value)
 
     def set_type(self, node, s_port=None, s_type=None):
         if s_type is None:
@@ -557,42 +678,44 @@ class Graph:
             node = node.parent
 
         s_type = self.resolve_port_type(s_type)
-        cmds.vnnNode(self._graph, node, setPortDataType=(s_port, s_type))
+        self._ir.set_port_type(node, s_port, s_type)
 
     def get_type(self, node, s_port=None, b_accept_auto=True):
+        """
+        The type the graph knows for the port. Nothing is in Bifrost yet at this
+        point, so ports Bifrost would resolve later are still "auto". Those raise
+        with b_accept_auto=False
+        """
         if s_port is None:
             if "." not in node:
                 raise Exception("No port given!")
             s_port = node.name
             node = node.parent
 
-        s_type = cmds.vnnNode(self._graph, node, queryPortDataType=s_port)
+        s_type = self._ir.port_type(node, s_port)
         if s_type == "auto" and not b_accept_auto:
-            cmds.vnnChangeBracket(self._graph, close=True)
-            s_type = cmds.vnnNode(self._graph, node, queryPortDataType=s_port)
-            cmds.vnnChangeBracket(self._graph, open=True)
-
+            raise _error.Error(f"The type of '{node}.{s_port}' is only known once Bifrost resolved the graph")
         return s_type
 
-    def _set_terminal(self, node, flags):
-        # cmds.vnnChangeBracket(self._graph, close=True)
-        for flag in "DPF":
-            cmds.vnnNode(self._graph, node, setStateFlag=(flag, False))
-
-        for flag in flags:
-            try:
-                cmds.vnnNode(self._graph, node, setStateFlag=(flag, True))
-            except:
-                print("meeeep")
-        # cmds.vnnChangeBracket(self._graph, open=True)
-
     def set_terminal(self, node, flags):
         if None in flags:
             return
-        self._d_terminals[node] = flags
+        self._ir.set_terminal(node, flags)
 
     def set_meta_data(self, node, key, value):
-        cmds.vnnNode(self._graph, node, setMetaData=(key, value))
+        self._ir.set_meta_data(node, key, value)
+
+    def set_port_meta_data(self, node, s_port, key, value):
+        """
+        Metadata of a compound port, like "iterationTarget" or "feedbackPort"
+        """
+        self._ir.set_port_meta_data(node, s_port, key, value)
+
+    def clear_port_flags(self, port, i_flags):
+        self._ir.clear_port_flags(port, i_flags)
+
+    def delete_port(self, node, s_port):
+        self._ir.delete_port(node, s_port)
 
     def create_const_enum_value(self, value, s_type, context=None):
         s_type = self.resolve_port_type(s_type)
@@ -600,8 +723,7 @@ class Graph:
         if isinstance(value, str):
             value = ENUMS[s_type]["values"][value]
 
-        node = self.create_value_node("float", context=context)
-        self.set_meta_data(node, "valuenode_type", s_type)
+        node = self.create_value_node(s_type, context=context)
         self.set_value(node, "value", value)
 
         return node//"output"
@@ -668,6 +790,7 @@ class Graph:
             raise Exception("Use create_matrix_value() for vectors and matrices!")
 
         node = self.create_node(f"BifrostGraph,Core::Constants,{s_type}", context=context)
+        self.set_known_type(node//"output", s_type)
         if value is not None:
             self.set_value(node, "value", value)
 
@@ -701,7 +824,7 @@ class Graph:
             self.connect(build_array // "array", node / "output" // "output")
 
             for i, value in enumerate(values):
-                cmds.vnnNode(self._graph, build_array, createInputPort=(f"value{i}", s_sub_type))
+                self._ir.add_port(build_array, f"value{i}", s_sub_type, b_input=True)
 
                 if hasattr(value, "to_vnn"):
                     value = value.to_vnn(self)
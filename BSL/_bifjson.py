@@ -0,0 +1,285 @@
+"""
+Writes a GraphIR (see _graph_ir) as a Bifrost compound .json file, so a graph can be
+built without Maya and just loaded into Bifrost afterwards:
+    with _bifcmds.Graph(None, "/") as graph:
+        for x in Ast.run(s_source):
+            x.to_vnn(graph)
+    _bifjson.write(graph.ir(), "my_lib.json", "User::my_lib")
+
+The IR root becomes the compound s_name, every compound inside it becomes its own entry
+in "compounds" (named after its parent, "User::my_lib::compound1") that its node refers
+to. Paths in connections and values are relative to the compound they are in, ".port"
+being a port of that compound itself.
+
+Things vnn does that have no place in a compound file are left out: the fan-in flags
+get implied by fanInPortNames, deleted ports are just not written. The types of values
+come from the graph or else from nodes.json. Everything else raises instead of writing
+a file Bifrost would read differently: iterators, values of unknown type and types set
+on ports of operators that have no value to carry them. That leaves out loops, array
+literals and slices for now.
+
+The layout was never compared to a file Bifrost saved, check() does that. Save a compound
+with the same kinds of nodes from Bifrost and run:
+    _bifjson.check(_bifjson.to_json(graph.ir()), "saved_by_bifrost.json")
+"""
+import json
+import pathlib
+
+from BSL import _error, _bifres
+from BSL._graph_ir import NodeType, BifPath
+
+FILE_FORMAT_VERSION = "100L"
+
+_D_TERMINALS = {"D": "diagnostic", "P": "proxy", "F": "final"}
+
+
+def _node_type(s_type):
+    # "BifrostGraph,Core::Math,add" -> "Core::Math::add"
+    _, s_namespace, s_name = s_type.split(",")
+    return f"{s_namespace}::{s_name}"
+
+
+def _is_value_node(node):
+    return "valuenode_type" in node.d_meta
+
+
+def _is_io(node):
+    # the input/output of the root are not in the IR unless something used them
+    return node.is_io() or (node.s_type is None and node.name in ("input", "output"))
+
+
+def _meta(key, value):
+    return {"metaName": key, "metaType": "string", "metaValue": str(value)}
+
+
+def _value(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class _Writer:
+    def __init__(self, ir, s_name, path_nodes=None):
+        self._ir = ir
+        self._s_name = s_name
+        self._path_nodes = path_nodes
+        self._nodes = None
+        self._da_compounds = []
+
+        # connections by the compound they are in
+        self._d_connections = {}
+        for src, tgt in ir.connections():
+            compound_src, s_src = self._endpoint(src)
+            compound_tgt, s_tgt = self._endpoint(tgt)
+            if compound_src is not compound_tgt:
+                raise _error.Error(f"Cant write a connection across compounds: '{src}' -> '{tgt}'")
+            self._d_connections.setdefault(compound_src.path, []).append({"source": s_src, "target": s_tgt})
+
+        self._d_terminals = ir.terminals()
+
+    def _endpoint(self, path):
+        """
+        The compound a port path is in and the path relative to it
+        """
+        path = BifPath(path)
+        node_path = path.parent
+        node = self._ir.node(node_path)
+        compound = self._ir.node(node_path.parent)
+        if compound is None or node_path == node_path.parent:
+            raise _error.Error(f"Cant write a connection to '{path}', the graph doesnt know that node")
+
+        # the input/output of the root and of iterators are only in the IR if ports got added to them
+        if _is_io(node) if node is not None else node_path.name in ("input", "output"):
+            return compound, f".{path.name}"
+        return compound, f"{node_path.name}.{path.name}"
+
+    def _ports(self, compound):
+        da_ports = []
+        for child in compound.d_children.values():
+            if not _is_io(child):
+                continue
+
+            # ports of the input node are inputs of the compound and the other way around
+            for port in child.d_ports.values():
+                s_type = child.d_port_types.get(port.s_name, port.s_type)
+                d_port = {"portName": port.s_name, "portDirection": "output" if port.b_input else "input", "portType": s_type}
+                d_meta = compound.d_port_meta.get(port.s_name)
+                if d_meta:
+                    d_port["metadata"] = [_meta(key, value) for key, value in d_meta.items()]
+                da_ports.append(d_port)
+        return da_ports
+
+    def _operator_port_type(self, node, s_port):
+        """
+        The type nodes.json has for a port of an operator, "auto" if it depends on the overload
+        """
+        if self._nodes is None:
+            self._nodes = _bifres.load_nodes(self._path_nodes)
+
+        s_func = _node_type(node.s_type)
+        if s_func not in self._nodes:
+            return "auto"
+
+        d_data = self._nodes[s_func]
+        sa_types_in = list(d_data["overloads"])[0].split("-")
+        if s_port in d_data["inputs"]:
+            return sa_types_in[d_data["inputs"].index(s_port)]
+        return "auto"
+
+    def _value_type(self, node, s_port):
+        s_type = self._ir.known_type(node.path//s_port)
+        if s_type == "auto" and node.s_type and node.s_type.startswith("BifrostGraph,Core::Constants,"):
+            s_type = node.d_meta.get("valuenode_type", node.s_type.rpartition(",")[2])
+        if s_type == "auto" and node.s_type and not _is_io(node):
+            s_type = self._operator_port_type(node, s_port)
+        if s_type == "auto":
+            raise _error.Error(f"Cant write the value of '{node.path}.{s_port}', its type is not known before Bifrost resolves it")
+        return s_type
+
+    def _node(self, node, s_parent_name):
+        d_node = {"nodeName": node.name}
+
+        if node.is_compound():
+            d_node["nodeType"] = self._compound(node, f"{s_parent_name}::{node.name}")
+
+        elif _is_value_node(node):
+            d_node["valueType"] = node.d_meta["valuenode_type"]
+
+        else:
+            d_node["nodeType"] = _node_type(node.s_type)
+
+            # a compound file only has types for values, Bifrost would resolve the others on its own
+            sa_typed = [s_port for s_port, s_type in node.d_port_types.items() if s_type != "auto"]
+            sa_typed += [port.s_name for port in node.d_ports.values() if port.s_type != "auto"]
+            for s_port in sa_typed:
+                if s_port not in node.d_values:
+                    raise _error.Error(f"Cant write the type of '{node.path}.{s_port}', only ports with a value keep their type in a compound file")
+
+            # ports added to an operator are fan-in ports, "strings.string0" or just "value1"
+            sa_multi = []
+            d_fan_in = {}
+            for port in node.d_ports.values():
+                if "." in port.s_name:
+                    s_parent, _, s_child = port.s_name.partition(".")
+                    d_fan_in.setdefault(s_parent, []).append(s_child)
+                else:
+                    sa_multi.append(port.s_name)
+            if sa_multi:
+                d_node["multiInputPortNames"] = sa_multi
+            if d_fan_in:
+                d_node["fanInPortNames"] = d_fan_in
+
+        da_meta = [_meta(key, value) for key, value in node.d_meta.items() if key != "valuenode_type"]
+        if node.s_display is not None:
+            da_meta.append({"metaName": "NodeValueDisplay", "metadata": [_meta("show", 1), _meta("format", node.s_display)]})
+        if da_meta:
+            d_node["metadata"] = da_meta
+
+        flags = self._d_terminals.get(node.path)
+        if flags:
+            d_node["terminalStates"] = [{"name": s_state, "enabled": s_flag in flags} for s_flag, s_state in _D_TERMINALS.items()]
+
+        return d_node
+
+    def _values(self, node, s_prefix):
+        da_values = []
+        for s_port, value in node.d_values.items():
+            da_values.append({"valueName": f"{s_prefix}{s_port}", "valueType": self._value_type(node, s_port), "value": _value(value)})
+        return da_values
+
+    def _compound(self, compound, s_name):
+        """
+        Adds the definition of a compound and returns the name its node refers to it by
+        """
+        # nothing in a compound file we know of says how an iterator iterates
+        if compound.s_type and compound.s_type != NodeType.kCompound:
+            raise _error.Error(f"Cant write '{compound.path}', iterators ({_node_type(compound.s_type)}) are not supported in compound files")
+
+        da_nodes = []
+        da_values = []
+        sa_reserved = []
+        for child in compound.d_children.values():
+            if _is_io(child):
+                sa_reserved.append(child.name)
+                # values set on the ports of the inner input/output end up on the compound
+                da_values += self._values(child, ".")
+                continue
+
+            da_nodes.append(self._node(child, s_name))
+            da_values += self._values(child, f"{child.name}.")
+
+        d_compound = {
+            "name": s_name,
+            "metadata": [],
+            "ports": self._ports(compound),
+            "compoundNodes": da_nodes,
+            "connections": self._d_connections.get(compound.path, []),
+            "values": da_values,
+            "reservedNodeNames": [{"name": s} for s in sa_reserved],
+        }
+        self._da_compounds.append(d_compound)
+        return s_name
+
+    def write(self):
+        self._compound(self._ir.nodes()[0], self._s_name)
+
+        # the root comes last since it gets added last, Bifrost wants it first
+        return {
+            "header": {"metadata": [{"metaName": "adskFileFormatVersion", "metaValue": FILE_FORMAT_VERSION}]},
+            "namespaces": [],
+            "types": [],
+            "compounds": self._da_compounds[::-1],
+        }
+
+
+def to_json(ir, s_name="User::BSL::graph", path_nodes=None):
+    """
+    The compound file for a GraphIR as a dict, the root of the IR being the compound s_name.
+    path_nodes is the nodes.json the types of operator ports get looked up in
+    """
+    return _Writer(ir, s_name, path_nodes).write()
+
+
+def write(ir, path, s_name="User::BSL::graph", path_nodes=None):
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_json(ir, s_name, path_nodes), indent=4))
+    return path
+
+
+def _layout(x, s_place, set_keys):
+    """
+    (place, key) of everything in a compound file, the place being the key of the list a
+    dict is in ("compounds", "compoundNodes", ...)
+    """
+    if isinstance(x, dict):
+        for key, value in x.items():
+            set_keys.add((s_place, key))
+            _layout(value, key, set_keys)
+    elif isinstance(x, list):
+        for value in x:
+            _layout(value, s_place, set_keys)
+    return set_keys
+
+
+def check(d_file, path_reference):
+    """
+    Raises if d_file has keys that the compound file at path_reference, one that Bifrost
+    saved, doesnt have in the same place or if its format version differs. Only as good
+    as the reference, it should have the same kinds of nodes as d_file
+    """
+    d_reference = json.loads(pathlib.Path(path_reference).read_text())
+
+    sa_errors = []
+    set_missing = _layout(d_file, "file", set()) - _layout(d_reference, "file", set())
+    for s_place, key in sorted(set_missing):
+        sa_errors.append(f"'{key}' in '{s_place}'")
+
+    def _version(d):
+        return {d_meta.get("metaName"): d_meta.get("metaValue") for d_meta in d.get("header", {}).get("metadata", [])}.get("adskFileFormatVersion")
+
+    if _version(d_file) != _version(d_reference):
+        sa_errors.append(f"file format version {_version(d_file)} instead of {_version(d_reference)}")
+
+    if sa_errors:
+        raise _error.Error(f"Not in the layout of '{path_reference}': " + ", ".join(sa_errors))
@@ -0,0 +1,371 @@
+"""
+A stand-in for maya.cmds, so everything after parsing runs without Maya. Pass a
+Recorder as the backend of a Graph and the vnn commands it fires end up in there:
+    recorder = _bifrecord.Recorder()
+    with _bifcmds.Graph("bifrostGraphShape1", "/", backend=recorder) as graph:
+        for x in Ast.run(s_source):
+            x.to_vnn(graph)
+    recorder.save("graph.vnn.json")
+
+Later, in mayapy, the recording can be pushed into a real graph:
+    _bifrecord.replay(_bifrecord.load("graph.vnn.json"), "bifrostGraphShape1")
+
+The Recorder keeps track of the nodes, ports, values and connections like Bifrost
+would, names included, so it can be compared between changes. Queries (queryPortDataType,
+listPorts, ...) are answered from that state and from the collected nodes.json, they
+dont get recorded.
+"""
+import json
+import pathlib
+
+from BSL import _bifres, _constants
+from BSL._graph_ir import NodeType, BifPath
+
+
+def _is_iterator(s_type):
+    return s_type.startswith("BifrostGraph,Core::Iterators,")
+
+
+def _node_name(s_type):
+    # "BifrostGraph,Core::Math,add" -> "Core::Math::add"
+    _, s_namespace, s_name = s_type.split(",")
+    return f"{s_namespace}::{s_name}"
+
+
+class _VnnNode:
+    __slots__ = ("s_type", "sa_children", "d_inputs", "d_outputs", "d_port_types", "d_meta", "d_values",
+                 "d_port_meta", "d_port_flags", "d_state")
+
+    def __init__(self, s_type):
+        self.s_type = s_type
+        self.sa_children = []
+        self.d_inputs = {}
+        self.d_outputs = {}
+        self.d_port_types = {}
+        self.d_meta = {}
+        self.d_values = {}
+        self.d_port_meta = {}
+        self.d_port_flags = {}
+        self.d_state = {}
+
+
+class Recorder:
+    """
+    Records the vnn commands of a graph build and models what they do. calls is a list
+    of (s_command, args, kwargs, result), in the order they were fired
+    """
+    def __init__(self, path_nodes=None):
+        self.calls = []
+        self.i_queries = 0
+        self._path_nodes = path_nodes
+        self._nodes = None
+        self._d_nodes = {"/": _VnnNode(None)}
+        self._connections = []
+
+    def _record(self, s_command, args, kwargs, result=None):
+        self.calls.append((s_command, args, kwargs, result))
+        return result
+
+    def _node(self, path):
+        s_path = str(path).partition(".")[0] or "/"
+        node = self._d_nodes.get(s_path)
+        if node is None:
+            raise RuntimeError(f"No object matches name: {path}")
+        return node
+
+    def _exists(self, path):
+        # something inside a node type we didnt create exists once its parent does
+        s_path = str(path).partition(".")[0] or "/"
+        return s_path in self._d_nodes or BifPath(s_path).parent in self._d_nodes
+
+    def _add(self, context, s_base, s_type):
+        parent = self._node(context)
+        s_name = s_base
+        i = 1
+        while s_name in parent.sa_children:
+            s_name = f"{s_base}{i}"
+            i += 1
+
+        parent.sa_children.append(s_name)
+        self._d_nodes[BifPath(context)/s_name] = _VnnNode(s_type)
+        return s_name
+
+    def _node_data(self, s_type):
+        """
+        The nodes.json entry of a node type, None if there is none or nothing was collected
+        """
+        if self._nodes is None:
+            path_nodes = pathlib.Path(self._path_nodes or _constants.PATH_BIFROST_NODES)
+            self._nodes = _bifres.load_nodes(path_nodes) if path_nodes.exists() else {}
+
+        if s_type is None or s_type.count(",") != 2:
+            return None
+        s_name = _node_name(s_type)
+        return self._nodes[s_name] if s_name in self._nodes else None
+
+    def _io_children(self, path):
+        node = self._node(path)
+        for s_name in node.sa_children:
+            child = self._d_nodes[BifPath(path)/s_name]
+            if child.s_type in (NodeType.kInput, NodeType.kOutput):
+                yield child
+
+    # cmds
+
+    def vnnChangeBracket(self, s_graph, **kwargs):
+        return self._record("vnnChangeBracket", (s_graph,), kwargs)
+
+    def vnnCompound(self, s_graph, context, **kwargs):
+        if "listNodes" in kwargs:
+            self.i_queries += 1
+            return list(self._node(context).sa_children)
+
+        if "addNode" in kwargs:
+            s_type = kwargs["addNode"]
+            s_name = self._add(context, s_type.rpartition(",")[2], s_type)
+            if _is_iterator(s_type):
+                self._add(BifPath(context)/s_name, "input", NodeType.kInput)
+                self._add(BifPath(context)/s_name, "output", NodeType.kOutput)
+            return self._record("vnnCompound", (s_graph, context), kwargs, [s_name])
+
+        if "addIONode" in kwargs:
+            s_type = NodeType.kInput if kwargs["addIONode"] else NodeType.kOutput
+            s_name = self._add(context, s_type.strip("_"), s_type)
+            return self._record("vnnCompound", (s_graph, context), kwargs, [s_name])
+
+        node = self._node(context)
+        if "setPortMetaDataValue" in kwargs:
+            s_port, key, value = kwargs["setPortMetaDataValue"]
+            node.d_port_meta.setdefault(s_port, {})[key] = value
+
+        elif "deletePort" in kwargs:
+            s_port = kwargs["deletePort"]
+            for child in self._io_children(context):
+                child.d_inputs.pop(s_port, None)
+                child.d_outputs.pop(s_port, None)
+
+        elif "removeNode" in kwargs:
+            s_name = kwargs["removeNode"]
+            node.sa_children.remove(s_name)
+            s_path = BifPath(context)/s_name
+            for s in [s for s in self._d_nodes if s == s_path or s.startswith(s_path + "/")]:
+                del self._d_nodes[s]
+            self._connections = [(src, tgt) for src, tgt in self._connections
+                                 if src.partition(".")[0] != s_path and tgt.partition(".")[0] != s_path]
+
+        else:
+            raise RuntimeError(f"vnnCompound: the Recorder doesnt know {sorted(kwargs)}")
+
+        return self._record("vnnCompound", (s_graph, context), kwargs)
+
+    def vnnNode(self, s_graph, path, **kwargs):
+        node = self._node(path)
+
+        if "queryPortDataType" in kwargs:
+            self.i_queries += 1
+            return self._port_type(path, node, kwargs["queryPortDataType"])
+
+        if "listPorts" in kwargs:
+            self.i_queries += 1
+            return self._list_ports(path, node, kwargs.get("inputPort", False), kwargs.get("outputPort", False))
+
+        if "createInputPort" in kwargs:
+            s_port, s_type = kwargs["createInputPort"]
+            node.d_inputs[s_port] = s_type
+
+        elif "createOutputPort" in kwargs:
+            s_port, s_type = kwargs["createOutputPort"]
+            node.d_outputs[s_port] = s_type
+
+        elif "setPortDataType" in kwargs:
+            s_port, s_type = kwargs["setPortDataType"]
+            node.d_port_types[s_port] = s_type
+
+        elif "setMetaData" in kwargs:
+            key, value = kwargs["setMetaData"]
+            node.d_meta[key] = value
+
+        elif "setMetaDataFromString" in kwargs:
+            key, _, value = kwargs["setMetaDataFromString"].partition("=")
+            node.d_meta[key] = value.rstrip(";")
+
+        elif "setPortDefaultValues" in kwargs:
+            s_port, value = kwargs["setPortDefaultValues"]
+            node.d_values[s_port] = value
+
+        elif "setStateFlag" in kwargs:
+            flag, b_state = kwargs["setStateFlag"]
+            node.d_state[flag] = b_state
+
+        else:
+            raise RuntimeError(f"vnnNode: the Recorder doesnt know {sorted(kwargs)}")
+
+        return self._record("vnnNode", (s_graph, path), kwargs)
+
+    def vnnPort(self, s_graph, port, i_a, i_b, **kwargs):
+        node = self._node(port)
+        s_port = BifPath(port).name
+
+        if "qf" in kwargs:
+            self.i_queries += 1
+            return node.d_port_flags.get(s_port, 0)
+
+        if "set" in kwargs:
+            node.d_port_flags[s_port] = node.d_port_flags.get(s_port, 0) | kwargs["set"]
+        elif "clear" in kwargs:
+            node.d_port_flags[s_port] = node.d_port_flags.get(s_port, 0) & ~kwargs["clear"]
+        else:
+            raise RuntimeError(f"vnnPort: the Recorder doesnt know {sorted(kwargs)}")
+
+        return self._record("vnnPort", (s_graph, port, i_a, i_b), kwargs)
+
+    def vnnConnect(self, s_graph, src, tgt):
+        for path in (src, tgt):
+            if not self._exists(path) or not self._has_port(path):
+                raise RuntimeError(f"No object matches name: {path}")
+
+        self._connections.append((str(src), str(tgt)))
+        return self._record("vnnConnect", (s_graph, src, tgt), {})
+
+    # queries
+
+    def _has_port(self, path):
+        """
+        Whether there is a port at path as far as the Recorder can tell. Ports inside nodes
+        we didnt create, of node types nodes.json doesnt have and the ones iterators come
+        with (current_index, ...) are taken on faith
+        """
+        s_node, _, s_port = str(path).partition(".")
+        node = self._d_nodes.get(s_node or "/")
+        if node is None:
+            return True
+        if node.s_type in (NodeType.kInput, NodeType.kOutput):
+            parent = self._d_nodes.get(BifPath(s_node).parent)
+            if parent is not None and parent.s_type and _is_iterator(parent.s_type):
+                return True
+        elif node.s_type not in (None, NodeType.kCompound) and self._node_data(node.s_type) is None:
+            return True
+
+        # "output.x" is a member of the port "output"
+        for s in (s_port, s_port.partition(".")[0]):
+            try:
+                self._port_type(s_node or "/", node, s)
+                return True
+            except RuntimeError:
+                pass
+        return False
+
+    def _port_type(self, path, node, s_port):
+        if s_port in node.d_port_types:
+            return node.d_port_types[s_port]
+
+        # compound ports live on their input/output nodes
+        for owner in [node] + list(self._io_children(path)):
+            if s_port in owner.d_inputs:
+                return owner.d_inputs[s_port]
+            if s_port in owner.d_outputs:
+                return owner.d_outputs[s_port]
+
+        d_data = self._node_data(node.s_type)
+        if d_data is not None:
+            sa_input_types, sa_output_types = d_data["default_overload"]
+            if s_port in d_data["inputs"]:
+                return sa_input_types[d_data["inputs"].index(s_port)]
+            if s_port in d_data["outputs"]:
+                return sa_output_types[d_data["outputs"].index(s_port)]
+
+        raise RuntimeError(f"No port '{s_port}' on '{path}'")
+
+    def _list_ports(self, path, node, b_inputs, b_outputs):
+        if not b_inputs and not b_outputs:
+            b_inputs = b_outputs = True
+
+        sa_ports = []
+        d_data = self._node_data(node.s_type)
+        if b_inputs:
+            sa_ports += (d_data["inputs"] if d_data else []) + list(node.d_inputs)
+        if b_outputs:
+            sa_ports += (d_data["outputs"] if d_data else []) + list(node.d_outputs)
+
+        # the inputs of a compound are the outputs of its input node
+        for child in self._io_children(path) if node.s_type != NodeType.kInput else []:
+            if b_inputs:
+                sa_ports += list(child.d_outputs)
+            if b_outputs:
+                sa_ports += list(child.d_inputs)
+        return sa_ports
+
+    # results
+
+    def connections(self):
+        return list(self._connections)
+
+    def stats(self):
+        """
+        Number of recorded commands by command, plus "total" and "queries"
+        """
+        d_counts = {}
+        for s_command, _, _, _ in self.calls:
+            d_counts[s_command] = d_counts.get(s_command, 0) + 1
+        d_counts["total"] = len(self.calls)
+        d_counts["queries"] = self.i_queries
+        return d_counts
+
+    def state(self):
+        """
+        The modelled graph as plain data, {"nodes": {path: {...}}, "connections": [...]}.
+        Two builds that do the same thing have the same state
+        """
+        d_nodes = {}
+        for s_path, node in sorted(self._d_nodes.items()):
+            d_nodes[s_path] = {s_slot: getattr(node, s_slot) for s_slot in _VnnNode.__slots__}
+        return {"nodes": d_nodes, "connections": sorted(self._connections)}
+
+    def save(self, path):
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps([list(call) for call in self.calls], indent=1))
+        return path
+
+
+def load(path):
+    """
+    The calls a Recorder saved
+    """
+    return [tuple(call) for call in json.loads(pathlib.Path(path).read_text())]
+
+
+def _map_path(d_real, s_path):
+    # the recorded names of nodes might be taken in the real graph, so they get mapped
+    s_node, s_dot, s_port = s_path.partition(".")
+    sa_rest = []
+    while s_node not in d_real and s_node not in ("", "/"):
+        s_node, _, s_name = s_node.rpartition("/")
+        s_node = s_node or "/"
+        sa_rest.insert(0, s_name)
+
+    path = BifPath(d_real.get(s_node, s_node))
+    for s_name in sa_rest:
+        path = path/s_name
+    return path + s_dot + s_port
+
+
+def replay(calls, s_graph=None, backend=None):
+    """
+    Pushes recorded calls into a graph, maya.cmds unless another backend is given.
+    s_graph replaces the graph they were recorded for. Returns {recorded path: real path}
+    """
+    if backend is None:
+        from maya import cmds as backend
+
+    d_real = {}
+    for s_command, args, kwargs, result in calls:
+        real_args = [s_graph or args[0]] + [_map_path(d_real, x) if isinstance(x, str) and x.startswith("/") else x
+                                            for x in args[1:]]
+        real_result = getattr(backend, s_command)(*real_args, **kwargs)
+
+        # new nodes get their names from the real graph
+        if s_command == "vnnCompound" and result:
+            d_real[BifPath(args[1])/result[0]] = BifPath(real_args[1])/real_result[0]
+
+    return d_real
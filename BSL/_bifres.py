@@ -1,4 +1,9 @@
+import functools
+import hashlib
 import json
+import marshal
+import mmap
+import struct
 import time
 import os
 import pathlib
@@ -272,6 +277,112 @@ ENUMS = {}
 NODES = {}
 TYPES = {}
 
+# {s_path: ((mtime, size), Namespaces)}
+_D_NODE_DATABASES = {}
+
+# magic, version, size of the index. The index is marshalled ((mtime, size, marshal version) of
+# the json, {key: (offset, length)}), after it come the marshalled values back to back
+_STORE_HEADER = struct.Struct("<8sII")
+_STORE_MAGIC = b"BSLSTORE"
+_STORE_VERSION = 1
+
+
+def _store_path(path_json):
+    return _constants.PATH_DATA_STORES/f"{hashlib.sha1(str(path_json).encode()).hexdigest()}.store"
+
+
+def _decode_record(mm, i_offset, i_length):
+    return marshal.loads(mm[i_offset:i_offset + i_length])
+
+
+def _write_store(path_store, ta_stamp, d_data):
+    ba_records = []
+    d_index = {}
+    i_offset = 0
+    for s_key, value in d_data.items():
+        b_record = marshal.dumps(value)
+        d_index[s_key] = (i_offset, len(b_record))
+        ba_records.append(b_record)
+        i_offset += len(b_record)
+
+    b_index = marshal.dumps((ta_stamp, d_index))
+
+    path_tmp = path_store.with_suffix(".tmp")
+    try:
+        path_store.parent.mkdir(parents=True, exist_ok=True)
+        with open(path_tmp, "wb") as f:
+            f.write(_STORE_HEADER.pack(_STORE_MAGIC, _STORE_VERSION, len(b_index)))
+            f.write(b_index)
+            f.writelines(ba_records)
+        path_tmp.replace(path_store)
+    except OSError:
+        # read-only install or the old store is still mapped by another Maya, just use the json
+        pass
+
+
+def _read_store(path_store, ta_stamp, cls):
+    try:
+        with open(path_store, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    # a store that doesnt fit the json just gets rebuilt
+    try:
+        s_magic, i_version, i_index = _STORE_HEADER.unpack_from(mm)
+        if s_magic != _STORE_MAGIC or i_version != _STORE_VERSION:
+            raise ValueError(path_store)
+
+        i_start = _STORE_HEADER.size
+        ta_stored, d_index = marshal.loads(mm[i_start:i_start + i_index])
+        if tuple(ta_stored) != ta_stamp:
+            raise ValueError(path_store)
+    except (struct.error, ValueError, EOFError, TypeError):
+        mm.close()
+        return None
+
+    i_records = i_start + i_index
+    return cls({s_key: _special_types.Pending(functools.partial(_decode_record, mm, i_records + i_offset, i_length))
+                for s_key, (i_offset, i_length) in d_index.items()})
+
+
+def _load_json(path_json, b_namespaces):
+    """
+    One of the collected json files as Namespaces or a dict. With COMPACT_DATA_STORE
+    that goes through a store in the cache, so only the entries somebody looks up get
+    decoded. The store is rebuilt whenever the json changed
+    """
+    if not _constants.COMPACT_DATA_STORE:
+        d_data = json.loads(path_json.read_text())
+        return _special_types.Namespaces(d_data) if b_namespaces else d_data
+
+    stat = path_json.stat()
+    ta_stamp = (stat.st_mtime_ns, stat.st_size, marshal.version)
+    path_store = _store_path(path_json)
+
+    data = _read_store(path_store, ta_stamp, _special_types.LazyNamespaces if b_namespaces else _special_types.LazyDict)
+    if data is None:
+        d_data = json.loads(path_json.read_text())
+        _write_store(path_store, ta_stamp, d_data)
+        data = _special_types.Namespaces(d_data) if b_namespaces else d_data
+    return data
+
+
+def load_nodes(path_nodes=None):
+    """
+    The parsed nodes.json. Its big, so every file only gets parsed once (and again
+    after it changed) and everybody shares the same Namespaces. Dont mutate it, the
+    Overlord keeps its own copies of the overloads it changes
+    """
+    path_nodes = pathlib.Path(path_nodes or _constants.PATH_BIFROST_NODES)
+    stat = path_nodes.stat()
+    ta_stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _D_NODE_DATABASES.get(str(path_nodes))
+    if cached is None or cached[0] != ta_stamp:
+        cached = _D_NODE_DATABASES[str(path_nodes)] = (ta_stamp, _load_json(path_nodes, True))
+    return cached[1]
+
 
 def get_data(b_update=False):
     if b_update:
@@ -284,13 +395,13 @@ def get_data(b_update=False):
     global TYPES
 
     if _constants.PATH_BIFROST_ENUMS.exists():
-        ENUMS = _special_types.Namespaces(json.loads(_constants.PATH_BIFROST_ENUMS.read_text()))
+        ENUMS = _load_json(_constants.PATH_BIFROST_ENUMS, True)
 
     if _constants.PATH_BIFROST_NODES.exists():
-        NODES = _special_types.Namespaces(json.loads(_constants.PATH_BIFROST_NODES.read_text()))
+        NODES = load_nodes()
 
     if _constants.PATH_BIFROST_TYPES.exists():
-        TYPES = json.loads(_constants.PATH_BIFROST_TYPES.read_text())
+        TYPES = _load_json(_constants.PATH_BIFROST_TYPES, False)
 
 
 get_data(b_update=__name__ == "__main__")
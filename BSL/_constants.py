@@ -8,4 +8,37 @@ PATH_BIFROST_TYPES = PATH_BASE/"res"/"bifrost"/"types.json"
 PATH_BIFROST_NODES = PATH_BASE/"res"/"bifrost"/"nodes.json"
 PATH_FIXLIST = PATH_BASE/"res"/"fixlist.json"
 
+PATH_CACHE = PATH_BASE/"res"/"cache"
+PATH_GRAMMAR_CACHE = PATH_CACHE/"grammar.pickle"
+PATH_MODULE_CACHE = PATH_CACHE/"modules"
+PATH_OVERLORD_SNAPSHOT = PATH_CACHE/"overlord.pickle"
+PATH_DATA_STORES = PATH_CACHE/"stores"
+
 FILE_URI_IN_STACKTRACE = False
+
+# rebuild the lexer after every terminal in grammar.y to pinpoint the one that breaks it.
+# Only useful while editing the grammar since it makes building the lexer quadratic
+VALIDATE_GRAMMAR = False
+
+# keep analysed imports around, in memory and on disk. See _visitor_ast.ModuleCache
+CACHE_IMPORTS = True
+
+# memoize Overlord.resolve_inputs_and_outputs per function and input types. See Overlord.resolve_stats()
+CACHE_RESOLVED_OVERLOADS = True
+
+# restore the overloads of a namespace group from a snapshot of the same nodes.json and overload code
+# instead of running its loaders. Groups get added to it the first time they load
+SNAPSHOT_OVERLORD = True
+
+# define the overloads of a namespace the first time one of its functions gets used. See Overlord.load_report()
+LAZY_OVERLOADS = True
+
+# read the collected nodes/types/enums through a compact store in the cache that decodes every
+# entry on first use instead of parsing the whole json. The json files stay the source of truth
+COMPACT_DATA_STORE = True
+
+# connect ports whose type is already known with just vnnConnect, instead of setting and
+# clearing port flag 16 on the source around it, and set it only once around a fan-out of
+# the others. See GraphIR.known_type()
+# not checked in Maya yet whether Bifrost connects those the same without the flag, so its off
+DIRECT_CONNECT = False
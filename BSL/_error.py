@@ -4,6 +4,8 @@ import traceback as _traceback
 
 class Error(Exception):
     def __init__(self, s_message="", previous_error=None, b_stacktrace=True):
+        self._s_raw_message = s_message
+
         x_line_start = lambda i: "\u250C" + i * "\u2500" + NL
         x_line_mid = lambda i: "\u251C" + i * "\u2500" + NL
         x_line_end = lambda i: "\u2514" + i * "\u2500" + NL
@@ -43,6 +45,12 @@ class Error(Exception):
     def __str__(self):
         return self._s_message
 
+    def message(self):
+        """
+        Just the message, without the box and the stacktrace
+        """
+        return self._s_raw_message
+
 
 class BfSyntaxError(Error):
     pass
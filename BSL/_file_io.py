@@ -1,3 +1,5 @@
+import hashlib
+
 from BSL import _constants, _special_types
 
 
@@ -25,5 +27,22 @@ def get_type_dict():
     return _TYPE_DICT
 
 
+def signature(s_version, paths):
+    """
+    Cache key over the mtime and size of the given files, missing ones count as
+    well. Cheap enough to run on every import, unlike hashing their contents
+    """
+    hasher = hashlib.sha1(str(s_version).encode())
+    for path in paths:
+        hasher.update(str(path).encode())
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        hasher.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+
+    return hasher.hexdigest()
+
+
 def get_type_string():
     return '"' + '"/"'.join(get_type_dict()) + '"'
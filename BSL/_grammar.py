@@ -1,9 +1,88 @@
 import json
+import pickle
+import re
 
+from BSL._vendor import ply
 from BSL._vendor.ply import lex, yacc
 
-from BSL import _error, _constants, _bifres
-from BSL import _node
+from BSL import _error, _constants, _bifres, _file_io
+from BSL import _node, _source
+
+
+# bump this whenever the layout of the pickled tables changes
+_TABLE_CACHE_VERSION = 1
+
+# everything in a string up to the next closing quote, escape or NEWLINE
+_D_RE_STRING_CHUNK = {s_quote: re.compile(f"[^{s_quote}\\\\\\n]+") for s_quote in "\"'"}
+_D_STRING_ESCAPES = {"n": "\n", "t": "\t"}
+
+
+def _get_table_signature():
+    """
+    The LALR tables only depend on the grammar, this module that turns it into
+    PLY rules and on the collected types and enums that get expanded into it. Key
+    on all of those (plus the cache and PLY versions) so any change invalidates
+    the cached tables automatically
+    """
+    return _file_io.signature(f"{_TABLE_CACHE_VERSION}:{ply.__version__}", [
+        _constants.PATH_BASE/"_grammar.py",
+        _constants.PATH_BASE/"res"/"grammar.y",
+        _constants.PATH_BASE/"res"/"types.txt",
+        _constants.PATH_BIFROST_TYPES,
+        _constants.PATH_BIFROST_ENUMS,
+    ])
+
+
+def _read_table_cache(s_signature):
+    path = _constants.PATH_GRAMMAR_CACHE
+    if not path.exists():
+        return None
+
+    # a broken or outdated cache is not an error, we just rebuild it
+    try:
+        d_data = pickle.loads(path.read_bytes())
+    except Exception:
+        return None
+
+    if not isinstance(d_data, dict) or d_data.get("signature") != s_signature:
+        return None
+
+    return d_data
+
+
+def _write_table_cache(s_signature, parser):
+    d_data = {
+        "signature": s_signature,
+        "action": parser.action,
+        "goto": parser.goto,
+        "productions": [(p.name, p.prod, p.func) for p in parser.productions]
+    }
+
+    # write to a temp file first so a second Maya session never reads half a file.
+    # If BSL lives somewhere read-only, we simply dont cache
+    path = _constants.PATH_GRAMMAR_CACHE
+    path_tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path_tmp.write_bytes(pickle.dumps(d_data, protocol=pickle.HIGHEST_PROTOCOL))
+        path_tmp.replace(path)
+    except OSError:
+        pass
+
+
+class _CachedTable:
+    """
+    Stand-in for yacc.LRTable holding the tables read from the cache. LRParser
+    only needs the action/goto tables and the productions bound to their p_* functions
+    """
+    def __init__(self, d_data, d_functions):
+        self.lr_action = d_data["action"]
+        self.lr_goto = d_data["goto"]
+        self.lr_productions = []
+        for i, (s_name, sa_prod, s_func) in enumerate(d_data["productions"]):
+            production = yacc.Production(i, s_name, sa_prod, func=s_func)
+            production.bind(d_functions)
+            self.lr_productions.append(production)
 
 
 def _parse_grammar():
@@ -87,45 +166,46 @@ def _parse_grammar():
         quote must be in the same line. Escape rules apply
         """
         source = t.lexer.lexdata
+        i_len = len(source)
         i = t.lexer.lexpos
-        s = t.value
-        c = source[i]
+        s_quote = t.value
+        re_chunk = _D_RE_STRING_CHUNK[s_quote]
+        sa_parts = [s_quote]
+
+        while True:
+            # consume everything that needs no special treatment in one go
+            match = re_chunk.match(source, i)
+            if match:
+                sa_parts.append(match.group())
+                i = match.end()
+
+            # if this breaks early, the closing quote wont
+            # get added thus raising an error in the visitor
+            # less hassle than the regex
+            if i >= i_len:
+                break
+
+            c = source[i]
+            if c == s_quote:
+                sa_parts.append(s_quote)
+                break
 
-        while c != t.value and i < len(source):
             # dont allow strings across multiple lines
             if c == "\n":
-                t.value = s
                 t.lexer.lineno += 1
                 break
 
-            if c == "\\":
-                c_next = source[i+1]
-
-                # support special characters
-                if c_next == "n":
-                    s += "\n"
-
-                elif c_next == "t":
-                    s += "\t"
-
-                else:
-                    s += source[i+1]
-
-                i += 2
-                c = source[i]
-                continue
-    
-            s += c
-            i += 1
-            c = source[i]
+            # escape, support special characters
+            if i + 1 >= i_len:
+                i += 1
+                break
 
-        else:
-            # if this breaks early, the closing quote wont
-            # get added thus raising an error in the visitor
-            # less hassle than the regex
-            t.value = s + t.value
+            c_next = source[i+1]
+            sa_parts.append(_D_STRING_ESCAPES.get(c_next, c_next))
+            i += 2
 
-        t.lexer.lexpos = i + 1
+        t.value = "".join(sa_parts)
+        t.lexer.lexpos = min(i + 1, i_len)
         return t
     
     
@@ -135,16 +215,12 @@ def _parse_grammar():
         that we are matching the start pattern in reverse /* -> */
         When encountering a NEWLINE, increment the lexer's lineno
         """
-        for i in range(t.lexer.lexpos, len(t.lexer.lexdata)-1):
-            if t.lexer.lexdata[i:i+2] == t.value[::-1]:
-                t.lexer.lexpos = i+2
-                break
-    
-            elif t.lexer.lexdata[i] == "\n":
-                t.lexer.lineno += 1
-    
-        else:
+        i = t.lexer.lexdata.find(t.value[::-1], t.lexer.lexpos)
+        if i == -1:
             raise SyntaxError("Block comment was never closed!")
+
+        t.lexer.lineno += t.lexer.lexdata.count("\n", t.lexer.lexpos, i)
+        t.lexer.lexpos = i+2
     
     
     def _t_ignore_COMMENT_INLINE(t):
@@ -152,14 +228,13 @@ def _parse_grammar():
         Simple inline comment ignoring everything until the next NEWLINE.
         Also ignored.
         """
-        for i in range(t.lexer.lexpos, len(t.lexer.lexdata)-1):
-            if t.lexer.lexdata[i] == "\n":
-                t.lexer.lexpos = i+1
-                t.lexer.lineno += 1
-                break
-
-        else:
+        # a NEWLINE as the very last character is left for _t_ignore_NEWLINE
+        i = t.lexer.lexdata.find("\n", t.lexer.lexpos, len(t.lexer.lexdata)-1)
+        if i == -1:
             t.lexer.lexpos = len(t.lexer.lexdata)
+        else:
+            t.lexer.lexpos = i+1
+            t.lexer.lineno += 1
 
 
     def _t_NAME(t):
@@ -167,26 +242,36 @@ def _parse_grammar():
         Since base types and keywords all match NAME as well,
         filter them out here and patch the token type.
         """
-        if t.value in d_reserved:
-            t.type = d_reserved[t.value]
-        elif t.value in sa_enums:
+        s_reserved = d_reserved.get(t.value)
+        if s_reserved is not None:
+            t.type = s_reserved
+        elif t.value in set_enums:
             t.type = "ENUM"
-            if t.value in d_types:
-                t.value = d_types[t.value]
-        elif t.value in sa_types:
+            t.value = d_types.get(t.value, t.value)
+        elif t.value in set_types:
             t.type = "TYPE"
-            # if "print" in t.value:
-            #     print(t.value, sa_types)
-            if t.value in d_types:
-                t.value = d_types[t.value]
+            t.value = d_types.get(t.value, t.value)
         elif "::" in t.value:
             t.type = "NAMESPACE_NAME"
 
-        # print(f"name: '{t.value}' << {t.type}")
-        # print(sa_types)
-
         return t
 
+    def _t_ENUM_VALUE(t):
+        """
+        The regex matches any <name>.<name>, so only keep the token if the
+        part in front of the dot is an enum. Otherwise, rewind the lexer to
+        the dot and return the first part as a NAME token.
+        """
+        s_enum, _, _ = t.value.rpartition(".")
+        if s_enum in set_enums:
+            return t
+
+        t.lexer.lexpos = t.lexpos + len(s_enum)
+        t.type = "NAME"
+        t.value = s_enum
+        t.len = len(s_enum)
+        return _t_NAME(t)
+
     def _t_ENUM(t):
         print(f"enum: '{t.value}'")
     
@@ -203,8 +288,9 @@ def _parse_grammar():
         symbol is encountered. Meaning a symbol that doesnt match any token's
         regex. This prints a nicely formatted syntax error
         """
-        s_prev = t.lexer.lexdata[:t.lexer.lexpos].rpartition("\n")[2]
-        s_line = t.lexer.lexdata.split("\n")[t.lineno-1]
+        lines = get_line_index(t.lexer)
+        s_prev = lines.prefix(t.lexer.lexpos)
+        s_line = lines.line(t.lineno)
         s_underline = "".join([(c if c == "\t" else " ") for c in s_prev])
     
         if _constants.FILE_URI_IN_STACKTRACE:
@@ -224,17 +310,18 @@ def _parse_grammar():
         _BAD_ expressions since you can provide custom error messages there.
         """
         lexer = _LEXER
+        lines = get_line_index(lexer)
 
         if p is None:
-            s_prev = lexer.lexdata.rstrip().rpartition("\n")[2]
-            s_line = lexer.lexdata.rstrip().split("\n")[-1]
+            s_prev = lines.prefix(len(lexer.lexdata.rstrip()))
+            s_line = s_prev
             s_underline = "".join([(c if c == "\t" else " ") for c in s_prev])
             i_len = 1
             s_type = "EOF"
             s_value = ""
         else:
-            s_prev = lexer.lexdata[:lexer.lexpos-p.len].rpartition("\n")[2]
-            s_line = lexer.lexdata.split("\n")[p.lineno - 1]
+            s_prev = lines.prefix(lexer.lexpos-p.len)
+            s_line = lines.line(p.lineno)
             s_underline = "".join([(c if c == "\t" else " ") for c in s_prev])
             i_len = p.len
             s_type = p.type
@@ -276,8 +363,9 @@ def _parse_grammar():
         i_line_end = flat[-1].lineno
         in_last_line = [node for node in flat if node.lineno == i_line_end]
 
-        s_prev = lexer.lexdata[:in_last_line[0].start].rpartition("\n")[2]
-        s_line = lexer.lexdata.split("\n")[i_line_end - 1]
+        lines = get_line_index(lexer)
+        s_prev = lines.prefix(in_last_line[0].start)
+        s_line = lines.line(i_line_end)
         s_underline = "".join([(c if c == "\t" else " ") for c in s_prev])
 
         i_underline = in_last_line[-1].end - in_last_line[0].start
@@ -315,10 +403,11 @@ def _parse_grammar():
         checks are performed.
         todo: figure this out
         """
-        def inner(p, d_data=None):
-            s_current_rule = d_data["expression"].split(" ::= ")[0]
-            sa_expr_names = d_data["expression"].replace(" ::= ", " ").split(" ")[1:]
+        # the expression is known when decorating, no need to split it on every reduction
+        s_current_rule = fn.__doc__["expression"].split(" ::= ")[0]
+        sa_expr_names = fn.__doc__["expression"].replace(" ::= ", " ").split(" ")[1:]
 
+        def inner(p, d_data=None):
             children = []
             for i, (s_expr_name, value) in enumerate(zip(sa_expr_names, p[1:]), 1):
                 if not isinstance(value, _node.Node):
@@ -374,41 +463,26 @@ def _parse_grammar():
     tokens = []
     d_bad_rule_messages = {}
 
-    # query and sort the types from types.txt
+    # query the types from types.txt and the collected types and enums. The lexer
+    # classifies NAME tokens through these sets (see _t_NAME) instead of matching
+    # every type and enum name as part of a regex alternation
     # todo: clean this up... A LOT!
-    sa_types = (_constants.PATH_BASE/"res"/"types.txt").absolute().read_text().strip().split("\n")
-    d_types = {s.split(" = ")[0].strip(): s.split(" = ")[1].strip() for s in sa_types if s.strip()}
-    sa_types = [s.partition("=")[0].strip() for s in sa_types if s.strip()]
+    sa_lines = (_constants.PATH_BASE/"res"/"types.txt").absolute().read_text().strip().split("\n")
+    d_types = {s.split(" = ")[0].strip(): s.split(" = ")[1].strip() for s in sa_lines if s.strip()}
+    set_types = {s.partition("=")[0].strip() for s in sa_lines if s.strip()}
+    set_types |= {s for s in _bifres.TYPES.keys() if s.upper() not in set_types}
 
-    sa_all_types = list(_bifres.TYPES.keys())
-    sa_types += [s for s in sa_all_types if s.upper() not in sa_types]
-
-    sa_enums = list(_bifres.ENUMS.keys())
+    set_enums = set(_bifres.ENUMS.keys())
 
     for k, v in d_types.items():
-        if v in sa_enums:
-            sa_enums.append(k)
-            sa_types.remove(k)
-
-    # for i in range(3):
-    #     sa_types += [f"{s}\[]" for s in sa_types]
-    #     sa_enums += [f"{s}\[]" for s in sa_enums]
-
-    sa_types.sort(key=lambda x: len(x), reverse=True)
-    sa_enums.sort(key=lambda x: len(x), reverse=True)
+        if v in set_enums:
+            set_enums.add(k)
+            set_types.discard(k)
 
-    # for s_type in sa_types:
-    #     d_reserved[s_type] = "TYPE"
-    #
-    # for s_enum in sa_enums:
-    #     d_reserved[s_enum] = "ENUM"
+    set_types = frozenset(set_types)
+    set_enums = frozenset(set_enums)
 
-    # parse the grammar file, replacing the {__TYPES__} and {__ENUMS__} with the actual
-    # type
     s_grammar = (_constants.PATH_BASE/"res"/"grammar.y").absolute().read_text()
-    s_grammar = s_grammar.replace("{__TYPES__}", "|".join(sa_types))
-    s_grammar = s_grammar.replace("{__ENUMS__}", "|".join(sa_enums))
-    # print(s_grammar)
     # remove comments
     sa_lines = [s for s in s_grammar.split("\n") if s.strip() and not s.strip().startswith("#")]
 
@@ -471,21 +545,28 @@ def _parse_grammar():
         tokens.append(token_name)
 
         # check if adding this terminal broke the lexer
-        # this is probably not performant, but its relatively easy to figure out
-        # if a new regex rule broke it. Keep in mind, if something is off in regard
+        # this is not performant (every call compiles the master regex again), but its
+        # relatively easy to figure out if a new regex rule broke it. So this only runs in
+        # grammar validation mode. Keep in mind, if something is off in regard
         # to the t_* methods, (eg, defining t_<TERMINAL>), will cause an error on the first
         # rule since <TERMINAL> is not yet defined. My workaround is to specify a _t_<TERMINAL>
         # method instead
-        try:
-            lexer = lex.lex()
-        except SyntaxError as e:
-            raise _error.BfSyntaxError(str(e) + f" after: {token_name} = '{token_regex}'")
+        if _constants.VALIDATE_GRAMMAR:
+            try:
+                lex.lex()
+            except SyntaxError as e:
+                raise _error.BfSyntaxError(str(e) + f" after: {token_name} = '{token_regex}'")
 
     tokens += list(dict.fromkeys(d_reserved.values()).keys())
     tokens += ["TYPE", "ENUM", "NAMESPACE_NAME"]
 
+    # the one and only time the master regex gets compiled (outside of validation mode)
     global _LEXER
-    _LEXER = lex.lex()
+    try:
+        _LEXER = lex.lex()
+    except SyntaxError as e:
+        s_hint = "" if _constants.VALIDATE_GRAMMAR else " (set _constants.VALIDATE_GRAMMAR to find the broken terminal)"
+        raise _error.BfSyntaxError(str(e) + s_hint)
 
     # now for the rules. We keep a dict with rules as keys and lists of alternatives as
     # the values. We keep track of the last rule we added for alternatives in new lines
@@ -543,8 +624,21 @@ def _parse_grammar():
             # this isnt needed anymore. Better safe than sorry.
             del func
 
+    # building the LALR automaton is by far the slowest part, so try the cached
+    # tables first and only run the generator if the inputs changed
     global _PARSER
+    s_signature = _get_table_signature()
+    d_tables = _read_table_cache(s_signature)
+    if d_tables is not None:
+        try:
+            _PARSER = yacc.LRParser(_CachedTable(d_tables, d_locals), p_error)
+            return
+        except KeyError:
+            # a p_* function the tables refer to no longer exists
+            pass
+
     _PARSER = yacc.yacc(start="program")
+    _write_table_cache(s_signature, _PARSER)
 
 
 _LEXER = None
@@ -558,6 +652,18 @@ def get_lexer():
     return _LEXER
 
 
+def get_line_index(lexer=None):
+    """
+    The line index of the source the lexer currently holds. It only gets built
+    once per source and is shared by all diagnostics for that source
+    """
+    lexer = lexer or get_lexer()
+    lines = getattr(lexer, "line_index", None)
+    if lines is None or lines.source is not lexer.lexdata:
+        lines = lexer.line_index = _source.LineIndex(lexer.lexdata)
+    return lines
+
+
 def get_parser():
     global _PARSER
     if _PARSER is None:
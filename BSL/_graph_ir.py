@@ -0,0 +1,305 @@
+"""
+The graph _bifcmds.Graph builds while the _bifast nodes run to_vnn(). Nothing in here
+talks to Maya, the vnn commands only get fired when the graph is lowered at the end
+(see _bifcmds.lower_to_vnn()). Until then it can be counted, changed or written out
+some other way.
+
+Node paths are the same BifPaths the vnn commands use. Bifrost picks the names of new
+nodes, so the names in here are only a guess ("add", "add1", ...) that a backend maps
+to the real ones while it creates them.
+"""
+from BSL import _error
+
+
+class NodeType:
+    kCompound = "BifrostGraph,Core::Graph,compound"  # xml: AminoVnn_Compound
+
+    kAdd = "BifrostGraph,Core::Math,add"
+    kSubtract = "BifrostGraph,Core::Math,subtract"
+    kMultiply = "BifrostGraph,Core::Math,multiply"
+    kDivide = "BifrostGraph,Core::Math,divide"
+    kPower = "BifrostGraph,Core::Math,power"
+
+    kAnd = "BifrostGraph,Core::Logic,and"
+    kOr = "BifrostGraph,Core::Logic,or"
+    kNot = "BifrostGraph,Core::Logic,not"
+    kEqual = "BifrostGraph,Core::Logic,equal"
+    kNotEqual = "BifrostGraph,Core::Logic,not_equal"
+    kGreater = "BifrostGraph,Core::Logic,greater"
+    kGreaterOrEqual = "BifrostGraph,Core::Logic,greater_or_equal"
+    kLess = "BifrostGraph,Core::Logic,less"
+    kLessOrEqual = "BifrostGraph,Core::Logic,less_or_equal"
+
+    kInput = "_input"
+    kOutput = "_output"
+
+    kBuildArray = "BifrostGraph,Core::Array,build_array"
+    kSetInArray = "BifrostGraph,Core::Array,set_in_array"
+    kSetProperty = "BifrostGraph,Core::Object,set_property"
+
+
+class BifPath(str):
+    def __truediv__(self, other):
+        return self.__class__("/" + (self + "/" + str(other)).strip("/"))
+
+    def __floordiv__(self, other):
+        return self.__class__("/" + (self + "." + str(other)).strip("/"))
+
+    @property
+    def name(self):
+        if "." in self:
+            return self.partition(".")[2]
+        return self.rpartition("/")[2]
+
+    @property
+    def parent(self):
+        if "." in self:
+            return self.__class__("/" + self.partition(".")[0].strip("/"))
+        return self.__class__("/" + self.rpartition("/")[0].strip("/"))
+
+
+class Port:
+    __slots__ = ("s_name", "b_input", "s_type")
+
+    def __init__(self, s_name, b_input, s_type):
+        self.s_name = s_name
+        self.b_input = b_input
+        self.s_type = s_type
+
+
+class Node:
+    """
+    A node and everything that was set on it. Ports only holds the ports that got
+    added, the ones a node type comes with are not known here. Implicit nodes already
+    exist once their parent does (the input/output of iterators), backends dont create them
+    """
+    __slots__ = ("path", "s_type", "parent", "d_children", "d_ports", "d_port_types", "d_values", "d_meta",
+                 "s_display", "d_port_meta", "d_port_flags", "sa_deleted_ports", "b_implicit")
+
+    def __init__(self, path, s_type, parent=None, b_implicit=False):
+        self.path = path
+        self.s_type = s_type
+        self.parent = parent
+        self.d_children = {}
+        self.d_ports = {}
+        self.d_port_types = {}
+        self.d_values = {}
+        self.d_meta = {}
+        self.s_display = None
+        self.d_port_meta = {}
+        self.d_port_flags = {}
+        self.sa_deleted_ports = []
+        self.b_implicit = b_implicit
+
+    @property
+    def name(self):
+        return self.path.name
+
+    def is_io(self):
+        return self.s_type in (NodeType.kInput, NodeType.kOutput)
+
+    def is_compound(self):
+        return self.s_type == NodeType.kCompound or _is_iterator(self.s_type)
+
+    def port_names(self):
+        """
+        The ports added to this node and, for compounds, the ones added to their input/output nodes
+        """
+        sa_names = list(self.d_ports)
+        for child in self.d_children.values():
+            if child.is_io():
+                sa_names += list(child.d_ports)
+        return sa_names
+
+
+def _is_iterator(s_type):
+    return s_type is not None and s_type.startswith("BifrostGraph,Core::Iterators,")
+
+
+def _base_name(s_type):
+    if s_type == NodeType.kInput:
+        return "input"
+    if s_type == NodeType.kOutput:
+        return "output"
+    return s_type.rpartition(",")[2]
+
+
+class GraphIR:
+    def __init__(self, parent="/"):
+        root = Node(BifPath(parent), None, b_implicit=True)
+        self._d_nodes = {root.path: root}
+        self._connections = []
+        self._locations = []
+        self._d_terminals = {}
+        self._d_known_types = {}
+
+    def node(self, path):
+        """
+        The node of a node or port path. None for nodes this graph knows nothing about
+        """
+        return self._d_nodes.get(BifPath(path).parent if "." in path else path)
+
+    def nodes(self):
+        """
+        All nodes in the order they were created, parents always come before their children.
+        That includes the implicit ones, s_type is None for those we dont know the type of
+        """
+        return list(self._d_nodes.values())
+
+    def connections(self):
+        return list(self._connections)
+
+    def locations(self):
+        """
+        Where each of connections() was made, whatever connect() got for it
+        """
+        return list(self._locations)
+
+    def terminals(self):
+        return dict(self._d_terminals)
+
+    def add_node(self, s_type, context):
+        parent = self._get(BifPath(context))
+
+        s_name = s_base = _base_name(s_type)
+        i = 1
+        while s_name in parent.d_children:
+            s_name = f"{s_base}{i}"
+            i += 1
+
+        node = self._add(BifPath(context)/s_name, s_type, parent)
+
+        # iterators come with their own input and output
+        if _is_iterator(s_type):
+            self._add(node.path/"input", NodeType.kInput, node, b_implicit=True)
+            self._add(node.path/"output", NodeType.kOutput, node, b_implicit=True)
+
+        return node.path
+
+    def _add(self, path, s_type, parent, b_implicit=False):
+        node = self._d_nodes[path] = Node(path, s_type, parent, b_implicit)
+        if parent is not None:
+            parent.d_children[path.name] = node
+        return node
+
+    def _get(self, path):
+        node = self._d_nodes.get(path)
+        if node is None:
+            # something inside a node type we didnt create, it exists once its parent does
+            path = BifPath(path)
+            node = self._add(path, None, self._get(path.parent) if path.parent != path else None, b_implicit=True)
+        return node
+
+    def add_port(self, node, s_name, s_type, b_input):
+        self._get(node).d_ports[s_name] = Port(s_name, b_input, s_type)
+        return BifPath(node)//s_name
+
+    def set_port_type(self, node, s_port, s_type):
+        self._get(node).d_port_types[s_port] = s_type
+
+    def port_type(self, node, s_port):
+        """
+        What the graph knows about the type of a port, "auto" if it doesnt. Bifrost
+        may resolve those to something else later
+        """
+        node = self._d_nodes.get(node)
+        if node is None:
+            return "auto"
+        if s_port in node.d_port_types:
+            return node.d_port_types[s_port]
+        if s_port in node.d_ports:
+            return node.d_ports[s_port].s_type
+        return "auto"
+
+    def set_known_type(self, port, s_type):
+        """
+        The type a port will have in Bifrost, as far as BSL resolved it. Unlike set_port_type
+        this doesnt get set on the port, it only tells backends they can rely on it
+        """
+        if s_type and s_type != "auto":
+            self._d_known_types[BifPath(port)] = s_type
+
+    def known_type(self, port):
+        """
+        The type a port is known to have, "auto" if nobody knows
+        """
+        port = BifPath(port)
+        if port in self._d_known_types:
+            return self._d_known_types[port]
+        return self.port_type(port.parent, port.name)
+
+    def set_value(self, node, s_port, value):
+        self._get(node).d_values[s_port] = value
+
+    def set_meta_data(self, node, key, value):
+        self._get(node).d_meta[key] = value
+
+    def set_display(self, node, s_expr):
+        self._get(node).s_display = s_expr
+
+    def set_port_meta_data(self, node, s_port, key, value):
+        self._get(node).d_port_meta.setdefault(s_port, {})[key] = value
+
+    def clear_port_flags(self, port, i_flags):
+        port = BifPath(port)
+        d_flags = self._get(port.parent).d_port_flags
+        d_flags[port.name] = d_flags.get(port.name, 0) | i_flags
+
+    def delete_port(self, node, s_port):
+        self._get(node).sa_deleted_ports.append(s_port)
+
+    def rename_port(self, port, s_name):
+        port = BifPath(port)
+        compound = self._get(port.parent)
+        if s_name in compound.port_names():
+            raise _error.Error("Port exists! Auto rename only works for nodes")
+
+        # compound ports live on their input/output nodes
+        for owner in [compound] + [child for child in compound.d_children.values() if child.is_io()]:
+            if port.name in owner.d_ports:
+                break
+        else:
+            raise _error.Error(f"Cant rename '{port}', only ports added to the graph can be renamed")
+
+        old_port = owner.d_ports.pop(port.name)
+        owner.d_ports[s_name] = Port(s_name, old_port.b_input, old_port.s_type)
+        for d in (owner.d_port_types, owner.d_values, owner.d_port_meta, owner.d_port_flags):
+            if port.name in d:
+                d[s_name] = d.pop(port.name)
+
+        # everything connected to it now has to find it under the new name, on the compound as well
+        d_renamed = {str(owner.path//port.name): owner.path//s_name}
+        if owner.is_io() and owner.parent is not None:
+            d_renamed[str(owner.parent.path//port.name)] = owner.parent.path//s_name
+        self._connections = [(d_renamed.get(src, src), d_renamed.get(tgt, tgt)) for src, tgt in self._connections]
+        for s_old, new in d_renamed.items():
+            if s_old in self._d_known_types:
+                self._d_known_types[new] = self._d_known_types.pop(s_old)
+        return port.parent//s_name
+
+    def connect(self, src, tgt, location=None):
+        self._connections.append((BifPath(src), BifPath(tgt)))
+        self._locations.append(location)
+
+    def set_terminal(self, node, flags):
+        self._d_terminals[node] = flags
+
+    def stats(self):
+        """
+        Size of the graph: {"nodes", "compounds", "ports", "connections", "values", "depth", "types": {s_type: count}}
+        """
+        nodes = self.nodes()
+        d_types = {}
+        for node in nodes:
+            if not node.b_implicit:
+                d_types[node.s_type] = d_types.get(node.s_type, 0) + 1
+
+        return {
+            "nodes": sum(d_types.values()),
+            "compounds": sum(1 for node in nodes if not node.b_implicit and node.is_compound()),
+            "ports": sum(len(node.d_ports) for node in nodes),
+            "connections": len(self._connections),
+            "values": sum(len(node.d_values) for node in nodes),
+            "depth": max([node.path.count("/") for node in nodes], default=0),
+            "types": d_types,
+        }
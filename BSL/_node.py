@@ -1,13 +1,18 @@
+import sys
+
 
 class Node:
+    # parse trees of big scripts easily hold millions of these, so no __dict__
+    __slots__ = ("type", "children", "_children", "lineno", "start", "end", "filename", "text")
+
     def __init__(self, type, children=None, lineno=-1, start=-1, end=-1, filename="", text=""):
         self.type = type
         self.children = children
-        self._children = {child.type: i for i, child in enumerate(children) if isinstance(child, Node)}
+        self._children = None
         self.lineno = lineno
         self.start = start
         self.end = end
-        self.filename = filename
+        self.filename = sys.intern(filename)
         self.text = text
 
     def __repr__(self):
@@ -21,6 +26,9 @@ class Node:
         return s
 
     def __getitem__(self, item):
+        # most nodes never get accessed by name, so only build the lookup on demand
+        if self._children is None:
+            self._children = {child.type: i for i, child in enumerate(self.children) if isinstance(child, Node)}
         return self.children[self._children[item]]
 
 
@@ -21,15 +21,18 @@ define_usd_curves
     basis: not auto port but has suggestion meta data
     type: not auto port but has suggestion meta data
 """
+import concurrent.futures
+import functools
 import itertools
+import pathlib
+import pickle
+import time
 
-from BSL import _error, _special_types, _type, _resolver
+from BSL import _bifres, _constants, _error, _file_io, _special_types, _type, _resolver
 from BSL._constants import PATH_BIFROST_NODES
 
 from BSL._port_types import *
 
-import json
-
 
 def _replace_base(x, s):
     arr = x.count(">")
@@ -58,6 +61,10 @@ def _arrUp(x):
     return f"array<{x}>"
 
 
+def _arrUp2(x):
+    return _arrUp(_arrUp(x))
+
+
 def _arrFlat(x):
     dim = x.count(">")
     if dim == 0:
@@ -105,6 +112,10 @@ def _to_vec3(x):
     return arr * "array<" + f"{x}3" + arr * ">"
 
 
+def _arrUp_vec3(x):
+    return _arrUp(_to_vec3(x))
+
+
 def _to_scalar(x):
     arr = x.count(">")
     for _ in range(arr):
@@ -160,46 +171,161 @@ def _to_float(x):
     raise NotImplementedError
 
 
+_SNAPSHOT_VERSION = 4
+
+
+def _init_batch_worker(s_path_nodes):
+    Overlord.init(pathlib.Path(s_path_nodes))
+
+
+def _resolve_chunk(calls):
+    return [Overlord.resolve_structured(s_func, sa_types) for s_func, sa_types in calls]
+
+
+def _copy_node(nodes, s_func):
+    return dict(nodes[s_func])
+
+
+# type set of a key port -> the classes (see _type.type_class) it takes. The same sets
+# (NUMERIC, VECTOR...) are used by a lot of functions
+_D_PORT_CLASSES = {}
+
+
+def _port_classes(types):
+    key = types if isinstance(types, int) else frozenset(types)
+    set_classes = _D_PORT_CLASSES.get(key)
+    if set_classes is None:
+        set_classes = _D_PORT_CLASSES[key] = frozenset().union(*map(_type.promotion_classes, types))
+    return set_classes
+
+
+def _namespace(s_func):
+    # overloads get loaded per "Core::Math", "Geometry::Query"...
+    return "::".join(s_func.split("::")[:2])
+
+
+def _snapshot_key(path_nodes):
+    """
+    The nodes.json and the BSL sources (there is no other version to go by). Types
+    and enums are in there as well since the port type sets are built from them
+    """
+    return _file_io.signature(_SNAPSHOT_VERSION, sorted(_constants.PATH_BASE.glob("**/*.py")) + [
+        _constants.PATH_BIFROST_TYPES,
+        _constants.PATH_BIFROST_ENUMS,
+        path_nodes,
+    ])
+
+
 class Overlord:
     CHECK_EXISTS = False
 
+    # every loader with the namespaces it defines overloads in, in the order they run.
+    # Loaders that share a namespace run together the first time a function in one of
+    # their namespaces gets used, see _load_namespace(). Keep this up to date when
+    # adding overloads, define_overload complains otherwise
+    LOADERS = (
+        ("load_graph_overloads", ("Core::Graph", "Core::Error", "Core::Logging", "Core::Compound_Tests", "Diagnostic::Profiling", "Rendering::Terminals")),
+        ("load_conversion_overloads", ("Core::Type_Conversion", "Core::Conversion", "Core::String", "Core::Transform", "Geometry::Common")),
+        ("load_array_overloads", ("Core::Array", "Core::Math")),
+        ("load_object_overloads", ("Core::Object", "Modeling::Primitive")),
+        ("load_math_overloads", ("Core::Math", "Core::FCurve", "Rigging::Solver")),
+        ("load_constants_overloads", ("Core::Constants",)),
+        ("load_logic_overloads", ("Core::Logic",)),
+        ("load_geometry_overloads", ("Geometry::Common", "Geometry::Properties", "Geometry::Strands", "Geometry::Instances", "Geometry::Query",
+                                     "Geometry::Mesh", "Geometry::Tags", "Geometry::Volume", "Modeling::Mesh", "Modeling::Points", "Modeling::Instances")),
+        ("load_ml_overloads", ("MachineLearning::Activation", "MachineLearning::Utils", "File::NumPy")),
+        ("load_random_overloads", ("Core::Randomization",)),
+        ("load_display_overloads", ("Diagnostic::Display",)),
+        ("load_field_overloads", ("Core::Fields",)),
+        ("load_simulation_overloads", ("Simulation::Common", "Simulation::Influence", "Simulation::Particles", "Simulation::MPM", "Simulation::BOSS")),
+        ("load_usd_overloads", ("USD::Stage", "USD::Layer", "USD::Attribute", "USD::Prim", "USD::VariantSet")),
+    )
+
     _d_operators = None
+    # functions whose overloads dict is our own copy instead of the one in _bifres.NODES
+    _set_owned = set()
+    # functions changed by the running session instead of the loaders, see add_overload()
+    _set_session = set()
     _d_overloads = None
-    _sa_tests_done = []
-    _sa_tests_skipped = []
+
+    # lazy loading: {namespace: [functions]}, {namespace: (loaders, namespaces loaded with it)},
+    # the functions that are done and the namespaces of the loader that is running right now
+    _d_namespace_functions = {}
+    _d_namespace_groups = {}
+    _set_loaded = set()
+    _sa_loading = None
+
+    # the snapshot matching this init, {(namespaces of a loader group): pickled overloads of it}.
+    # None if SNAPSHOT_OVERLORD is off
+    _s_snapshot_key = None
+    _d_snapshot = None
+    _d_load_times = {}
+    _path_nodes = None
+
+    # memoized results of resolve_inputs_and_outputs, {s_func: {(input type strings): (status, result)}}
+    _d_resolved = {}
+    _d_dispatch = {}
+    # the dispatch index, see _candidate_sets(). Per overload set of a function the classes each key
+    # port takes (None for resolvers) and the sets that are left for the classes of some inputs
+    _d_set_classes = {}
+    _d_candidates = {}
+    i_resolve_hits = 0
+    i_resolve_misses = 0
 
     def __new__(cls, *args, **kwargs):
         raise _error.Error("Overlord is acts like a singleton. Use class methods directly")
 
     @classmethod
-    def init(cls):
-        cls._d_operators = _special_types.Namespaces(json.loads(PATH_BIFROST_NODES.read_text()))
-        cls._d_overloads = {}
+    def init(cls, path_nodes=None):
+        """
+        Loads the nodes. The overloads of a namespace get defined the first time one of its
+        functions is used, or right here without LAZY_OVERLOADS. The self tests of those
+        overloads dont run here, see verify() and BSL.verify_overloads
+        """
+        path_nodes = cls._path_nodes = path_nodes or PATH_BIFROST_NODES
+        cls._set_session = set()
+        cls.clear_resolved()
 
-        cls.load_graph_overloads()
-        cls.load_conversion_overloads()
-        cls.load_array_overloads()
-        cls.load_object_overloads()
-        cls.load_math_overloads()
-        cls.load_constants_overloads()
-        cls.load_logic_overloads()
-        cls.load_geometry_overloads()
-        cls.load_ml_overloads()
-        cls.load_random_overloads()
-        cls.load_display_overloads()
-        cls.load_field_overloads()
-        cls.load_simulation_overloads()
-        cls.load_usd_overloads()
-
-        # this will not produce an exhaustive list
-        cls.load_simple_overloads_from_suggestions()
+        cls._d_load_times = {}
+        cls._d_operators = cls._shared_operators(path_nodes)
+        cls._d_overloads = {}
+        cls._set_loaded = set()
+
+        cls._d_namespace_functions = {}
+        for s_func in cls._d_operators:
+            cls._d_namespace_functions.setdefault(_namespace(s_func), []).append(s_func)
+
+        # loaders sharing a namespace have to run together and in order, otherwise the overload
+        # sets of a function they both define would end up in a different order
+        groups = []
+        for s_loader, sa_namespaces in cls.LOADERS:
+            group = ({s_loader}, set(sa_namespaces))
+            for other in [g for g in groups if g[1] & group[1]]:
+                groups.remove(other)
+                group[0].update(other[0])
+                group[1].update(other[1])
+            groups.append(group)
+
+        sa_order = [s_loader for s_loader, _ in cls.LOADERS]
+        cls._d_namespace_groups = {}
+        for set_loaders, set_namespaces in groups:
+            group = (tuple(sorted(set_loaders, key=sa_order.index)), tuple(sorted(set_namespaces)))
+            for s_namespace in set_namespaces:
+                cls._d_namespace_groups[s_namespace] = group
+
+        # loader groups come from the snapshot or get added to it when they load, see _load_namespace()
+        cls._s_snapshot_key = _snapshot_key(path_nodes) if _constants.SNAPSHOT_OVERLORD else None
+        cls._d_snapshot = cls._read_snapshot(cls._s_snapshot_key) if cls._s_snapshot_key else None
+
+        if not _constants.LAZY_OVERLOADS:
+            cls.load_all()
 
         sa_dont = {
             "Core::Type_Conversion::promote",
             "Simulation::Common::simulation_example",
         }
 
-        for s_func, d_data in cls._d_operators.items():
+        for s_func in cls._d_operators:
             if s_func in sa_dont:
                 continue
 
@@ -214,13 +340,181 @@ class Overlord:
         #     if cls.is_associative(s_func):
         #         print(s_func)
 
-        print(f"Passed {len(cls._sa_tests_done)} tests, skipped {len(cls._sa_tests_skipped)}")
+    @classmethod
+    def _shared_operators(cls, path_nodes):
+        """
+        Shallow copies of the node data in _bifres, all the lists stay shared. The
+        overloads only get copied once we change them, see _own_overloads(). Like the
+        nodes themselves, the copies only get made when a function gets looked up
+        """
+        cls._set_owned = set()
+        nodes = _bifres.load_nodes(path_nodes)
+        return _special_types.LazyNamespaces({s_func: _special_types.Pending(functools.partial(_copy_node, nodes, s_func)) for s_func in nodes.keys()})
+
+    @classmethod
+    def _own_overloads(cls, s_func):
+        d_operator = cls._d_operators[s_func]
+        s_func = cls._d_operators.resolves(s_func)
+        if s_func not in cls._set_owned:
+            d_operator["overloads"] = dict(d_operator["overloads"])
+            cls._set_owned.add(s_func)
+        return d_operator["overloads"]
+
+    @classmethod
+    def _load_namespace(cls, s_namespace):
+        sa_loaders, sa_namespaces = cls._d_namespace_groups.get(s_namespace, ((), (s_namespace,)))
+        sa_funcs = [s_func for s in sa_namespaces for s_func in cls._d_namespace_functions.get(s, [])]
+
+        # mark them first, the loaders look at those functions through the same methods that load them
+        cls._set_loaded.update(sa_funcs)
+
+        f_start = time.perf_counter()
+        if not (sa_loaders and cls._restore_group(sa_namespaces)):
+            d_loaders = dict(cls.LOADERS)
+            try:
+                for s_loader in sa_loaders:
+                    cls._sa_loading = d_loaders[s_loader]
+                    getattr(cls, s_loader)()
+            finally:
+                cls._sa_loading = None
+
+            # this will not produce an exhaustive list
+            cls.load_simple_overloads_from_suggestions(sa_funcs)
+
+            if sa_loaders:
+                cls._snapshot_group(sa_namespaces, sa_funcs)
+
+        if sa_loaders:
+            cls._d_load_times[" + ".join(sa_namespaces)] = (time.perf_counter() - f_start, len(sa_funcs))
+
+    @classmethod
+    def _ensure_loaded(cls, s_func):
+        if s_func in cls._set_loaded:
+            return
+
+        s_func = cls._d_operators.resolves(s_func)
+        if s_func and s_func not in cls._set_loaded:
+            cls._load_namespace(_namespace(s_func))
+
+    @classmethod
+    def _check_loading(cls, s_func):
+        if cls._sa_loading is None:
+            # defined from outside, the builtin overloads of it have to come first
+            cls._ensure_loaded(s_func)
+            cls._set_session.add(s_func)
+
+        elif _namespace(s_func) not in cls._sa_loading:
+            raise _error.Error(f"'{s_func}' is not in the namespaces of its loader, add '{_namespace(s_func)}' to Overlord.LOADERS")
+
+    @classmethod
+    def load_all(cls):
+        for s_namespace in list(cls._d_namespace_functions):
+            if any(s_func not in cls._set_loaded for s_func in cls._d_namespace_functions[s_namespace]):
+                cls._load_namespace(s_namespace)
+
+    @classmethod
+    def load_report(cls):
+        """
+        Prints how long loading the overloads of each namespace took and how much was
+        never needed. Returns {namespaces: (seconds, function count)}
+        """
+        for s_namespaces, (f_time, i_funcs) in sorted(cls._d_load_times.items(), key=lambda item: -item[1][0]):
+            print(f"{f_time * 1000:8.1f}ms {i_funcs:5} functions  {s_namespaces}")
+
+        sa_pending = [s for s, sa_funcs in cls._d_namespace_functions.items() if sa_funcs[0] not in cls._set_loaded]
+        i_pending = sum(len(cls._d_namespace_functions[s]) for s in sa_pending)
+        f_total = sum(f_time for f_time, _ in cls._d_load_times.values())
+        print(f"loaded {len(cls._set_loaded)} functions in {f_total * 1000:.1f}ms, "
+              f"{i_pending} functions in {len(sa_pending)} namespaces not loaded")
+        return dict(cls._d_load_times)
+
+    @classmethod
+    def _read_snapshot(cls, s_key):
+        path = _constants.PATH_OVERLORD_SNAPSHOT
+        if not path.exists():
+            return {}
+
+        # an outdated or broken snapshot just means the groups load the long way again
+        try:
+            d_snapshot = pickle.loads(path.read_bytes())
+        except Exception:
+            return {}
+
+        if not isinstance(d_snapshot, dict) or d_snapshot.get("key") != s_key:
+            return {}
+
+        return d_snapshot["groups"]
+
+    @classmethod
+    def _restore_group(cls, sa_namespaces):
+        if not cls._d_snapshot or sa_namespaces not in cls._d_snapshot:
+            return False
+
+        try:
+            d_group = pickle.loads(cls._d_snapshot[sa_namespaces])
+        except Exception:
+            del cls._d_snapshot[sa_namespaces]
+            return False
+
+        for s_func, d_overloads in d_group["owned_overloads"].items():
+            cls._d_operators[s_func]["overloads"] = d_overloads
+            cls._set_owned.add(s_func)
+
+        cls._d_overloads.update(d_group["overloads"])
+        return True
+
+    @classmethod
+    def _snapshot_group(cls, sa_namespaces, sa_funcs):
+        """
+        The overloads and the operator tables the loaders of a group changed, the rest
+        comes from the nodes.json in _bifres. Resolvers and type funcs are pickled as
+        references to module level functions (or partials of them), so they cant be lambdas
+        """
+        # a group with overloads of the running session in it would put them into every later session
+        if cls._d_snapshot is None or cls._set_session.intersection(sa_funcs):
+            return
+
+        # and one that fails its self tests would keep failing without anyone loading it again
+        try:
+            for s_func in sa_funcs:
+                if s_func in cls._d_overloads:
+                    cls.verify(s_func)
+        except Exception:
+            return
+
+        d_group = {
+            "owned_overloads": {s_func: cls._d_operators[s_func]["overloads"] for s_func in cls._set_owned if _namespace(s_func) in sa_namespaces},
+            "overloads": {s_func: d for s_func, d in cls._d_overloads.items() if _namespace(s_func) in sa_namespaces},
+        }
+        try:
+            cls._d_snapshot[sa_namespaces] = pickle.dumps(d_group, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # someone added a lambda, this group just keeps loading the long way
+            return
+
+        cls._write_snapshot()
+
+    @classmethod
+    def _write_snapshot(cls):
+        d_snapshot = {"key": cls._s_snapshot_key, "groups": cls._d_snapshot}
+
+        path = _constants.PATH_OVERLORD_SNAPSHOT
+        path_tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path_tmp.write_bytes(pickle.dumps(d_snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+            path_tmp.replace(path)
+        except OSError:
+            # read-only install, the groups just keep loading the long way
+            pass
 
     @classmethod
     def force_auto_ports(cls, s_func, *sa_auto_ports):
         if s_func not in cls._d_operators:
             raise _error.Error(f"Operator or compound '{s_func}' does not exist!")
 
+        cls._check_loading(s_func)
+
         d_overloads = cls._d_operators[s_func]["overloads"]
         sa_input_names = cls._d_operators[s_func]["inputs"]
         sa_output_names = cls._d_operators[s_func]["outputs"]
@@ -251,12 +545,27 @@ class Overlord:
         saa_output_types = [sa_output_first] + saa_output_types
 
         cls._d_operators[s_func]["overloads"] = {"-".join(sa_in): sa_out for sa_in, sa_out in zip(saa_input_types, saa_output_types)}
+        cls._set_owned.add(s_func)
+        cls.clear_resolved(s_func)
+
+    @classmethod
+    def add_overload(cls, s_func, s_key, sa_types_out):
+        """
+        Adds or replaces the overload s_key ("float-float") of a builtin operator
+        """
+        cls._ensure_loaded(s_func)
+        if cls._d_operators[s_func]["overloads"].get(s_key) != sa_types_out:
+            cls._set_session.add(s_func)
+            cls._own_overloads(s_func)[s_key] = sa_types_out
+            cls.clear_resolved(s_func)
 
     @classmethod
     def define_overload(cls, s_func, *types_and_funcs):
         if cls.CHECK_EXISTS and s_func not in cls._d_operators:
             raise _error.Error(f"Operator or compound '{s_func}' does not exist!")
 
+        cls._check_loading(s_func)
+
         d_overloads = cls._d_operators[s_func]["overloads"]
 
         if "auto" not in list(d_overloads.keys())[0].split("-"):
@@ -297,27 +606,63 @@ class Overlord:
         if s_func not in cls._d_overloads:
             cls._d_overloads[s_func] = []
         cls._d_overloads[s_func] += [types_and_funcs]
+        cls.clear_resolved(s_func)
+
+    @classmethod
+    def define_overload_resolver(cls, s_func, x_resolver):
+        if cls.CHECK_EXISTS and s_func not in cls._d_operators:
+            raise _error.Error(f"Operator or compound '{s_func}' does not exist!")
+
+        if not hasattr(x_resolver, "__call__"):
+            raise _error.Error("Did you mean define_overload()?")
+
+        cls._check_loading(s_func)
+
+        if s_func not in cls._d_overloads:
+            cls._d_overloads[s_func] = []
+
+        cls._d_overloads[s_func] += [x_resolver]
+        cls.clear_resolved(s_func)
+
+    @classmethod
+    def overloaded_functions(cls):
+        cls.load_all()
+        return list(cls._d_overloads)
+
+    @classmethod
+    def verify(cls, s_func):
+        """
+        Self test of the overloads defined for s_func. The default overload Bifrost
+        reported has to resolve to itself. Without resolvers, every combination of
+        suggested types has to as well if only one port has several of them.
+        Returns False if there is nothing to test and raises if a test fails
+        """
+        cls._ensure_loaded(s_func)
+        sa_input_names, _ = cls.get_port_names(s_func)
 
         sa_input_types_default, sa_output_types_default = cls._d_operators[s_func]["default_overload"]
         if "auto" in sa_input_types_default:
-            cls._sa_tests_skipped.append(s_func)
-            return
+            return False
 
-        types_in_test = [_type.Type(t) for t in sa_input_types_default]
+        types_in_test = [_type.Type.of(t) for t in sa_input_types_default]
         status, result = cls.resolve_inputs_and_outputs(s_func, input_types=types_in_test)
         if not status:
-            raise result[0](result[1])
+            raise result[0](result[1], b_stacktrace=False)
 
         if result[0] != sa_input_types_default:
             s_compare = "\n    ".join(f"{r} <> {s}" for r, s in zip(result[0], sa_input_types_default))
-            raise _error.Error(f"'{s_func}' missmatch in inputs:\n    {s_compare}")
+            raise _error.Error(f"'{s_func}' missmatch in inputs:\n    {s_compare}", b_stacktrace=False)
 
         if result[1] != sa_output_types_default:
             s_compare = "\n    ".join(f"{r} <> {s}" for r, s in zip(result[1], sa_output_types_default))
-            raise _error.Error(f"'{s_func}' missmatch in outputs:\n    {s_compare}")
+            raise _error.Error(f"'{s_func}' missmatch in outputs:\n    {s_compare}", b_stacktrace=False)
 
         saa_suggestions = cls._d_operators[s_func]["suggestions"]
 
+        # resolvers dont know about suggestions
+        if any(hasattr(overload_set, "__call__") for overload_set in cls._d_overloads.get(s_func, [])):
+            return True
+
         ba_suggestions = [len(sa) > 1 for sa in saa_suggestions]
         b_all = all([bool(sa) for sa in saa_suggestions])
         b_one = sum(ba_suggestions) == 1
@@ -332,47 +677,117 @@ class Overlord:
 
         if s_func not in sa_special_cases and b_one and b_all:
             for perm in itertools.product(*saa_suggestions):
-                perm = [_type.Type(s) for s in perm]
+                perm = [_type.Type.of(s) for s in perm]
                 status, result = cls.resolve_inputs_and_outputs(s_func, input_types=perm)
                 if not status:
-                    raise result[0](result[1])
+                    raise result[0](result[1], b_stacktrace=False)
 
                 if result[0] != perm:
                     s_compare = "\n    ".join(f"{name}: {r} <> {s}" for name, r, s in zip(sa_input_names, result[0], perm))
-                    raise _error.Error(f"'{s_func}' missmatch on suggested inputs:\n    {s_compare}")
+                    raise _error.Error(f"'{s_func}' missmatch on suggested inputs:\n    {s_compare}", b_stacktrace=False)
 
-        cls._sa_tests_done.append(s_func)
+        return True
 
     @classmethod
-    def define_overload_resolver(cls, s_func, x_resolver):
-        if cls.CHECK_EXISTS and s_func not in cls._d_operators:
-            raise _error.Error(f"Operator or compound '{s_func}' does not exist!")
+    def _dispatch_port(cls, type_, types_and_funcs):
+        """
+        What type_ turns into on the key port of an overload set: ("ok", (b_promoted, [the
+        key type, then the types its funcs derive from it])). Or why it doesnt fit, as
+        ("missing" | "invalid_value" | "invalid", s_type). This only depends on the type
+        and the set, so _resolve_inputs_and_outputs keeps the results per function
+        """
+        s_orig = type_.s
+        if type_.s not in types_and_funcs[0]:
+            if type_ == "auto":
+                return "missing", type_.s
 
-        if not hasattr(x_resolver, "__call__"):
-            raise _error.Error("Did you mean define_overload()?")
+            # the first type in PROMOTION_PRIORITY_LIST the port takes (in the same array dim) that type_ promotes to
+            type_promoted = _type.promotable_to_one_of(type_, types_and_funcs[0])
+            if type_promoted:
+                type_ = type_promoted
 
-        if s_func not in cls._d_overloads:
-            cls._d_overloads[s_func] = []
+            else:
+                # since I decided to auto promote bool to char
+                if type_.base_type().base_type() == "bool":
+                    i_arr_dim = type_.array_dim()
+                    _x_arr = lambda s, i: i*"array<" + s + i*">"
+                    promotion_list = [t for t in _type.PROMOTION_PRIORITY_LIST if _x_arr(t.s, i_arr_dim) in types_and_funcs[0]]
+                    type_ = _type.Type.of(type_.s.replace("bool", "char"))
+                    for target_type in promotion_list:
+                        if _type.promotable(type_, _type.Type.of(target_type)):
+                            type_ = _type.Type.of(target_type)
+                            break
+                    else:
+                        return "invalid_value", type_.s
+                else:
+                    return "invalid", type_.s
 
-        cls._d_overloads[s_func] += [x_resolver]
+        sa_types = [type_.s]
+        for func in types_and_funcs[1]:
+            if func is None:
+                sa_types.append(type_.s)
 
-        sa_input_types_default, sa_output_types_default = cls._d_operators[s_func]["default_overload"]
-        if "auto" in sa_input_types_default:
-            cls._sa_tests_skipped.append(s_func)
-            return
+            elif hasattr(func, "__call__"):
+                sa_types.append(func(type_.s))
 
-        types_in_test = [_type.Type(t) for t in sa_input_types_default]
-        status, result = cls.resolve_inputs_and_outputs(s_func, input_types=types_in_test)
-        if not status:
-            raise result[0](result[1])
+            elif isinstance(func, str):
+                sa_types.append(func)
 
-        if result[0] != sa_input_types_default:
-            raise _error.Error(f"'{s_func}' missmatch in inputs: {result[0]} <> {sa_input_types_default}")
+            else:
+                raise NotImplementedError
 
-        if result[1] != sa_output_types_default:
-            raise _error.Error(f"'{s_func}' missmatch in outputs: {result[1]} <> {sa_output_types_default}")
+        return "ok", (type_.s != s_orig, sa_types)
 
-        cls._sa_tests_done.append(s_func)
+    @classmethod
+    def _candidate_sets(cls, s_func, ia_auto_ports, input_types):
+        """
+        Indices of the overload sets of s_func worth trying for input_types. A set is left out
+        when the class (see _type.type_class) of a key type isnt one its port takes. Resolvers,
+        types without a class and sets that dont line up with the inputs always stay in. The
+        classes of the sets get built with the first call after their overloads changed
+        """
+        classes = tuple(_type.type_class(t) for t in input_types)
+        ta_key = (tuple(ia_auto_ports), classes)
+        d_candidates = cls._d_candidates.setdefault(s_func, {})
+        if ta_key in d_candidates:
+            return d_candidates[ta_key]
+
+        overloads = cls._d_overloads.get(s_func, [])
+        if not ia_auto_ports:
+            ia_sets = d_candidates[ta_key] = list(range(len(overloads)))
+            return ia_sets
+
+        set_classes = cls._d_set_classes.get(s_func)
+        if set_classes is None:
+            set_classes = cls._d_set_classes[s_func] = [
+                None if hasattr(overload_set, "__call__") else [_port_classes(types) for types, _ in overload_set]
+                for overload_set in overloads
+            ]
+
+        ia_sets = []
+        for i_set, port_classes in enumerate(set_classes):
+            if port_classes is None:
+                ia_sets.append(i_set)
+                continue
+
+            # the same key ports _resolve_inputs_and_outputs picks
+            ia_required = []
+            i_auto_port_index = 0
+            for types_and_funcs in overloads[i_set]:
+                if i_auto_port_index >= len(ia_auto_ports):
+                    break
+                ia_required.append(ia_auto_ports[i_auto_port_index])
+                i_auto_port_index += len(types_and_funcs[1]) + 1
+
+            if len(ia_required) != len(port_classes) or ia_required[-1] >= len(input_types):
+                ia_sets.append(i_set)
+                continue
+
+            if all(classes[idx] is None or classes[idx] in set_port for idx, set_port in zip(ia_required, port_classes)):
+                ia_sets.append(i_set)
+
+        d_candidates[ta_key] = ia_sets
+        return ia_sets
 
     @classmethod
     def _resolve_inputs_and_outputs(cls, s_func, d_operator, sa_input_port_types, sa_output_port_types, input_types):
@@ -441,155 +856,131 @@ class Overlord:
             #     print(i, s_auto_name, s_type)
             print(f"\n    evaluating overload sets (total: {len(overloads)})")
 
-        result = None
-        for _, overload_set in enumerate(overloads):
-            sa_all_ports = sa_all_ports_orig[:]
-            ba_all_promoted = len(sa_all_ports) * [False]
+        # how each key type did on each port of each overload set so far, see _dispatch_port()
+        d_dispatch = cls._d_dispatch.setdefault(s_func, {})
 
-            if b_debug:
-                print(f"        overload set: {_}, {str(overload_set)[:30]}...")
-                print(f"            ports: {sa_all_ports}")
-                print(f"            callable: {hasattr(overload_set, '__call__')}")
+        # only the sets the index lets through. The others cant resolve, but if nothing does the
+        # error is the one of the last set, so that one still runs
+        ia_candidates = cls._candidate_sets(s_func, ia_auto_ports, input_types)
+        for ia_sets in (ia_candidates, [len(overloads) - 1]):
+            result = None
+            for i_set in ia_sets:
+                overload_set = overloads[i_set]
+                sa_all_ports = sa_all_ports_orig[:]
+                ba_all_promoted = len(sa_all_ports) * [False]
 
-            if hasattr(overload_set, "__call__"):
-                input_types_copy = ([_type.Type(t.s) for t in input_types])
-                status, result1 = overload_set(tuple(sa_names_in), tuple(sa_names_out), sa_input_port_types[:], sa_output_port_types[:], input_types_copy)
-                if status:
-                    if len(result1[0]) != len(sa_names_in):
-                        raise _error.Error(f"'{s_func}' returned the wrong number of input port types")
+                if b_debug:
+                    print(f"        overload set: {i_set}, {str(overload_set)[:30]}...")
+                    print(f"            ports: {sa_all_ports}")
+                    print(f"            callable: {hasattr(overload_set, '__call__')}")
 
-                    if len(result1[1]) != len(sa_names_out):
-                        raise _error.Error(f"'{s_func}' returned the wrong number of output port types")
+                if hasattr(overload_set, "__call__"):
+                    input_types_copy = ([_type.Type.of(t.s) for t in input_types])
+                    status, result1 = overload_set(tuple(sa_names_in), tuple(sa_names_out), sa_input_port_types[:], sa_output_port_types[:], input_types_copy)
+                    if status:
+                        if len(result1[0]) != len(sa_names_in):
+                            raise _error.Error(f"'{s_func}' returned the wrong number of input port types")
 
-                    return True, result1
+                        if len(result1[1]) != len(sa_names_out):
+                            raise _error.Error(f"'{s_func}' returned the wrong number of output port types")
 
-                result = result1
-                continue
+                        return True, result1
 
-            result = None
-
-            # required auto types, the rest will be inferred
-            ia_required = []
-            if ia_auto_ports:
-                i_auto_port_index = 0
-                # index = ia_auto_ports[0]
-                for types_and_funcs in overload_set:
-                    # print(ia_required, ia_auto_ports, i_auto_port_index)
-                    ia_required.append(ia_auto_ports[i_auto_port_index])
-                    i_auto_port_index += len(types_and_funcs[1]) + 1
-
-                if ia_required and ia_required[-1] >= len(input_types):
-                    if ia_required[-1] >= len(input_types):
-                        print(f"inputs: {len(input_types)}")
-                        print(f"auto: {len(ia_auto_ports)}")
-                        print(f"auto: {ia_auto_ports}")
-                        raise _error.Error(f"Too many key types: '{s_func}'")
-
-                    result = (_error.BfTypeError, f"Cant infer type for port '{d_operator['inputs'][ia_required[-1]]}'")
+                    result = result1
                     continue
 
-            required_types = [input_types[idx] for idx in ia_required]
-            sa_required_names = [sa_names_in[idx] for idx in ia_required]
-
-            if b_debug:
-                print(f"            required: {[t.s for t in required_types]}")
+                result = None
+
+                # required auto types, the rest will be inferred
+                ia_required = []
+                if ia_auto_ports:
+                    i_auto_port_index = 0
+                    # index = ia_auto_ports[0]
+                    for types_and_funcs in overload_set:
+                        # print(ia_required, ia_auto_ports, i_auto_port_index)
+                        ia_required.append(ia_auto_ports[i_auto_port_index])
+                        i_auto_port_index += len(types_and_funcs[1]) + 1
+
+                    if ia_required and ia_required[-1] >= len(input_types):
+                        if ia_required[-1] >= len(input_types):
+                            print(f"inputs: {len(input_types)}")
+                            print(f"auto: {len(ia_auto_ports)}")
+                            print(f"auto: {ia_auto_ports}")
+                            raise _error.Error(f"Too many key types: '{s_func}'")
+
+                        result = (_error.BfTypeError, f"Cant infer type for port '{d_operator['inputs'][ia_required[-1]]}'")
+                        continue
 
-            # list of types
-            sa_auto_types = []
-            ba_promoted = []
+                required_types = [input_types[idx] for idx in ia_required]
+                sa_required_names = [sa_names_in[idx] for idx in ia_required]
 
-            if ia_auto_ports:
-                index = ia_auto_ports[0]
+                if b_debug:
+                    print(f"            required: {[t.s for t in required_types]}")
 
-            b_break = False
+                # list of types
+                sa_auto_types = []
+                ba_promoted = []
 
-            for name_, type_, types_and_funcs in zip(sa_required_names, required_types, overload_set):
-                if b_debug:
-                    print(f"                resolving port '{name_}': {type_}")
+                if ia_auto_ports:
+                    index = ia_auto_ports[0]
 
-                # if there are already suggested types somewhere, might as well make use of them...
-                if type_.s == "auto":
-                    saa_suggestions = cls._d_operators[s_func]["suggestions"]
-                    if index < len(saa_suggestions) and saa_suggestions[index]:
-                        type_ = _type.Type(saa_suggestions[index][0])
+                b_break = False
 
-                s_orig = type_.s
-                if type_.s not in types_and_funcs[0]:
+                for i_port, (name_, type_, types_and_funcs) in enumerate(zip(sa_required_names, required_types, overload_set)):
                     if b_debug:
-                        print(f"    [{name_}] {type_.s} not in {types_and_funcs[0]}")
+                        print(f"                resolving port '{name_}': {type_}")
+
+                    # if there are already suggested types somewhere, might as well make use of them...
+                    if type_.s == "auto":
+                        saa_suggestions = cls._d_operators[s_func]["suggestions"]
+                        if index < len(saa_suggestions) and saa_suggestions[index]:
+                            type_ = _type.Type.of(saa_suggestions[index][0])
+
+                    ta_key = (i_set, i_port, type_.s)
+                    dispatched = d_dispatch.get(ta_key)
+                    if dispatched is None:
+                        dispatched = d_dispatch[ta_key] = cls._dispatch_port(type_, types_and_funcs)
 
-                    if type_ == "auto":
+                    s_status, x_result = dispatched
+                    if s_status == "missing":
                         result = (_error.BfTypeError, f"Missing required argument for port '{d_operator['inputs'][index]}'")
                         b_break = True
                         break
 
-                    i_arr_dim = type_.array_dim()
-                    _x_arr = lambda s, i: i*"array<" + s + i*">"
-                    promotion_list = [t for t in _type.PROMOTION_PRIORITY_LIST if _x_arr(t.s, i_arr_dim) in types_and_funcs[0]]
-
-                    for target_type in promotion_list:
-                        type_base = type_.base_type() if type_.is_array() else type_
-                        if _type.promotable(type_base, _type.Type(target_type)):
-                            type_ = _type.Type(i_arr_dim * "array<" + target_type.s + i_arr_dim * ">")
-                            break
-
-                    else:
-                        # since I decided to auto promote bool to char
-                        if type_.base_type().base_type() == "bool":
-                            type_ = _type.Type(type_.s.replace("bool", "char"))
-                            for target_type in promotion_list:
-                                if _type.promotable(type_, _type.Type(target_type)):
-                                    type_ = _type.Type(target_type)
-                                    break
-                            else:
-                                result = (_error.BfTypeError, f"Invalid value type '{type_}' for port '{d_operator['inputs'][index]}'")
-                                b_break = True
-                                break
-                        else:
-                            result = (_error.BfTypeError, f"Invalid type '{type_}' for port '{d_operator['inputs'][index]}'")
-                            b_break = True
-                            break
-
-                ba_promoted.append(type_.s != s_orig)
-                sa_auto_types.append(type_.s)
+                    if s_status == "invalid_value":
+                        result = (_error.BfTypeError, f"Invalid value type '{x_result}' for port '{d_operator['inputs'][index]}'")
+                        b_break = True
+                        break
 
-                for func in types_and_funcs[1]:
-                    ba_promoted.append(ba_promoted[-1])
-                    index += 1
-                    if func is None:
-                        sa_auto_types.append(type_.s)
-                        if b_debug:
-                            print(f"                        -> {sa_auto_types[-1]}")
-                        continue
+                    if s_status == "invalid":
+                        result = (_error.BfTypeError, f"Invalid type '{x_result}' for port '{d_operator['inputs'][index]}'")
+                        b_break = True
+                        break
 
-                    elif hasattr(func, "__call__"):
-                        sa_auto_types.append(func(type_.s))
-                        if b_debug:
-                            print(f"                        -> {sa_auto_types[-1]}")
-                        continue
+                    # the key type and the ones its type funcs derived from it
+                    b_promoted, sa_types = x_result
+                    ba_promoted += len(sa_types) * [b_promoted]
+                    sa_auto_types += sa_types
+                    index += len(sa_types) - 1
+                    if b_debug:
+                        print(f"                        -> {sa_types}")
 
-                    elif isinstance(func, str):
-                        sa_auto_types.append(func)
-                        if b_debug:
-                            print(f"                        -> {sa_auto_types[-1]}")
-                        continue
+                if b_break:
+                    continue
 
-                    else:
-                        raise NotImplementedError
+                for idx, type_, b_promoted in zip(ia_auto_ports, sa_auto_types, ba_promoted):
+                    sa_all_ports[idx] = type_
+                    ba_all_promoted[idx] = b_promoted
 
-            if b_break:
-                continue
-
-            for idx, type_, b_promoted in zip(ia_auto_ports, sa_auto_types, ba_promoted):
-                sa_all_ports[idx] = type_
-                ba_all_promoted[idx] = b_promoted
+                if b_debug:
+                    print(f"         -> {sa_all_ports}")
 
-            if b_debug:
-                print(f"         -> {sa_all_ports}")
+                if sa_all_ports not in saa_possible_resolutions:
+                    saa_possible_resolutions.append(sa_all_ports)
+                    baa_promoted_info.append(ba_all_promoted)
 
-            if sa_all_ports not in saa_possible_resolutions:
-                saa_possible_resolutions.append(sa_all_ports)
-                baa_promoted_info.append(ba_all_promoted)
+            if saa_possible_resolutions or not input_types or not overloads or ia_candidates[-1:] == [len(overloads) - 1]:
+                break
 
         if not saa_possible_resolutions and input_types:
             if not result:
@@ -649,9 +1040,9 @@ class Overlord:
                     else:
                         s_target = f"{s_target[1]}D-array"
 
-                # i_compat = _type.compatibility(_type.Type(s_target), _type.Type(s_input))
+                # i_compat = _type.compatibility(_type.Type.of(s_target), _type.Type.of(s_input))
                 # if i_compat != 0 and i_compat - _type.NUMERIC_AUTO_CONVERSION != 0:
-                if not _type.promotable(_type.Type(input_type), _type.Type(s_target)):
+                if not _type.promotable(_type.Type.of(input_type), _type.Type.of(s_target)):
                     s_msg = f"Cant promote '{input_type}' to '{s_target}' on port '{d_operator['inputs'][i]}'"
                     result = _error.BfTypeError, s_msg
                     if b_debug:
@@ -684,17 +1075,17 @@ class Overlord:
 
             # check if those types have the same vector/matrix dimensionality
             sa_ref_inputs, sa_ref_outputs = valid_results[0]
-            sa_ref_inputs = [t.base_type().s if t.is_array() else t.s for t in [_type.Type(s) for s in sa_ref_inputs]]
+            sa_ref_inputs = [t.base_type().s if t.is_array() else t.s for t in [_type.Type.of(s) for s in sa_ref_inputs]]
 
             print(f"        ref: {[s for s in sa_ref_inputs]}")
 
             for sa_other_inputs, sa_other_outputs in valid_results[1:]:
-                sa_other_inputs = [t.base_type().s if t.is_array() else t.s for t in [_type.Type(s) for s in sa_other_inputs]]
+                sa_other_inputs = [t.base_type().s if t.is_array() else t.s for t in [_type.Type.of(s) for s in sa_other_inputs]]
 
                 b_break = False
                 for i, (ref, other) in enumerate(zip(sa_ref_inputs, sa_other_inputs)):
-                    ref = _type.Type(ref)
-                    other = _type.Type(other)
+                    ref = _type.Type.of(ref)
+                    other = _type.Type.of(other)
                     if ref.vector_dim() == other.vector_dim() and ref.matrix_dim() and other.matrix_dim():
                         continue
 
@@ -718,17 +1109,110 @@ class Overlord:
     def functions(cls):
         return cls._d_operators
 
+    @classmethod
+    def resolve_structured(cls, s_func, input_types):
+        """
+        resolve_inputs_and_outputs() for tools. Takes type strings or Types and never
+        raises, the result is {"status": True, "inputs": [...], "outputs": [...]} or
+        {"status": False, "error": <exception class>, "message": "..."}
+        """
+        try:
+            status, result = cls.resolve_inputs_and_outputs(s_func, [_type.Type.of(t) for t in input_types])
+        except Exception as e:
+            return {"status": False, "error": type(e), "message": e.message() if isinstance(e, _error.Error) else str(e)}
+
+        if status:
+            return {"status": True, "inputs": result[0], "outputs": result[1]}
+        return {"status": False, "error": result[0], "message": result[1]}
+
+    @classmethod
+    def resolve_batch(cls, calls, i_jobs=1):
+        """
+        Resolves a list of (s_func, input types) pairs, like all calls in a library or
+        all permutations of suggested types. Identical signatures only get resolved once,
+        all of them share the memoized resolutions and the dispatch index. With i_jobs > 1
+        the unique signatures are grouped by function and spread over a process pool.
+        The workers run their own init() from the nodes file, so they only know the builtin
+        overloads. That is refused once the session changed any of them, see add_overload().
+        Returns one resolve_structured() dict per call, in order
+        """
+        if i_jobs > 1 and cls._path_nodes is None:
+            raise _error.Error("Overlord.init() has to run before resolve_batch() can use a process pool")
+        if i_jobs > 1 and cls._set_session:
+            raise _error.Error(f"The process pool of resolve_batch() would miss the overloads this session defined for {sorted(cls._set_session)}, use i_jobs=1")
+
+        ta_keys = []
+        d_unique = {}
+        for i, (s_func, input_types) in enumerate(calls):
+            try:
+                types = [_type.Type.of(t) for t in input_types]
+            except Exception:
+                # same error dict as a single call would give, the other calls still resolve
+                types = None
+
+            # nodes with several outputs cant be told apart by their type string
+            if types is None or any(t.is_node() and len(t.node_data()) != 1 for t in types):
+                ta_key = i
+                d_unique[ta_key] = cls.resolve_structured(s_func, input_types if types is None else types)
+            else:
+                ta_key = (s_func, tuple(t.s for t in types))
+                d_unique.setdefault(ta_key, None)
+            ta_keys.append(ta_key)
+
+        ta_todo = sorted(ta_key for ta_key, d_result in d_unique.items() if d_result is None)
+        if i_jobs > 1 and len(ta_todo) > i_jobs:
+            i_chunk = -(-len(ta_todo) // (4 * i_jobs))
+            chunks = [ta_todo[i:i + i_chunk] for i in range(0, len(ta_todo), i_chunk)]
+            with concurrent.futures.ProcessPoolExecutor(i_jobs, initializer=_init_batch_worker, initargs=(str(cls._path_nodes),)) as pool:
+                results = [d_result for chunk_results in pool.map(_resolve_chunk, chunks) for d_result in chunk_results]
+        else:
+            results = _resolve_chunk(ta_todo)
+
+        d_unique.update(zip(ta_todo, results))
+
+        # every call gets its own lists
+        results = []
+        for ta_key in ta_keys:
+            d_result = d_unique[ta_key]
+            if d_result["status"]:
+                d_result = {**d_result, "inputs": d_result["inputs"][:], "outputs": d_result["outputs"][:]}
+            results.append(d_result)
+        return results
+
     @classmethod
     def resolve_inputs_and_outputs(cls, s_func, input_types):
         if s_func not in cls._d_operators:
             return False, (_error.BfNameError, f"Operator/compound '{s_func}' does not exist!")
 
+        if s_func not in cls._set_loaded:
+            cls._load_namespace(_namespace(s_func))
+
         d_operator = cls._d_operators[s_func]
 
         for i in range(len(input_types)):
             if input_types[i].is_node() and len(input_types[i].node_data()) == 1:
                 input_types[i] = list(input_types[i].node_data().values())[0]
 
+        # nodes with several outputs all look the same as a string, dont memoize those
+        if not _constants.CACHE_RESOLVED_OVERLOADS or any(t.is_node() for t in input_types):
+            return cls._resolve_overloads(s_func, d_operator, input_types)
+
+        d_resolved = cls._d_resolved.setdefault(s_func, {})
+        ta_key = tuple(t.s for t in input_types)
+        if ta_key in d_resolved:
+            cls.i_resolve_hits += 1
+            status, result = d_resolved[ta_key]
+        else:
+            cls.i_resolve_misses += 1
+            status, result = d_resolved[ta_key] = cls._resolve_overloads(s_func, d_operator, input_types)
+
+        # callers are free to keep and change the lists they get back
+        if status:
+            return status, (result[0][:], result[1][:])
+        return status, result
+
+    @classmethod
+    def _resolve_overloads(cls, s_func, d_operator, input_types):
         # print(s_func,  30 * "=")
         d_overloads = d_operator["overloads"]
         result = (_error.BfNameError, f"No matching overload found for '{s_func}'")
@@ -745,18 +1229,48 @@ class Overlord:
             )
             if status:
                 # print(" -- RESOLVED --")
-                return status, ([_type.Type(t).s for t in result[0]], [_type.Type(t).s for t in result[1]])
+                return status, ([_type.Type.of(t).s for t in result[0]], [_type.Type.of(t).s for t in result[1]])
 
             # print(result)
 
         return False, result
 
+    @classmethod
+    def clear_resolved(cls, s_func=None):
+        """
+        Forgets the memoized resolutions of s_func, or all of them and the stats
+        """
+        if s_func is None:
+            cls._d_resolved = {}
+            cls._d_dispatch = {}
+            cls._d_set_classes = {}
+            cls._d_candidates = {}
+            cls.i_resolve_hits = 0
+            cls.i_resolve_misses = 0
+        else:
+            cls._d_resolved.pop(s_func, None)
+            cls._d_dispatch.pop(s_func, None)
+            cls._d_set_classes.pop(s_func, None)
+            cls._d_candidates.pop(s_func, None)
+
+    @classmethod
+    def resolve_stats(cls):
+        i_calls = cls.i_resolve_hits + cls.i_resolve_misses
+        return {
+            "hits": cls.i_resolve_hits,
+            "misses": cls.i_resolve_misses,
+            "hit_rate": cls.i_resolve_hits / i_calls if i_calls else 0.0,
+            "functions": len(cls._d_resolved),
+            "entries": sum(len(d) for d in cls._d_resolved.values()),
+        }
+
     @classmethod
     def function(cls, s_func):
         return cls._d_operators.resolves(s_func)
 
     @classmethod
     def get_port_types(cls, s_func):
+        cls._ensure_loaded(s_func)
         d_op = cls._d_operators[s_func]
         s_key = list(d_op["overloads"].keys())[0]
         sa_input_types = s_key.split("-")
@@ -765,6 +1279,7 @@ class Overlord:
 
     @classmethod
     def get_all_port_types(cls, s_func):
+        cls._ensure_loaded(s_func)
         d_op = cls._d_operators[s_func]
         saa_input_types = []
         saa_output_types = []
@@ -809,57 +1324,57 @@ class Overlord:
 
         cls.define_overload(
                 "Core::Type_Conversion::to_bool",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "bool")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="bool")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_char",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "char")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="char")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_unsigned_char",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "uchar")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="uchar")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_short",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "short")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="short")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_unsigned_short",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "ushort")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="ushort")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_int",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "int")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="int")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_unsigned_int",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "uint")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="uint")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_long",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "long")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="long")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_unsigned_long",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "ulong")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="ulong")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_float",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "float")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="float")])
         )
 
         cls.define_overload(
                 "Core::Type_Conversion::to_double",
-                (FLOATING | INTEGER | BOOL, [lambda x: _replace_base(x, "double")])
+                (FLOATING | INTEGER | BOOL, [functools.partial(_replace_base, s="double")])
         )
 
         cls.define_overload(
@@ -873,11 +1388,11 @@ class Overlord:
         )
 
         cls.force_auto_ports("Core::String::number_to_string", "string")
-        cls.define_overload("Core::String::number_to_string", ((NUMERIC | BOOL) & SIMPLE, [lambda x: _replace_full_base(x, "string")]))
+        cls.define_overload("Core::String::number_to_string", ((NUMERIC | BOOL) & SIMPLE, [functools.partial(_replace_full_base, s="string")]))
 
         cls.define_overload("Core::Conversion::vector2_to_scalar", (NUMERIC & VECTOR2, [_to_scalar, _to_scalar]))
         cls.define_overload("Core::Conversion::vector3_to_scalar", (NUMERIC & VECTOR3, [_to_scalar, _to_scalar, _to_scalar]))
-        cls.define_overload("Core::Conversion::vector3_to_scalar", (FIELD3, [lambda x: _replace_full_base(x, "Core::Fields::ScalarField"), lambda x: _replace_full_base(x, "Core::Fields::ScalarField"), lambda x: _replace_full_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Conversion::vector3_to_scalar", (FIELD3, [functools.partial(_replace_full_base, s="Core::Fields::ScalarField"), functools.partial(_replace_full_base, s="Core::Fields::ScalarField"), functools.partial(_replace_full_base, s="Core::Fields::ScalarField")]))
         cls.define_overload("Core::Conversion::vector4_to_scalar", (NUMERIC & VECTOR4, [_to_scalar, _to_scalar, _to_scalar, _to_scalar]))
         cls.define_overload("Core::Conversion::vector4_to_vector3", (NUMERIC & VECTOR4, [_to_vec3, _to_scalar]))
 
@@ -988,12 +1503,12 @@ class Overlord:
         cls.define_overload_resolver("Core::Logic::if", _resolver.if_)
         cls.define_overload_resolver("Core::Logic::members_if", _resolver.members_if)
 
-        cls.define_overload_resolver("Core::Logic::equal", lambda *args: _resolver.compare(*args, op="=="))
-        cls.define_overload_resolver("Core::Logic::not_equal", lambda *args: _resolver.compare(*args, op="!="))
-        cls.define_overload_resolver("Core::Logic::greater_or_equal", lambda *args: _resolver.compare(*args, op=">="))
-        cls.define_overload_resolver("Core::Logic::less_or_equal", lambda *args: _resolver.compare(*args, op="<=>="))
-        cls.define_overload_resolver("Core::Logic::greater", lambda *args: _resolver.compare(*args, op="=>"))
-        cls.define_overload_resolver("Core::Logic::less", lambda *args: _resolver.compare(*args, op="<"))
+        cls.define_overload_resolver("Core::Logic::equal", functools.partial(_resolver.compare, op="=="))
+        cls.define_overload_resolver("Core::Logic::not_equal", functools.partial(_resolver.compare, op="!="))
+        cls.define_overload_resolver("Core::Logic::greater_or_equal", functools.partial(_resolver.compare, op=">="))
+        cls.define_overload_resolver("Core::Logic::less_or_equal", functools.partial(_resolver.compare, op="<=>="))
+        cls.define_overload_resolver("Core::Logic::greater", functools.partial(_resolver.compare, op="=>"))
+        cls.define_overload_resolver("Core::Logic::less", functools.partial(_resolver.compare, op="<"))
 
         cls.define_overload("Core::Logic::almost_equal", ((FLOATING - MATRIX) | (FLOATING & MATRIX_SQUARE), [None, None]))
 
@@ -1004,12 +1519,12 @@ class Overlord:
         cls.define_overload("Core::Logic::not", (BOOL, [None]))
 
         cls.force_auto_ports("Core::Logic::all_members_true", "output")
-        cls.define_overload("Core::Logic::all_members_true", (BOOL & (VECTOR | MATRIX), [lambda x: _replace_full_base(x, "bool")]))
+        cls.define_overload("Core::Logic::all_members_true", (BOOL & (VECTOR | MATRIX), [functools.partial(_replace_full_base, s="bool")]))
 
         cls.force_auto_ports("Core::Logic::any_members_true", "output")
-        cls.define_overload("Core::Logic::any_members_true", (BOOL & (VECTOR | MATRIX), [lambda x: _replace_full_base(x, "bool")]))
+        cls.define_overload("Core::Logic::any_members_true", (BOOL & (VECTOR | MATRIX), [functools.partial(_replace_full_base, s="bool")]))
 
-        cls.define_overload("Core::Logic::any_members_true", (BOOL & (VECTOR | MATRIX), [lambda x: _replace_full_base(x, "bool")]))
+        cls.define_overload("Core::Logic::any_members_true", (BOOL & (VECTOR | MATRIX), [functools.partial(_replace_full_base, s="bool")]))
 
         cls.define_overload_resolver("Core::Logic::members_equal", _resolver.members)
         cls.define_overload_resolver("Core::Logic::members_not_equal", _resolver.members)
@@ -1021,8 +1536,8 @@ class Overlord:
     @classmethod
     def load_math_overloads(cls):
         cls.define_overload("Core::Math::absolute_value", (NUMERIC - UNSIGNED, [None]))
-        cls.define_overload("Core::Math::absolute_value", (LONG & UNSIGNED, [lambda x: _replace_base(x, "double")]))
-        cls.define_overload("Core::Math::absolute_value", (INT & UNSIGNED, [lambda x: _replace_base(x, "float")]))
+        cls.define_overload("Core::Math::absolute_value", (LONG & UNSIGNED, [functools.partial(_replace_base, s="double")]))
+        cls.define_overload("Core::Math::absolute_value", (INT & UNSIGNED, [functools.partial(_replace_base, s="float")]))
 
         cls.define_overload_resolver("Core::Math::remainder", _resolver.remainder)
         cls.define_overload_resolver("Core::Math::modulo", _resolver.modulo)
@@ -1057,24 +1572,24 @@ class Overlord:
 
         cls.define_overload("Core::Math::normalize", ((FLOATING & VECTOR) - BIG, [None]))  #lambda x: _replace_base(x, "float")]))
         cls.define_overload("Core::Math::normalize", ((FLOATING & VECTOR) & BIG, [None]))  #lambda x: _replace_base(x, "double")]))
-        cls.define_overload("Core::Math::normalize", (FIELD3, [lambda x: _replace_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Math::normalize", (FIELD3, [functools.partial(_replace_base, s="Core::Fields::ScalarField")]))
 
-        cls.define_overload("Core::Math::length", ((FLOATING & VECTOR) - BIG, [lambda x: _replace_full_base(x, "float")]))
-        cls.define_overload("Core::Math::length", ((FLOATING & VECTOR) & BIG, [lambda x: _replace_full_base(x, "double")]))
-        cls.define_overload("Core::Math::length", (FIELD3, [lambda x: _replace_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Math::length", ((FLOATING & VECTOR) - BIG, [functools.partial(_replace_full_base, s="float")]))
+        cls.define_overload("Core::Math::length", ((FLOATING & VECTOR) & BIG, [functools.partial(_replace_full_base, s="double")]))
+        cls.define_overload("Core::Math::length", (FIELD3, [functools.partial(_replace_base, s="Core::Fields::ScalarField")]))
 
         cls.define_overload_resolver("Core::Math::distance", _resolver.distance)
         cls.define_overload_resolver("Core::Math::distance_float_ULP", _resolver.distance_float_ULP)
         cls.define_overload_resolver("Core::Math::equivalent_float_ULP", _resolver.equivalent_float_ULP)
         cls.define_overload_resolver("Core::Math::equivalent_float_epsilon", _resolver.equivalent_float_epsilon)
 
-        cls.define_overload("Core::Math::length_squared", ((FLOATING & VECTOR) - BIG, [lambda x: _replace_full_base(x, "float")]))
-        cls.define_overload("Core::Math::length_squared", ((FLOATING & VECTOR) & BIG, [lambda x: _replace_full_base(x, "double")]))
-        cls.define_overload("Core::Math::length_squared", (FIELD3, [lambda x: _replace_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Math::length_squared", ((FLOATING & VECTOR) - BIG, [functools.partial(_replace_full_base, s="float")]))
+        cls.define_overload("Core::Math::length_squared", ((FLOATING & VECTOR) & BIG, [functools.partial(_replace_full_base, s="double")]))
+        cls.define_overload("Core::Math::length_squared", (FIELD3, [functools.partial(_replace_base, s="Core::Fields::ScalarField")]))
 
-        cls.define_overload("Core::Math::direction_and_length", ((FLOATING & VECTOR) - BIG, [None, lambda x: _replace_full_base(x, "float"), lambda x: _replace_full_base(x, "float")]))
-        cls.define_overload("Core::Math::direction_and_length", ((FLOATING & VECTOR) & BIG, [None, lambda x: _replace_full_base(x, "double"), lambda x: _replace_full_base(x, "double")]))
-        cls.define_overload("Core::Math::direction_and_length", (FIELD3, [None, lambda x: _replace_full_base(x, "Core::Fields::ScalarField"), lambda x: _replace_full_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Math::direction_and_length", ((FLOATING & VECTOR) - BIG, [None, functools.partial(_replace_full_base, s="float"), functools.partial(_replace_full_base, s="float")]))
+        cls.define_overload("Core::Math::direction_and_length", ((FLOATING & VECTOR) & BIG, [None, functools.partial(_replace_full_base, s="double"), functools.partial(_replace_full_base, s="double")]))
+        cls.define_overload("Core::Math::direction_and_length", (FIELD3, [None, functools.partial(_replace_full_base, s="Core::Fields::ScalarField"), functools.partial(_replace_full_base, s="Core::Fields::ScalarField")]))
 
         cls.define_overload_resolver("Core::Math::cross", _resolver.cross)
         cls.define_overload_resolver("Core::Math::dot", _resolver.dot)
@@ -1104,14 +1619,14 @@ class Overlord:
         cls.define_overload("Core::Math::project_vector", (FIELD3, [None, None, None]))
 
         for s in ["sin", "cos", "tan"]:
-            cls.define_overload(f"Core::Math::{s}", (NUMERIC - BIG, [lambda x: _replace_base(x, "float")]))
-            cls.define_overload(f"Core::Math::{s}", (NUMERIC & BIG, [lambda x: _replace_base(x, "double")]))
-            cls.define_overload(f"Core::Math::{s}_hyperbolic", (NUMERIC - BIG, [lambda x: _replace_base(x, "float")]))
-            cls.define_overload(f"Core::Math::{s}_hyperbolic", (NUMERIC & BIG, [lambda x: _replace_base(x, "double")]))
-            cls.define_overload(f"Core::Math::a{s}", (NUMERIC - BIG, [lambda x: _replace_base(x, "float")]))
-            cls.define_overload(f"Core::Math::a{s}", (NUMERIC & BIG, [lambda x: _replace_base(x, "double")]))
-            cls.define_overload(f"Core::Math::a{s}_hyperbolic", (NUMERIC - BIG, [lambda x: _replace_base(x, "float")]))
-            cls.define_overload(f"Core::Math::a{s}_hyperbolic", (NUMERIC & BIG, [lambda x: _replace_base(x, "double")]))
+            cls.define_overload(f"Core::Math::{s}", (NUMERIC - BIG, [functools.partial(_replace_base, s="float")]))
+            cls.define_overload(f"Core::Math::{s}", (NUMERIC & BIG, [functools.partial(_replace_base, s="double")]))
+            cls.define_overload(f"Core::Math::{s}_hyperbolic", (NUMERIC - BIG, [functools.partial(_replace_base, s="float")]))
+            cls.define_overload(f"Core::Math::{s}_hyperbolic", (NUMERIC & BIG, [functools.partial(_replace_base, s="double")]))
+            cls.define_overload(f"Core::Math::a{s}", (NUMERIC - BIG, [functools.partial(_replace_base, s="float")]))
+            cls.define_overload(f"Core::Math::a{s}", (NUMERIC & BIG, [functools.partial(_replace_base, s="double")]))
+            cls.define_overload(f"Core::Math::a{s}_hyperbolic", (NUMERIC - BIG, [functools.partial(_replace_base, s="float")]))
+            cls.define_overload(f"Core::Math::a{s}_hyperbolic", (NUMERIC & BIG, [functools.partial(_replace_base, s="double")]))
 
         cls.define_overload_resolver("Core::Math::atan_2D", _resolver.atan_2D)
 
@@ -1121,9 +1636,9 @@ class Overlord:
 
         cls.define_overload("Core::Math::transpose_matrix", (MATRIX, [_transpose]))
         cls.define_overload("Core::Math::inverse_matrix", (FLOATING & MATRIX_SQUARE, [None]))
-        cls.define_overload("Core::Math::matrix_determinant", (MATRIX_SQUARE - BIG, [lambda x: _replace_full_base(x, "float")]))
-        cls.define_overload("Core::Math::matrix_determinant", (MATRIX_SQUARE & BIG, [lambda x: _replace_full_base(x, "double")]))
-        cls.define_overload("Core::Math::matrix_is_identity", (MATRIX, [lambda x: _replace_full_base(x, "bool")]))
+        cls.define_overload("Core::Math::matrix_determinant", (MATRIX_SQUARE - BIG, [functools.partial(_replace_full_base, s="float")]))
+        cls.define_overload("Core::Math::matrix_determinant", (MATRIX_SQUARE & BIG, [functools.partial(_replace_full_base, s="double")]))
+        cls.define_overload("Core::Math::matrix_is_identity", (MATRIX, [functools.partial(_replace_full_base, s="bool")]))
 
         cls.define_overload("Core::Math::matrix_to_quaternion", (FLOATING & MATRIX3x3, [_to_vec4]))
         cls.define_overload("Core::Math::matrix_to_SRT", (FLOATING & MATRIX4x4, [_to_vec3, _to_vec3, _to_vec4, _to_vec3]))
@@ -1163,17 +1678,17 @@ class Overlord:
         cls.define_overload("Geometry::Strands::create_strands_from_counts", (INTEGER & ARRAY1, []))
         cls.define_overload("Geometry::Instances::flatten_instance_selection", (OBJECT - ARRAY, ["array<long>", "array<Object>"]))
 
-        cls.define_overload("Geometry::Query::get_closest_locations", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [lambda x: _replace_full_base(x, "Geometry::Common::GeoLocation"), lambda x: _replace_full_base(x, "bool")]))
-        cls.define_overload("Geometry::Query::get_closest_point", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [lambda x: _replace_full_base(x, "Geometry::Common::GeoLocation"), lambda x: _replace_full_base(x, "long"), lambda x: _replace_full_base(x, "bool")]))
-        cls.define_overload("Geometry::Query::sample_closest_accelerator", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [lambda x: _replace_full_base(x, "Geometry::Common::GeoLocation"), lambda x: _replace_full_base(x, "bool")]))
-        cls.define_overload("Geometry::Query::sample_closest_point_accelerator", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [lambda x: _replace_full_base(x, "long"), lambda x: _replace_full_base(x, "bool")]))
-        cls.define_overload("Geometry::Query::get_points_in_radius", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [lambda x: _replace_full_base(x, "array<Geometry::Common::GeoLocation>"), lambda x: _replace_full_base(x, "array<long>")]))
-        cls.define_overload("Geometry::Query::sample_closest_in_radius_accelerator", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [lambda x: _replace_full_base(x, "array<long>")]))
+        cls.define_overload("Geometry::Query::get_closest_locations", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [functools.partial(_replace_full_base, s="Geometry::Common::GeoLocation"), functools.partial(_replace_full_base, s="bool")]))
+        cls.define_overload("Geometry::Query::get_closest_point", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [functools.partial(_replace_full_base, s="Geometry::Common::GeoLocation"), functools.partial(_replace_full_base, s="long"), functools.partial(_replace_full_base, s="bool")]))
+        cls.define_overload("Geometry::Query::sample_closest_accelerator", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [functools.partial(_replace_full_base, s="Geometry::Common::GeoLocation"), functools.partial(_replace_full_base, s="bool")]))
+        cls.define_overload("Geometry::Query::sample_closest_point_accelerator", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [functools.partial(_replace_full_base, s="long"), functools.partial(_replace_full_base, s="bool")]))
+        cls.define_overload("Geometry::Query::get_points_in_radius", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [functools.partial(_replace_full_base, s="array<Geometry::Common::GeoLocation>"), functools.partial(_replace_full_base, s="array<long>")]))
+        cls.define_overload("Geometry::Query::sample_closest_in_radius_accelerator", ((FLOAT & VECTOR3) - ARRAY2 - ARRAY3, [functools.partial(_replace_full_base, s="array<long>")]))
 
         cls.define_overload("Geometry::Query::sample_points_by_radius", (FLOAT - MATRIX - ARRAY3, [_arrUp]))
 
         cls.define_overload("Geometry::Query::sample_property", (FLOATING - ARRAY, [_arrUp]))
-        cls.define_overload("Geometry::Query::sample_property_2D", (FLOATING - ARRAY, [lambda x: _arrUp(_arrUp(x))]))
+        cls.define_overload("Geometry::Query::sample_property_2D", (FLOATING - ARRAY, [_arrUp2]))
 
         cls.define_overload("Geometry::Properties::get_geo_component_indices", (INTEGER & SIMPLE - ARRAY3, [_arrUp]))
         cls.define_overload("Geometry::Properties::get_geo_property_or_default", (ALL_TYPES, [_arrUp]))
@@ -1254,8 +1769,8 @@ class Overlord:
 
         cls.define_overload("Geometry::Strands::strands_basis_to_orientation", (AUTO_VECTOR, ["array<Math::float4>"]))
 
-        cls.define_overload("Geometry::Query::get_raycast_locations", ({"Math::float3", "array<Math::float3>"}, [None, lambda x: _replace_full_base(x, "Geometry::Common::GeoLocation"), lambda x: _replace_full_base(x, "bool")]))
-        cls.define_overload("Geometry::Query::sample_raycast_accelerator", ({"Math::float3", "array<Math::float3>"}, [None, lambda x: _replace_full_base(x, "Geometry::Common::GeoLocation"), lambda x: _replace_full_base(x, "bool")]))
+        cls.define_overload("Geometry::Query::get_raycast_locations", ({"Math::float3", "array<Math::float3>"}, [None, functools.partial(_replace_full_base, s="Geometry::Common::GeoLocation"), functools.partial(_replace_full_base, s="bool")]))
+        cls.define_overload("Geometry::Query::sample_raycast_accelerator", ({"Math::float3", "array<Math::float3>"}, [None, functools.partial(_replace_full_base, s="Geometry::Common::GeoLocation"), functools.partial(_replace_full_base, s="bool")]))
 
         cls.define_overload("Modeling::Points::randomize_selection", ({"Object"}, []), (AUTO_SCALAR, ["Object", "array<long>"]))
         cls.define_overload("Modeling::Points::randomize_selection_by_probabilities", ({"Object"}, []), (AUTO_SCALAR, ["Object", "array<long>"]))
@@ -1265,15 +1780,15 @@ class Overlord:
         # I also dont know if thats on purpose or a bug...
         cls.define_overload("Geometry::Query::sample_volume", ({"Object", "array<Math::float3>"}, []), (types, [_arrUp]))
 
-        cls.define_overload("Geometry::Query::sample_volume_gradient", ({"Object", "array<Math::float3>"}, []), ({"float", "double"}, [lambda x: _arrUp(_to_vec3(x))]))
+        cls.define_overload("Geometry::Query::sample_volume_gradient", ({"Object", "array<Math::float3>"}, []), ({"float", "double"}, [_arrUp_vec3]))
 
     @classmethod
     def load_ml_overloads(cls):
         for s in ["CELU", "ELU", "PReLU", "RReLU", "ReLU", "ReLU6", "SELU", "hard_shrink", "hard_sigmoid", "hard_swish",
                   "hard_tanh", "leaky_ReLU", "log_sigmoid", "mish", "sigmoid", "soft_plus", "soft_shrink", "soft_sign",
                   "tanh", "tanh_shrink", "threshold"]:
-            cls.define_overload(f"MachineLearning::Activation::activation_{s}", (NUMERIC - BIG, [lambda x: _replace_base(x, "float")]))
-            cls.define_overload(f"MachineLearning::Activation::activation_{s}", (NUMERIC & BIG, [lambda x: _replace_base(x, "double")]))
+            cls.define_overload(f"MachineLearning::Activation::activation_{s}", (NUMERIC - BIG, [functools.partial(_replace_base, s="float")]))
+            cls.define_overload(f"MachineLearning::Activation::activation_{s}", (NUMERIC & BIG, [functools.partial(_replace_base, s="double")]))
 
         # I believe this should match the lerp signature
         cls.define_overload_resolver("MachineLearning::Utils::z_score_denormalize", _resolver.lerp)
@@ -1287,10 +1802,10 @@ class Overlord:
     @classmethod
     def load_random_overloads(cls):
         cls.force_auto_ports("Core::Randomization::fractal_noise", "noise")
-        cls.define_overload("Core::Randomization::fractal_noise", (LONG | FLOAT, [lambda x: _replace_full_base(x, "float")]))
+        cls.define_overload("Core::Randomization::fractal_noise", (LONG | FLOAT, [functools.partial(_replace_full_base, s="float")]))
 
         cls.force_auto_ports("Core::Randomization::fractal_turbulence", "noise")
-        cls.define_overload("Core::Randomization::fractal_turbulence", (LONG | FLOAT, [lambda x: _replace_full_base(x, "Math::float3")]))
+        cls.define_overload("Core::Randomization::fractal_turbulence", (LONG | FLOAT, [functools.partial(_replace_full_base, s="Math::float3")]))
 
         cls.define_overload("Core::Randomization::random_value_array", (NUMERIC | BOOL, [_arrUp]))
 
@@ -1325,26 +1840,26 @@ class Overlord:
         cls.define_overload_resolver("Core::Fields::switch_fields", _resolver.switch_fields)
 
         cls.force_auto_ports("Core::Fields::field_is_empty", "output")
-        cls.define_overload("Core::Fields::field_is_empty", (FIELDS, [lambda x: _replace_full_base(x, "bool")]))
+        cls.define_overload("Core::Fields::field_is_empty", (FIELDS, [functools.partial(_replace_full_base, s="bool")]))
 
         cls.define_overload("Core::Fields::advect_field", (FIELDS, [None]))
 
         cls.force_auto_ports("Core::Fields::curl_noise_field", "noise_field")
-        cls.define_overload("Core::Fields::curl_noise_field", (FLOAT | FIELD, [lambda x: _replace_full_base(x, "Core::Fields::VectorField")]))
+        cls.define_overload("Core::Fields::curl_noise_field", (FLOAT | FIELD, [functools.partial(_replace_full_base, s="Core::Fields::VectorField")]))
 
         cls.define_overload("Core::Fields::fcurve_field", (FIELDS, [None]))
 
         cls.force_auto_ports("Core::Fields::fractal_block_noise_field", "noise_field")
-        cls.define_overload("Core::Fields::fractal_block_noise_field", (FLOAT | FIELD, [lambda x: _replace_full_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Fields::fractal_block_noise_field", (FLOAT | FIELD, [functools.partial(_replace_full_base, s="Core::Fields::ScalarField")]))
 
         cls.force_auto_ports("Core::Fields::fractal_disturbance_field", "noise_field")
-        cls.define_overload("Core::Fields::fractal_disturbance_field", (FLOAT | FIELD, [lambda x: _replace_full_base(x, "Core::Fields::VectorField")]))
+        cls.define_overload("Core::Fields::fractal_disturbance_field", (FLOAT | FIELD, [functools.partial(_replace_full_base, s="Core::Fields::VectorField")]))
 
         cls.force_auto_ports("Core::Fields::fractal_noise_field", "noise_field")
-        cls.define_overload("Core::Fields::fractal_noise_field", (FLOAT | FIELD, [lambda x: _replace_full_base(x, "Core::Fields::ScalarField")]))
+        cls.define_overload("Core::Fields::fractal_noise_field", (FLOAT | FIELD, [functools.partial(_replace_full_base, s="Core::Fields::ScalarField")]))
 
         cls.force_auto_ports("Core::Fields::fractal_turbulence_field", "noise_field")
-        cls.define_overload("Core::Fields::fractal_turbulence_field", (FLOAT | FIELD, [lambda x: _replace_full_base(x, "Core::Fields::VectorField")]))
+        cls.define_overload("Core::Fields::fractal_turbulence_field", (FLOAT | FIELD, [functools.partial(_replace_full_base, s="Core::Fields::VectorField")]))
 
         cls.define_overload("Core::Fields::property_proxy_field", (FIELDS, [None]))
         cls.define_overload("Core::Fields::rotate_field", (FIELDS, [None]))
@@ -1354,11 +1869,11 @@ class Overlord:
         cls.define_overload("Core::Fields::warp_field", (FIELDS, [None]))
         cls.define_overload("Core::Fields::voxel_field", (FIELDS, [None]))
 
-        cls.define_overload("Core::Fields::sample_field", (FIELD, [lambda x: _replace_full_base(x, "float")]))
-        cls.define_overload("Core::Fields::sample_field", (FIELD3, [lambda x: _replace_full_base(x, "Math::float3")]))
+        cls.define_overload("Core::Fields::sample_field", (FIELD, [functools.partial(_replace_full_base, s="float")]))
+        cls.define_overload("Core::Fields::sample_field", (FIELD3, [functools.partial(_replace_full_base, s="Math::float3")]))
 
-        cls.define_overload("Core::Fields::sample_field_with_proxies", (FIELD, [lambda x: _replace_full_base(x, "array<float>")]))
-        cls.define_overload("Core::Fields::sample_field_with_proxies", (FIELD3, [lambda x: _replace_full_base(x, "array<Math::float3>")]))
+        cls.define_overload("Core::Fields::sample_field_with_proxies", (FIELD, [functools.partial(_replace_full_base, s="array<float>")]))
+        cls.define_overload("Core::Fields::sample_field_with_proxies", (FIELD3, [functools.partial(_replace_full_base, s="array<Math::float3>")]))
 
         cls.define_overload("Core::Fields::voxel_proxy_field", (FIELDS, [None]))
 
@@ -1379,7 +1894,7 @@ class Overlord:
         cls.define_overload("Simulation::Influence::influence_set_spin", (SIM_VECTOR, []))
 
         cls.force_auto_ports("Simulation::Influence::influence_set_property", "out_influence")
-        cls.define_overload("Simulation::Influence::influence_set_property", (((FLOAT - VECTOR2 - MATRIX) | (BOOL & SIMPLE) | FIELDS), [lambda x: _replace_full_base(x, "Object")]))
+        cls.define_overload("Simulation::Influence::influence_set_property", (((FLOAT - VECTOR2 - MATRIX) | (BOOL & SIMPLE) | FIELDS), [functools.partial(_replace_full_base, s="Object")]))
 
         cls.force_auto_ports("Simulation::Influence::radial_influence", "magnitude", "drag")
         cls.define_overload("Simulation::Influence::radial_influence", (SIM_VECTOR, []), (SIM_SCALAR, []))
@@ -1440,12 +1955,13 @@ class Overlord:
         cls.define_overload("USD::Attribute::get_usd_attribute_value", (USD_ATTR, [None, "bool"]))
 
     @classmethod
-    def load_simple_overloads_from_suggestions(cls):
+    def load_simple_overloads_from_suggestions(cls, sa_funcs=None):
         """
         this wont be an exhaustive list of overloads but at least the suggestions will be taken into account
         This only works for nodes with no auto out ports
         """
-        for s_func, d_data in cls._d_operators.items():
+        for s_func in (cls._d_operators if sa_funcs is None else sa_funcs):
+            d_data = cls._d_operators[s_func]
             sa_keys = list(d_data["overloads"])
             if sa_keys[0].count("auto") > 0 and len(sa_keys) == 1 and s_func not in cls._d_overloads:
                 if "auto" in d_data["overloads"][sa_keys[0]]:
@@ -1464,8 +1980,9 @@ class Overlord:
                     print(f"[{s_func}] Too much memory required to compute {n} overloads")
                     continue
 
+                d_overloads = cls._own_overloads(s_func)
                 for perm in itertools.product(*d_data["suggestions"]):
-                    d_data["overloads"]["-".join(perm)] = d_data["overloads"][sa_keys[0]]
+                    d_overloads["-".join(perm)] = d_overloads[sa_keys[0]]
 
 
 if __name__ == "__main__":
@@ -113,60 +113,147 @@ sa_types += list(_bifres.ENUMS.keys())
 for i in range(3):
     sa_types += [f"array<{s}>" for s in sa_types]
 
-ALL_TYPES = set(sa_types)
-
-ARRAY = {s for s in sa_types if s.count(">") > 0}
-ARRAY1 = {s for s in sa_types if s.count(">") == 1}
-ARRAY2 = {s for s in sa_types if s.count(">") == 2}
-ARRAY3 = {s for s in sa_types if s.count(">") == 3}
-
-SIMPLE = {s for s in sa_types if "::" not in s}
-ANY = {s for s in sa_types if s == "any" or "<any>" in s}
-BOOL = {s for s in sa_types if _is_bool(s)}
-STRING = {s for s in sa_types if s == "string" or "<string>" in s}
-OBJECT = {s for s in sa_types if s == "Object" or "<Object>" in s}
-
-VECTOR = {s for s in sa_types if _is_vector(s, "234")}
-VECTOR2 = {s for s in VECTOR if _is_vector(s, "2")}
-VECTOR3 = {s for s in VECTOR if _is_vector(s, "3")}
-VECTOR4 = {s for s in VECTOR if _is_vector(s, "4")}
-
-MATRIX = {s for s in sa_types if _is_matrix(s, "234", "234")}
-MATRIX2x2 = {s for s in MATRIX if _is_matrix(s, "2", "2")}
-MATRIX2x3 = {s for s in MATRIX if _is_matrix(s, "2", "3")}
-MATRIX2x4 = {s for s in MATRIX if _is_matrix(s, "2", "4")}
-MATRIX3x2 = {s for s in MATRIX if _is_matrix(s, "3", "2")}
-MATRIX3x3 = {s for s in MATRIX if _is_matrix(s, "3", "3")}
-MATRIX3x4 = {s for s in MATRIX if _is_matrix(s, "3", "4")}
-MATRIX4x2 = {s for s in MATRIX if _is_matrix(s, "4", "2")}
-MATRIX4x3 = {s for s in MATRIX if _is_matrix(s, "4", "3")}
-MATRIX4x4 = {s for s in MATRIX if _is_matrix(s, "4", "4")}
+# every type gets a stable id (its position in here), the categories are bitmasks over those ids
+_SA_TYPE_NAMES = list(dict.fromkeys(sa_types))
+_D_TYPE_IDS = {s: i for i, s in enumerate(_SA_TYPE_NAMES)}
+
+
+def _type_id(s_type):
+    i_id = _D_TYPE_IDS.get(s_type)
+    if i_id is None:
+        # a type from a hand written set that wasnt collected, it still needs a bit
+        i_id = _D_TYPE_IDS[s_type] = len(_SA_TYPE_NAMES)
+        _SA_TYPE_NAMES.append(s_type)
+    return i_id
+
+
+def _mask(types):
+    if isinstance(types, int):
+        return int(types)
+    return int(TypeSet.of(types))
+
+
+class TypeSet(int):
+    """
+    A set of port type strings stored as an int bitmask. It supports the set operators
+    (|, &, -, ^), "in" and iteration, so it can be used like the plain sets it replaced,
+    mixing both is fine too. Membership is a bit test and combining two is a single
+    bitwise operation instead of copying thousands of strings
+    """
+
+    @classmethod
+    def of(cls, sa_types):
+        # set the bits in a bytearray, or-ing into a growing int copies it for every type
+        ia_ids = [_type_id(s_type) for s_type in sa_types]
+        ba_bits = bytearray(max(ia_ids, default=0) // 8 + 1)
+        for i_id in ia_ids:
+            ba_bits[i_id >> 3] |= 1 << (i_id & 7)
+        return cls(int.from_bytes(ba_bits, "little"))
+
+    def __or__(self, other):
+        return TypeSet(int(self) | _mask(other))
+
+    def __and__(self, other):
+        return TypeSet(int(self) & _mask(other))
+
+    def __xor__(self, other):
+        return TypeSet(int(self) ^ _mask(other))
+
+    def __sub__(self, other):
+        return TypeSet(int(self) & ~_mask(other))
+
+    def __rsub__(self, other):
+        return TypeSet(_mask(other) & ~int(self))
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __contains__(self, s_type):
+        i_id = _D_TYPE_IDS.get(s_type)
+        if i_id is None:
+            return False
+
+        # shifting a few thousand bits for every test is slower than the set lookup was,
+        # read the bit from a byte copy instead
+        try:
+            ba_bits = self._ba_bits
+        except AttributeError:
+            ba_bits = self._ba_bits = self.to_bytes(self.bit_length() // 8 + 1, "little")
+
+        i_byte = i_id >> 3
+        return i_byte < len(ba_bits) and (ba_bits[i_byte] >> (i_id & 7)) & 1 == 1
+
+    def __iter__(self):
+        for i, s_bit in enumerate(reversed(bin(self)[2:])):
+            if s_bit == "1":
+                yield _SA_TYPE_NAMES[i]
+
+    def __len__(self):
+        return bin(self).count("1")
+
+    def __repr__(self):
+        return f"TypeSet({sorted(self)})"
+
+    def __reduce__(self):
+        # ids of types that werent collected depend on the order they were used in, pickle the names
+        return TypeSet.of, (list(self),)
+
+
+ALL_TYPES = TypeSet.of(_SA_TYPE_NAMES)
+
+ARRAY = TypeSet.of(s for s in _SA_TYPE_NAMES if s.count(">") > 0)
+ARRAY1 = TypeSet.of(s for s in _SA_TYPE_NAMES if s.count(">") == 1)
+ARRAY2 = TypeSet.of(s for s in _SA_TYPE_NAMES if s.count(">") == 2)
+ARRAY3 = TypeSet.of(s for s in _SA_TYPE_NAMES if s.count(">") == 3)
+
+SIMPLE = TypeSet.of(s for s in _SA_TYPE_NAMES if "::" not in s)
+ANY = TypeSet.of(s for s in _SA_TYPE_NAMES if s == "any" or "<any>" in s)
+BOOL = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_bool(s))
+STRING = TypeSet.of(s for s in _SA_TYPE_NAMES if s == "string" or "<string>" in s)
+OBJECT = TypeSet.of(s for s in _SA_TYPE_NAMES if s == "Object" or "<Object>" in s)
+
+VECTOR = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_vector(s, "234"))
+VECTOR2 = TypeSet.of(s for s in VECTOR if _is_vector(s, "2"))
+VECTOR3 = TypeSet.of(s for s in VECTOR if _is_vector(s, "3"))
+VECTOR4 = TypeSet.of(s for s in VECTOR if _is_vector(s, "4"))
+
+MATRIX = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_matrix(s, "234", "234"))
+MATRIX2x2 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "2", "2"))
+MATRIX2x3 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "2", "3"))
+MATRIX2x4 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "2", "4"))
+MATRIX3x2 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "3", "2"))
+MATRIX3x3 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "3", "3"))
+MATRIX3x4 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "3", "4"))
+MATRIX4x2 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "4", "2"))
+MATRIX4x3 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "4", "3"))
+MATRIX4x4 = TypeSet.of(s for s in MATRIX if _is_matrix(s, "4", "4"))
 MATRIX_SQUARE = MATRIX2x2 | MATRIX3x3 | MATRIX4x4
 MATRIX_x4 = MATRIX2x4 | MATRIX3x4 | MATRIX4x4 | MATRIX4x3 | MATRIX4x2
 
-DOUBLE = {s for s in sa_types if s.rpartition("<")[2].split("::")[-1].startswith("double")}
-FLOAT = {s for s in sa_types if s.rpartition("<")[2].split("::")[-1].startswith("float")}
+DOUBLE = TypeSet.of(s for s in _SA_TYPE_NAMES if s.rpartition("<")[2].split("::")[-1].startswith("double"))
+FLOAT = TypeSet.of(s for s in _SA_TYPE_NAMES if s.rpartition("<")[2].split("::")[-1].startswith("float"))
 FLOATING = FLOAT | DOUBLE
-UNSIGNED = {s for s in sa_types if _is_unsigned(s)}
-INTEGER = {s for s in sa_types if _is_integer(s)} | UNSIGNED
-BIG = {s for s in sa_types if _is_big(s)}
-LONG = {s for s in sa_types if _is_long(s)}
-INT = {s for s in sa_types if _is_int(s)}
-
-FIELD = {s for s in sa_types if _is_scalar_field(s)}
-FIELD3 = {s for s in sa_types if _is_vector_field(s)}
+UNSIGNED = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_unsigned(s))
+INTEGER = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_integer(s)) | UNSIGNED
+BIG = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_big(s))
+LONG = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_long(s))
+INT = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_int(s))
+
+FIELD = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_scalar_field(s))
+FIELD3 = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_vector_field(s))
 FIELDS = FIELD | FIELD3
 
-GEOLOCATION = {s for s in sa_types if _is_geo_location(s)}
+GEOLOCATION = TypeSet.of(s for s in _SA_TYPE_NAMES if _is_geo_location(s))
 
 NUMERIC = FLOATING | INTEGER
 
-AUTO_SCALAR = {"float", "array<float>", "array<bool>", "array<long>", "string"} | (FIELD-ARRAY)
-AUTO_VECTOR = {"float", "Math::float3", "array<Math::float3>", "string"} | (FIELDS - ARRAY)
-AUTO_TAG = {"array<bool>", "array<long>", "array<uint>", "long", "string"}
+AUTO_SCALAR = TypeSet.of({"float", "array<float>", "array<bool>", "array<long>", "string"}) | (FIELD-ARRAY)
+AUTO_VECTOR = TypeSet.of({"float", "Math::float3", "array<Math::float3>", "string"}) | (FIELDS - ARRAY)
+AUTO_TAG = TypeSet.of({"array<bool>", "array<long>", "array<uint>", "long", "string"})
 
 
-SIM_SCALAR = {"float", "Core::Fields::ScalarField"}
-SIM_VECTOR = {"float", "Math::float3", "Core::Fields::ScalarField", "Core::Fields::VectorField"}
+SIM_SCALAR = TypeSet.of({"float", "Core::Fields::ScalarField"})
+SIM_VECTOR = TypeSet.of({"float", "Math::float3", "Core::Fields::ScalarField", "Core::Fields::VectorField"})
 
 USD_ATTR = ((DOUBLE & MATRIX_SQUARE) | (FLOATING & VECTOR) | (NUMERIC & SIMPLE) | STRING | (BOOL & SIMPLE)) - ARRAY3 - ARRAY2
\ No newline at end of file
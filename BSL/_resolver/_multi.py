@@ -15,7 +15,7 @@ def multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types
         if not promoted:
             return False, (_error.BfTypeError, f"'{sa_names_in[i]}' with type '{input_types[i]}' unsupported")
 
-        input_types[i] = _type.Type(promoted)
+        input_types[i] = _type.Type.of(promoted)
 
     types = [t for t in input_types]
 
@@ -34,6 +34,6 @@ def multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types
     if b_to_float:
         # promote to floating points
         if not result.is_field():
-            _, result = _bifast.MathOp._get_type(lhs=result, rhs=_type.Type("float"), op="?")
+            _, result = _bifast.MathOp._get_type(lhs=result, rhs=_type.Type.of("float"), op="?")
 
     return True, (input_types, [result.s])
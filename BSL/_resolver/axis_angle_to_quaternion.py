@@ -2,11 +2,16 @@ from BSL import _error, _type
 from BSL._port_types import *
 
 
+# combined once here instead of on every call
+_NUMERIC_NO_VECTOR4_NO_MATRIX = NUMERIC - VECTOR4 - MATRIX
+_NUMERIC_OR_SIMPLE = NUMERIC | SIMPLE
+
+
 def axis_angle_to_quaternion(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL import _bifast
 
-    sa_possible1 = NUMERIC - VECTOR4 - MATRIX
-    sa_possible2 = NUMERIC | SIMPLE
+    sa_possible1 = _NUMERIC_NO_VECTOR4_NO_MATRIX
+    sa_possible2 = _NUMERIC_OR_SIMPLE
 
     if input_types[0].s not in sa_possible1:
         if input_types[0].s == "auto":
@@ -31,7 +36,7 @@ def axis_angle_to_quaternion(sa_names_in, sa_names_out, sa_types_in, sa_types_ou
         return False, (_error.BfTypeError, result)
 
     arr = result.array_dim()
-    _, result = _bifast.MathOp._get_type(lhs=result.base_type().base_type(), rhs=_type.Type("float"), op="?")
+    _, result = _bifast.MathOp._get_type(lhs=result.base_type().base_type(), rhs=_type.Type.of("float"), op="?")
 
     return True, (input_types, [arr * "array<" + "Math::" + result.s + "4" + arr * ">"])
 
@@ -18,9 +18,9 @@ def to_field(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
         return False, (_error.BfTypeError, f"Cant convert '{t.s}' to field")
 
     if t.is_vector():
-        return True, (input_types, [_type.Type(i_arr * "array<" + "Core::Fields::VectorField" + i_arr * ">")])
+        return True, (input_types, [_type.Type.of(i_arr * "array<" + "Core::Fields::VectorField" + i_arr * ">")])
 
-    return True, (input_types, [_type.Type(i_arr * "array<" + "Core::Fields::ScalarField" + i_arr * ">")])
+    return True, (input_types, [_type.Type.of(i_arr * "array<" + "Core::Fields::ScalarField" + i_arr * ">")])
 
 
 def switch_fields(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
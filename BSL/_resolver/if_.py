@@ -3,6 +3,10 @@ from BSL._port_types import *
 from BSL._resolver import _multi
 
 
+# combined once here instead of on every call
+_NUMERIC_ARRAY1 = NUMERIC - ARRAY3 - ARRAY2
+
+
 def if_(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL import _bifast
 
@@ -91,7 +95,7 @@ def switch_is_a(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_type
 
 def particle_property_from_age(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     # geo, string, NUMERIC-ARRAY2+, NUMERIC-ARRAY2+, float
-    types = [{"Object"}, {"string"}, NUMERIC-ARRAY3-ARRAY2, NUMERIC-ARRAY3-ARRAY2, "float"]
+    types = [{"Object"}, {"string"}, _NUMERIC_ARRAY1, _NUMERIC_ARRAY1, "float"]
 
     inputs = []
     for i, sa_types in enumerate(types):
@@ -3,13 +3,29 @@ from BSL._port_types import *
 from BSL._resolver import _multi
 
 
+# combined once here instead of on every call
+_FLOATING_NO_MATRIX_OR_FIELD = (FLOATING - MATRIX) | FIELD
+_FLOATING_VECTOR3_OR_FIELD3 = FLOATING & VECTOR3 | FIELD3
+_NUMERIC_VECTOR_OR_FIELD3 = NUMERIC & VECTOR | FIELD3
+_NUMERIC_SCALAR_OR_FIELD = FIELD | NUMERIC - MATRIX - VECTOR
+_NUMERIC_NO_MATRIX_NO_VECTOR4 = NUMERIC - MATRIX - VECTOR4
+_NUMERIC_SCALAR = NUMERIC - MATRIX - VECTOR
+_FLOATING_VECTOR = FLOATING & VECTOR
+_FLOATING_VECTOR3 = FLOATING & VECTOR3
+_FLOATING_VECTOR4 = FLOATING & VECTOR4
+_FLOATING_MATRIX4x4 = FLOATING & MATRIX4x4
+_FLOATING_SIMPLE = FLOATING & SIMPLE
+_BOOL_SIMPLE = BOOL & SIMPLE
+_AUTO_VECTOR_NO_STRING = AUTO_VECTOR - STRING
+
+
 def atan_2D(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible=(FLOATING - MATRIX) | FIELD, b_to_float=True)
+    return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible=_FLOATING_NO_MATRIX_OR_FIELD, b_to_float=True)
 
 
 def distance(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL._overlord import _to_scalar
-    sa_possible = FLOATING & VECTOR3
+    sa_possible = _FLOATING_VECTOR3
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible=sa_possible, b_to_float=True)
     if not status:
         return False, status
@@ -69,17 +85,17 @@ def equivalent_float_epsilon(sa_names_in, sa_names_out, sa_types_in, sa_types_ou
 
 
 def lerp(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = (FLOATING - MATRIX) | FIELD
+    sa_possible = _FLOATING_NO_MATRIX_OR_FIELD
     return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible=sa_possible, b_to_float=True)
 
 
 def linear_interpolate(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = (FLOATING - MATRIX) | FIELD
+    sa_possible = _FLOATING_NO_MATRIX_OR_FIELD
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:3], sa_possible=sa_possible, b_to_float=True)
     if not status:
         return False, result
 
-    sa_possible1 = BOOL & SIMPLE
+    sa_possible1 = _BOOL_SIMPLE
     status1, result1 = _multi.multi_same(sa_names_in[3:], sa_names_out, sa_types_in, sa_types_out[3:], input_types[3:], sa_possible=sa_possible1, b_to_float=True)
     if not status1:
         return False, result1
@@ -88,17 +104,17 @@ def linear_interpolate(sa_names_in, sa_names_out, sa_types_in, sa_types_out, inp
 
 
 def lerp_vec(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = (FLOATING & VECTOR)
+    sa_possible = _FLOATING_VECTOR
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:2], sa_possible=sa_possible, b_to_float=True)
     if not status:
         return False, result
 
-    sa_possible = (FLOATING & SIMPLE)
+    sa_possible = _FLOATING_SIMPLE
     status1, result1 = _multi.multi_same([sa_names_in[2]], sa_names_out, sa_types_in, sa_types_out, [input_types[2]], sa_possible=sa_possible, b_to_float=True)
     if not status1:
         return False, result1
 
-    sa_possible = (BOOL & SIMPLE)
+    sa_possible = _BOOL_SIMPLE
     status2, result2 = _multi.multi_same(sa_names_in[3:], sa_names_out, sa_types_in, sa_types_out, input_types[3:], sa_possible=sa_possible, b_to_float=True)
     if not status2:
         return False, result2
@@ -112,7 +128,7 @@ def clamp(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
 
 
 def clamp_influence(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = AUTO_VECTOR - STRING
+    sa_possible = _AUTO_VECTOR_NO_STRING
 
     i_min = sa_names_in.index("min")
     i_max = sa_names_in.index("max")
@@ -133,7 +149,7 @@ def srt_to_matrix(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_ty
     from BSL import _bifast
 
     for i in range(len(input_types)):
-        sa_possible = FLOATING & (VECTOR3 if i != 2 else VECTOR4)
+        sa_possible = (_FLOATING_VECTOR3 if i != 2 else _FLOATING_VECTOR4)
 
         if input_types[i].s == "auto":
             return False, (_error.BfTypeError, f"'Missing required parameter '{sa_names_in[i]}'")
@@ -166,18 +182,18 @@ def srt_to_matrix(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_ty
 
 
 def cross(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = FLOATING & VECTOR3 | FIELD3
+    sa_possible = _FLOATING_VECTOR3_OR_FIELD3
     return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible, b_to_float=True)
 
 
 def dot(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = NUMERIC & VECTOR | FIELD3
+    sa_possible = _NUMERIC_VECTOR_OR_FIELD3
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible, b_to_float=False)
     if not status:
         return False, result
 
     inputs = result[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
     return True, (inputs, [arr * "array<" + type.base_type().base_type().s + arr * ">"])
 
@@ -187,7 +203,7 @@ def change_range(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_typ
     if not status:
         return result
 
-    status1, result1 = _multi.multi_same([sa_names_in[5]], sa_names_out, sa_types_in, sa_types_out, [input_types[5]], BOOL & SIMPLE, b_to_float=False)
+    status1, result1 = _multi.multi_same([sa_names_in[5]], sa_names_out, sa_types_in, sa_types_out, [input_types[5]], _BOOL_SIMPLE, b_to_float=False)
     if not status1:
         return result1
 
@@ -195,31 +211,31 @@ def change_range(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_typ
 
 
 def multiply_quaternions(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, FLOATING & VECTOR4, b_to_float=True)
+    return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, _FLOATING_VECTOR4, b_to_float=True)
 
 
 def normal_and_tangent_to_orientation(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:2], FLOATING & VECTOR3, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:2], _FLOATING_VECTOR3, b_to_float=True)
     if not status:
         return False, result
 
-    status2, result2 = _multi.multi_same(sa_names_in[2:], sa_names_out, sa_types_in, sa_types_out, input_types[2:], BOOL & SIMPLE, b_to_float=True)
+    status2, result2 = _multi.multi_same(sa_names_in[2:], sa_names_out, sa_types_in, sa_types_out, input_types[2:], _BOOL_SIMPLE, b_to_float=True)
     if not status2:
         return False, result2
 
     inputs = result[0] + result2[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
     return True, (inputs, [arr * "array<" + "Math::" + type.base_type().base_type().s + "4" + arr * ">"])
 
 
 def rotation_between_vectors(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, FLOATING & VECTOR3, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, _FLOATING_VECTOR3, b_to_float=True)
     if not status:
         return False, result
 
     inputs = result[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
     return True, (inputs, [arr * "array<" + "Math::" + type.base_type().base_type().s + "4" + arr * ">"])
 
@@ -227,15 +243,15 @@ def rotation_between_vectors(sa_names_in, sa_names_out, sa_types_in, sa_types_ou
 def rotation_around_position_to_matrix(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL import _bifast
 
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], FLOATING & VECTOR4, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], _FLOATING_VECTOR4, b_to_float=True)
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], FLOATING & VECTOR3, b_to_float=True)
+    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], _FLOATING_VECTOR3, b_to_float=True)
     if not status1:
         return False, result1
 
-    status2, result2 = _bifast.MathOp._get_type(lhs=_type.Type(result[0][0]), rhs=_type.Type(result1[0][0]), op="?")
+    status2, result2 = _bifast.MathOp._get_type(lhs=_type.Type.of(result[0][0]), rhs=_type.Type.of(result1[0][0]), op="?")
     if not status2:
         return False, (_error.BfTypeError, result2)
 
@@ -244,16 +260,16 @@ def rotation_around_position_to_matrix(sa_names_in, sa_names_out, sa_types_in, s
 
 
 def rotate_by_quaternion(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], FLOATING & VECTOR3, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], _FLOATING_VECTOR3, b_to_float=True)
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], FLOATING & VECTOR4, b_to_float=True)
+    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], _FLOATING_VECTOR4, b_to_float=True)
     if not status1:
         return False, result1
 
     main = result[1]
-    all_results = [_type.Type(s) for s in result[1] + result1[1]]
+    all_results = [_type.Type.of(s) for s in result[1] + result1[1]]
     arr_dims = sorted(set([t.array_dim() for t in all_results if t.array_dim()])) + [0]
     if len(arr_dims) > 2:
         return False, (_error.BfTypeError, "Cant mix array dimensions")
@@ -265,16 +281,16 @@ def rotate_by_quaternion(sa_names_in, sa_names_out, sa_types_in, sa_types_out, i
 
 
 def rotate_by_matrix(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], FLOATING & VECTOR3, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], _FLOATING_VECTOR3, b_to_float=True)
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], FLOATING & MATRIX4x4, b_to_float=True)
+    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], _FLOATING_MATRIX4x4, b_to_float=True)
     if not status1:
         return False, result1
 
     main = result[1]
-    all_results = [_type.Type(s) for s in result[1] + result1[1]]
+    all_results = [_type.Type.of(s) for s in result[1] + result1[1]]
     arr_dims = sorted(set([t.array_dim() for t in all_results if t.array_dim()])) + [0]
     if len(arr_dims) > 2:
         return False, (_error.BfTypeError, "Cant mix array dimensions")
@@ -286,16 +302,16 @@ def rotate_by_matrix(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input
 
 
 def transform_vector_as(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], FLOATING & VECTOR3, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], _FLOATING_VECTOR3, b_to_float=True)
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], FLOATING & MATRIX4x4, b_to_float=True)
+    status1, result1 = _multi.multi_same(sa_names_in[1:], sa_names_out, sa_types_in, sa_types_out, input_types[1:], _FLOATING_MATRIX4x4, b_to_float=True)
     if not status1:
         return False, result1
 
     main = result[1]
-    all_results = [_type.Type(s) for s in result[1] + result1[1]]
+    all_results = [_type.Type.of(s) for s in result[1] + result1[1]]
     arr_dims = sorted(set([t.array_dim() for t in all_results if t.array_dim()])) + [0]
     if len(arr_dims) > 2:
         return False, (_error.BfTypeError, "Cant mix array dimensions")
@@ -307,32 +323,32 @@ def transform_vector_as(sa_names_in, sa_names_out, sa_types_in, sa_types_out, in
 
 
 def quaternion_slerp(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:2], FLOATING & VECTOR4, b_to_float=True)
+    status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:2], _FLOATING_VECTOR4, b_to_float=True)
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[2::4], sa_names_out, sa_types_in, sa_types_out, input_types[2::4], FLOATING & SIMPLE, b_to_float=True)
+    status1, result1 = _multi.multi_same(sa_names_in[2::4], sa_names_out, sa_types_in, sa_types_out, input_types[2::4], _FLOATING_SIMPLE, b_to_float=True)
     if not status1:
         return False, result1
 
-    status2, result2 = _multi.multi_same(sa_names_in[3:6], sa_names_out, sa_types_in, sa_types_out, input_types[3:6], BOOL & SIMPLE, b_to_float=True)
+    status2, result2 = _multi.multi_same(sa_names_in[3:6], sa_names_out, sa_types_in, sa_types_out, input_types[3:6], _BOOL_SIMPLE, b_to_float=True)
     if not status2:
         return False, result2
 
-    status3, result3 = _multi.multi_same(sa_names_in[6:], sa_names_out, sa_types_in, sa_types_out, input_types[6:], FLOATING & SIMPLE, b_to_float=True)
+    status3, result3 = _multi.multi_same(sa_names_in[6:], sa_names_out, sa_types_in, sa_types_out, input_types[6:], _FLOATING_SIMPLE, b_to_float=True)
     if not status3:
         return False, result3
 
     main = result[1]
-    all_results = [_type.Type(s) for s in result[1] + result1[1] + result2[1] + result3[1]]
+    all_results = [_type.Type.of(s) for s in result[1] + result1[1] + result2[1] + result3[1]]
     arr_dims = sorted(set([t.array_dim() for t in all_results if t.array_dim()])) + [0]
     if len(arr_dims) > 2:
         return False, (_error.BfTypeError, "Cant mix array dimensions")
     if arr_dims:
         main[0] = arr_dims[0] * "array<" + main[0].rpartition("<")[2].strip(">") + arr_dims[0] * ">"
 
-    # quat_output = _type.Type(result[1][0])
-    # parm_output = _type.Type(result1[1][0])
+    # quat_output = _type.Type.of(result[1][0])
+    # parm_output = _type.Type.of(result1[1][0])
     # if parm_output.is_array() and quat_output.is_array():
     #     if parm_output.array_dim() != quat_output.array_dim():
     #         return False, (_error.BfTypeError, "Cant mix array dimensions")
@@ -349,12 +365,12 @@ def within_bounds(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_ty
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[3:], sa_names_out, sa_types_in, sa_types_out, input_types[3:], BOOL & SIMPLE, b_to_float=False)
+    status1, result1 = _multi.multi_same(sa_names_in[3:], sa_names_out, sa_types_in, sa_types_out, input_types[3:], _BOOL_SIMPLE, b_to_float=False)
     if not status1:
         return False, result1
 
     inputs = result[0] + result1[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
     return True, (inputs, [arr * "array<" + "bool" + arr * ">"])
 
@@ -364,25 +380,25 @@ def any_n_to_1(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types
 
 
 def scalar_to_vec2(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa = NUMERIC - MATRIX - VECTOR
+    sa = _NUMERIC_SCALAR
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa, b_to_float=False)
     if not status:
         return False, result
 
     inputs = result[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
     return True, (inputs, [arr * "array<" + "Math::" + type.base_type().s + "2" + arr * ">"])
 
 
 def scalar_to_vec3(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa = FIELD | NUMERIC - MATRIX - VECTOR
+    sa = _NUMERIC_SCALAR_OR_FIELD
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa, b_to_float=False)
     if not status:
         return False, result
 
     inputs = result[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
 
     if type.is_field():
@@ -392,13 +408,13 @@ def scalar_to_vec3(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_t
 
 
 def scalar_to_vec4(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa = NUMERIC - MATRIX - VECTOR
+    sa = _NUMERIC_SCALAR
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa, b_to_float=False)
     if not status:
         return False, result
 
     inputs = result[0]
-    type = _type.Type(result[1][0])
+    type = _type.Type.of(result[1][0])
     arr = type.array_dim()
     return True, (inputs, [arr * "array<" + "Math::" + type.base_type().s + "4" + arr * ">"])
 
@@ -406,7 +422,7 @@ def scalar_to_vec4(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_t
 def vec3_to_vec4(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL import _bifast
 
-    sa = NUMERIC - MATRIX - VECTOR4
+    sa = _NUMERIC_NO_MATRIX_NO_VECTOR4
     status, result = _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types[:1], sa, b_to_float=False)
     if not status:
         return False, result
@@ -415,7 +431,7 @@ def vec3_to_vec4(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_typ
     if not status1:
         return False, result1
 
-    status2, result2 = _bifast.MathOp._get_type(lhs=_type.Type(result[0][0]), rhs=_type.Type(result1[0][0]), op="?")
+    status2, result2 = _bifast.MathOp._get_type(lhs=_type.Type.of(result[0][0]), rhs=_type.Type.of(result1[0][0]), op="?")
     if not status2:
         return False, (_error.BfTypeError, result2)
 
@@ -2,10 +2,14 @@ from BSL import _error, _type
 from BSL._port_types import *
 
 
+# combined once here instead of on every call
+_NUMERIC_OR_BOOL = NUMERIC | BOOL
+
+
 def members(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL import _bifast
 
-    sa_possible = NUMERIC | BOOL
+    sa_possible = _NUMERIC_OR_BOOL
 
     if input_types[0].s not in sa_possible:
         if input_types[0].s == "auto":
@@ -34,13 +38,13 @@ def members(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
         result = result.base_type()
 
     if result.is_matrix():
-        result = _type.Type(arr * "array<" + "Math::bool" + result.s[-3:] + arr * ">")
+        result = _type.Type.of(arr * "array<" + "Math::bool" + result.s[-3:] + arr * ">")
 
     elif result.is_vector():
-        result = _type.Type(arr * "array<" + "Math::bool" + result.s[-1] + arr * ">")
+        result = _type.Type.of(arr * "array<" + "Math::bool" + result.s[-1] + arr * ">")
 
     else:
-        result = _type.Type(arr * "array<" + "bool" + arr * ">")
+        result = _type.Type.of(arr * "array<" + "bool" + arr * ">")
 
     return True, (input_types, [result.s])
 
@@ -3,6 +3,10 @@ from BSL._port_types import *
 from BSL._resolver import _multi
 
 
+# combined once here instead of on every call
+_FLOATING_NO_MATRIX_OR_SQUARE = FLOATING - MATRIX | MATRIX_SQUARE
+
+
 def power(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     from BSL import _bifast
     status, result = _bifast.MathOp._get_type(lhs=input_types[0], rhs=input_types[1], op="**")
@@ -16,7 +20,7 @@ def modulo(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
 
 
 def remainder(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible=FLOATING - MATRIX | MATRIX_SQUARE, b_to_float=True)
+    return _multi.multi_same(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types, sa_possible=_FLOATING_NO_MATRIX_OR_SQUARE, b_to_float=True)
 
 
 def copy_sign(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
@@ -3,13 +3,19 @@ from BSL._port_types import *
 from BSL._resolver import _multi
 
 
+# combined once here instead of on every call
+_RANDOM_VALUE = (FLOAT - MATRIX) | DOUBLE & SIMPLE | INT | LONG
+_LONG_SIMPLE = LONG & SIMPLE
+_NUMERIC_NO_MATRIX_NO_ARRAY = NUMERIC - MATRIX - ARRAY
+
+
 def random_(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
-    sa_possible = (FLOAT - MATRIX) | DOUBLE & SIMPLE | INT | LONG
+    sa_possible = _RANDOM_VALUE
     status, result = _multi.multi_same(sa_names_in[1:3], sa_names_out, sa_types_in, sa_types_out, input_types[1:3], sa_possible, b_to_float=False)
     if not status:
         return False, result
 
-    status1, result1 = _multi.multi_same(sa_names_in[0::3], sa_names_out, sa_types_in, sa_types_out, input_types[0::3], LONG & SIMPLE, b_to_float=False)
+    status1, result1 = _multi.multi_same(sa_names_in[0::3], sa_names_out, sa_types_in, sa_types_out, input_types[0::3], _LONG_SIMPLE, b_to_float=False)
     if not status1:
         return False, result1
 
@@ -18,7 +24,7 @@ def random_(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
 
 def randomize_geo_property(sa_names_in, sa_names_out, sa_types_in, sa_types_out, input_types):
     sa_possible1 = AUTO_SCALAR
-    sa_possible2 = NUMERIC - MATRIX - ARRAY
+    sa_possible2 = _NUMERIC_NO_MATRIX_NO_ARRAY
 
     auto_types = [t for s, t in zip(sa_types_in, input_types) if s == "auto"]
     auto_names = [t for s, t in zip(sa_types_in, sa_names_in) if s == "auto"]
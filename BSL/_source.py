@@ -0,0 +1,49 @@
+import bisect
+
+
+class LineIndex:
+    """
+    Offsets of all line starts in a source so diagnostics dont have to split or
+    scan the whole source for every message. Lines are 1-based like the lexer's
+    lineno, columns are 0-based offsets into the line.
+    """
+    def __init__(self, s_source):
+        self._s_source = s_source
+        self._ia_starts = [0]
+
+        i = s_source.find("\n")
+        while i != -1:
+            self._ia_starts.append(i + 1)
+            i = s_source.find("\n", i + 1)
+
+    @property
+    def source(self):
+        return self._s_source
+
+    def lineno(self, i_pos):
+        return bisect.bisect_right(self._ia_starts, i_pos)
+
+    def column(self, i_pos):
+        return i_pos - self._ia_starts[self.lineno(i_pos) - 1]
+
+    def line(self, i_lineno):
+        """
+        The text of the given line without the trailing NEWLINE
+        """
+        # this only feeds error messages, dont raise while formatting another error
+        if i_lineno < 1 or i_lineno > len(self._ia_starts):
+            return ""
+
+        i_start = self._ia_starts[i_lineno - 1]
+        if i_lineno < len(self._ia_starts):
+            return self._s_source[i_start:self._ia_starts[i_lineno] - 1]
+        return self._s_source[i_start:]
+
+    def prefix(self, i_pos):
+        """
+        The text between the start of the line and i_pos
+        """
+        return self._s_source[self._ia_starts[self.lineno(i_pos) - 1]:i_pos]
+
+    def location(self, i_pos):
+        return self.lineno(i_pos), self.column(i_pos)
@@ -1,3 +1,5 @@
+import warnings
+
 
 class AddableDict(dict):
     def __init__(self, d=None, **kwargs):
@@ -13,25 +15,153 @@ class AddableDict(dict):
 
 
 class Namespaces(AddableDict):
+    """
+    Dict of full namespace names ("Core::Math::add") that also accepts any trailing
+    part of a name ("Math::add", "add"). Those short names are resolved through a
+    suffix index that gets rebuilt lazily after the dict changed.
+
+    If a short name fits several entries, the first one (insertion order) still
+    wins like it always did, but it warns about it. Use candidates() to get all of them
+    """
+    _d_suffixes = None
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._d_suffixes = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._d_suffixes = None
+        super().__delitem__(key)
+
+    def pop(self, *args):
+        self._d_suffixes = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._d_suffixes = None
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        self._d_suffixes = None
+        super().clear()
+
+    def _get_suffixes(self):
+        if self._d_suffixes is None:
+            d_suffixes = {}
+            for s_key in self.keys():
+                sa_parts = s_key.split("::")
+                for i in range(1, len(sa_parts)):
+                    d_suffixes.setdefault("::".join(sa_parts[i:]), []).append(s_key)
+            self._d_suffixes = d_suffixes
+        return self._d_suffixes
+
+    def candidates(self, item):
+        """
+        All full names item could refer to
+        """
+        if item in self:
+            return [item]
+        return list(self._get_suffixes().get(item, []))
+
+    def resolves(self, item):
+        if item in self:
+            return item
+
+        sa_names = self._get_suffixes().get(item)
+        if not sa_names:
+            return False
+
+        if len(sa_names) > 1:
+            warnings.warn(f"'{item}' is ambiguous, using '{sa_names[0]}'. Could be any of: {sa_names}", stacklevel=2)
+        return sa_names[0]
+
     def __getitem__(self, item):
         if item not in self:
-            for s in self.keys():
-                if s.endswith("::" + item):
-                    item = s
-                    break
-            else:
+            s_name = self.resolves(item)
+            if not s_name:
                 raise KeyError(f"Missing '{item}'. Available: {list(self.keys())}")
+            item = s_name
 
         return super().__getitem__(item)
 
-    def resolves(self, item):
-        if item not in self:
-            for s in self.keys():
-                if s.endswith("::" + item):
-                    return s
-            else:
-                return False
-        return item
+
+class Pending:
+    """
+    A value that only gets built the first time somebody asks for it, see LazyDict
+    """
+    __slots__ = ("_x_build", "_value")
+
+    def __init__(self, x_build):
+        self._x_build = x_build
+        self._value = None
+
+    def get(self):
+        if self._x_build is not None:
+            self._value = self._x_build()
+            self._x_build = None
+        return self._value
+
+
+class _LazyValues:
+    """
+    Mixin for dicts that hold Pending values. Every way of reading a value builds it,
+    so code using the dict never sees a Pending
+    """
+    def __getitem__(self, item):
+        value = super().__getitem__(item)
+        return value.get() if type(value) is Pending else value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        return value.get() if type(value) is Pending else value
+
+    def __iter__(self):
+        # dict(x) and {**x} take the keys and __getitem__ instead of the raw values this way
+        return iter(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __eq__(self, other):
+        if not isinstance(other, dict) or len(self) != len(other):
+            return False
+        return all(key in other and self[key] == other[key] for key in self.keys())
+
+    def __ne__(self, other):
+        return not self == other
+
+
+class LazyDict(_LazyValues, AddableDict):
+    pass
+
+
+class LazyNamespaces(_LazyValues, Namespaces):
+    pass
 
 
 class Port(AddableDict):
@@ -8,7 +8,48 @@ _D_ENUMS = _bifres.ENUMS
 _D_TYPE_DICT = _file_io.get_type_dict()
 
 
+_SET_FRACTION = {"float", "double"}
+_SET_INTEGER = {"char", "uchar", "short", "ushort", "int", "uint", "long", "ulong"}
+_SET_UNSIGNED = {"uchar", "ushort", "uint", "ulong"}
+_SET_FIELD = {"Core::Fields::ScalarField", "Core::Fields::VectorField"}
+_SET_BIG = {"long", "ulong", "double"}
+
+
+def _base_string(s_type, b_array, b_matrix, b_vector):
+    if b_array:
+        return s_type.rpartition("<")[2].partition(">")[0]
+    if b_matrix:
+        return s_type.rpartition("::")[2][:-3]
+    if b_vector:
+        return s_type.rpartition("::")[2][:-1]
+    return s_type
+
+
+def _numeric_size(s_type, s_base):
+    if s_base == "bool" or s_type in ("char", "uchar"):
+        return 1
+    if s_type in ("short", "ushort"):
+        return 2
+    if s_type in ("int", "uint", "float"):
+        return 4
+    if s_base in _SET_BIG:
+        return 8
+    return -1
+
+
 class Type:
+    """
+    Types are immutable, use Type.of() to get the shared instance for a type string
+    instead of building a new one. Everything that only depends on the string is
+    computed once, the base type the first time its asked for
+    """
+    __slots__ = (
+        "_s_type", "_node_data", "_accessors", "_base",
+        "_b_array", "_b_vector", "_b_matrix", "_i_array_dim", "_i_vector_dim", "_ia_matrix_dim", "_i_numeric_size"
+    )
+
+    _D_FLYWEIGHTS = {}
+
     def __init__(self, s_type, node_data=None):
         if isinstance(s_type, Type):
             node_data = s_type._node_data
@@ -35,99 +76,117 @@ class Type:
         self._node_data = node_data
 
         self._accessors = _D_TYPES.get(s_base, {})
+        self._base = None
+
+        self._b_array = s_type.startswith("array<")
+        self._b_matrix = len(s_type) > 2 and s_type[-3] in "234" and s_type[-2] == "x" and s_type[-1] in "234"
+        self._b_vector = s_type[-1] in "234" and not self._b_matrix
+        self._i_array_dim = s_type.count("<")
+        self._i_vector_dim = int(s_type[-1]) if self._b_vector else -1
+        self._ia_matrix_dim = (int(s_type[-3]), int(s_type[-1])) if self._b_matrix else (-1, -1)
+        self._i_numeric_size = _numeric_size(s_type, _base_string(s_type, self._b_array, self._b_matrix, self._b_vector))
+
+    @classmethod
+    def of(cls, s_type, node_data=None):
+        """
+        The shared instance for s_type. Types carrying node data are unique, so
+        those still get built every time
+        """
+        if isinstance(s_type, Type):
+            return s_type
+
+        if node_data is not None:
+            return cls(s_type, node_data)
+
+        type_ = cls._D_FLYWEIGHTS.get(s_type)
+        if type_ is None:
+            type_ = cls._D_FLYWEIGHTS[s_type] = cls(s_type)
+        return type_
 
     def has_access(self, s):
         return s in self._accessors
 
     def get_access(self, s):
-        i_array_dim = self.array_dim()
+        i_array_dim = self._i_array_dim
         s_prefix = i_array_dim * "array<"
         s_suffix = i_array_dim * ">"
-        return self.__class__(s_prefix + self._accessors.get(s, "NONE") + s_suffix, node_data=self.node_data())
+        return self.of(s_prefix + self._accessors.get(s, "NONE") + s_suffix, node_data=self._node_data)
 
     def base_type(self):
-        s_type = self._s_type
-        if self.is_array():
-            return self.__class__(s_type.rpartition("<")[2].partition(">")[0], node_data=self.node_data())
+        if self._base is None:
+            s_type = self._s_type
+            s_base = _base_string(s_type, self._b_array, self._b_matrix, self._b_vector)
+            self._base = self if s_base == s_type else self.of(s_base, node_data=self._node_data)
 
-        if self.is_matrix():
-            return self.__class__(s_type.rpartition("::")[2][:-3], node_data=self.node_data())
-
-        if self.is_vector():
-            return self.__class__(s_type.rpartition("::")[2][:-1], node_data=self.node_data())
-
-        return self.__class__(s_type, node_data=self.node_data())
+        return self._base
 
     def is_array(self):
-        return self.s.startswith("array<")
+        return self._b_array
 
     def is_numeric(self):
-        return (self.is_bool() or self.is_integer() or self.is_fraction()) and not self.is_array()
+        return (self.is_bool() or self.is_integer() or self.is_fraction()) and not self._b_array
 
     def is_vector(self):
-        return self.s[-1] in "234" and not self.is_matrix()
+        return self._b_vector
 
     def is_matrix(self):
-        return self.s[-3] in "234" and self.s[-2] in "x" and self.s[-1] in "234"
+        return self._b_matrix
 
     def is_fraction(self):
-        return self.base_type().s in ["float", "double"]
+        return self.base_type()._s_type in _SET_FRACTION
 
     def is_integer(self):
-        return self.base_type().s in ["char", "uchar", "short", "ushort", "int", "uint", "long", "ulong"]
+        return self.base_type()._s_type in _SET_INTEGER
 
     def is_unsigned(self):
-        return self.base_type().s in ["uchar", "ushort", "uint", "ulong"]
+        return self.base_type()._s_type in _SET_UNSIGNED
 
     def is_bool(self):
-        return self.base_type().s in ["bool"]
+        return self.base_type()._s_type == "bool"
 
     def is_string(self):
-        return self.base_type().s in ["string"]
+        return self.base_type()._s_type == "string"
 
     def is_node(self):
-        return self.s == "__NODE"
+        return self._s_type == "__NODE"
 
     def is_field(self):
-        return self.base_type().s in ["Core::Fields::ScalarField", "Core::Fields::VectorField"]
+        return self.base_type()._s_type in _SET_FIELD
 
     def is_big(self):
-        return self.base_type().s in ["long", "ulong", "double"]
+        return self.base_type()._s_type in _SET_BIG
 
     def vector_dim(self):
-        return int(self.s[-1]) if self.is_vector() else -1
+        return self._i_vector_dim
 
     def matrix_dim(self):
-        return (int(self.s[-3]), int(self.s[-1])) if self.is_matrix() else (-1, -1)
+        return self._ia_matrix_dim
 
     def array_dim(self):
-        return self.s.count("<")
+        return self._i_array_dim
 
     def numeric_size(self):
-        if self.is_bool() or self.s in ["char", "uchar"]:
-            return 1
-
-        if self.s in ["short", "ushort"]:
-            return 2
-
-        if self.s in ["int", "uint", "float"]:
-            return 4
-
-        if self.is_big():
-            return 8
-
-        return -1
+        return self._i_numeric_size
 
     def node_data(self):
         return self._node_data
 
     def copy(self):
-        return self.__class__(self.s, self.node_data())
+        return self.of(self.s, self.node_data())
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Type):
-            return self.s == other.s
-        return self.s == str(other)
+            return self._s_type == other._s_type
+        return self._s_type == str(other)
+
+    def __hash__(self):
+        return hash(self._s_type)
+
+    def __reduce__(self):
+        # go through of() again so unpickled types are the shared ones
+        return self.__class__.of, (self._s_type, self._node_data)
 
     @property
     def s(self):
@@ -152,12 +211,13 @@ def _prio():
             for c in range(2, 5):
                 sa_prios.append(f"Math::{s}{r}x{c}")
 
-    type_prio_list = [Type(s) for s in sa_prios]
+    type_prio_list = [Type.of(s) for s in sa_prios]
     return type_prio_list
 
 
 PROMOTION_PRIORITY_LIST = _prio()
 # print([t.s for t in PROMOTION_PRIORITY_LIST])
+_SET_PROMOTION = {t.s for t in PROMOTION_PRIORITY_LIST}
 
 ARRAY_DIM_MISSMATCH = 1
 INCOMPATIBLE_TYPES = 2
@@ -211,9 +271,12 @@ def _numeric_scalar(type_target, type_value):
     raise Exception(f"I thought I covered every case...: target='{type_target}', value='{type_value}'")
 
 
-def compatibility(type_target: Type, type_value: Type):
-    type_target = Type(type_target)
-    type_value = Type(type_value)
+def _compatibility(type_target: Type, type_value: Type):
+    """
+    The actual rules, compatibility() only looks the result up in a table built from this
+    """
+    type_target = Type.of(type_target)
+    type_value = Type.of(type_value)
 
     if type_value == type_target:
         return 0
@@ -291,38 +354,138 @@ def compatibility(type_target: Type, type_value: Type):
     return status
 
 
-def promotable(type, target):
-    i_compat = compatibility(target, type)
-    if i_compat == 0:
-        return True
+# Only numeric types have interesting rules, anything else is either the same type or
+# incompatible. So the table only covers the numeric scalar/vector/matrix types, indexed
+# by an integer id. Array dims are just a flag on top, see compatibility()
+_D_NUMERIC_IDS = None
+_IAA_COMPATIBILITY = None
 
-    if i_compat & ARRAY_DIM_MISSMATCH:
-        return False
+# numeric type -> everything in PROMOTION_PRIORITY_LIST it can be promoted to, in order
+_D_PROMOTIONS = {}
 
-    if i_compat & INCOMPATIBLE_TYPES:
-        return False
+# type string -> its coarse class and the classes of everything that can be promoted to it, see type_class().
+# The promotions only depend on the element type, so they are kept per element type as well
+_D_TYPE_CLASSES = {}
+_D_PROMOTION_CLASSES = {}
+_D_ELEMENT_PROMOTION_CLASSES = {}
 
-    if i_compat & NUMERIC_LOSSY_CONVERSION:
-        return False
+_NOT_PROMOTABLE = ARRAY_DIM_MISSMATCH | INCOMPATIBLE_TYPES | NUMERIC_LOSSY_CONVERSION | MATRIX_DIM_INCOMPATIBLE
 
-    if i_compat & MATRIX_DIM_INCOMPATIBLE:
-        return False
 
-    return True
+def _build_compatibility_table():
+    global _D_NUMERIC_IDS, _IAA_COMPATIBILITY
+
+    sa_numeric = []
+    for s_type in sorted(set(_D_TYPES) | set(_D_TYPE_DICT) | set(_D_TYPE_DICT.values())):
+        # vector looking names like "SomeEnum3" raise when asked for their base type
+        try:
+            if Type.of(s_type).is_numeric():
+                sa_numeric.append(s_type)
+        except Exception:
+            pass
+
+    types = [Type.of(s) for s in sa_numeric]
+    _IAA_COMPATIBILITY = [[_compatibility(type_target, type_value) for type_value in types] for type_target in types]
+    _D_NUMERIC_IDS = {s: i for i, s in enumerate(sa_numeric)}
+
+
+def _element_type(type_):
+    return type_.base_type() if type_.is_array() else type_
+
+
+def compatibility(type_target: Type, type_value: Type):
+    type_target = Type.of(type_target)
+    type_value = Type.of(type_value)
+
+    if type_value == type_target:
+        return 0
+
+    if _D_NUMERIC_IDS is None:
+        _build_compatibility_table()
+
+    status = ARRAY_DIM_MISSMATCH if type_value.array_dim() != type_target.array_dim() else 0
+
+    type_value_base = _element_type(type_value)
+    type_target_base = _element_type(type_target)
+    if type_value_base == type_target_base:
+        return status
+
+    i_target = _D_NUMERIC_IDS.get(type_target_base.s)
+    i_value = _D_NUMERIC_IDS.get(type_value_base.s)
+    if i_target is not None and i_value is not None:
+        return status | _IAA_COMPATIBILITY[i_target][i_value]
+
+    # anything the table doesnt know (not numeric or an alias nobody collected), do it the slow way
+    return status | _compatibility(type_target_base, type_value_base)
+
+
+def promotable(type, target):
+    return not (compatibility(target, type) & _NOT_PROMOTABLE)
 
 
 def promotable_to_one_of(type, targets):
-    i_arr_dim = type.array_dim()
-    _x_arr = lambda s, i: i * "array<" + s + i * ">"
-    promotion_list = [t for t in PROMOTION_PRIORITY_LIST if _x_arr(t.s, i_arr_dim) in targets]
+    type_base = _element_type(type)
 
-    for t in promotion_list:
-        type_base = type.base_type() if type.is_array() else type
-        if promotable(type_base, Type(t)):
-            return Type(i_arr_dim * "array<" + t.s + i_arr_dim * ">")
+    sa_promotions = _D_PROMOTIONS.get(type_base.s)
+    if sa_promotions is None:
+        sa_promotions = _D_PROMOTIONS[type_base.s] = [t.s for t in PROMOTION_PRIORITY_LIST if promotable(type_base, t)]
+
+    i_arr_dim = type.array_dim()
+    for s in sa_promotions:
+        s_type = i_arr_dim * "array<" + s + i_arr_dim * ">"
+        if s_type in targets:
+            return Type.of(s_type)
     return False
 
 
+def type_class(type_):
+    """
+    (array dim, "scalar" | "vector" | "matrix", "fraction" | "integer") for the types in
+    PROMOTION_PRIORITY_LIST and arrays of them. None for everything else, bool included
+    """
+    s_type = type_.s
+    if s_type in _D_TYPE_CLASSES:
+        return _D_TYPE_CLASSES[s_type]
+
+    ta_class = None
+    type_base = _element_type(type_)
+    if type_base.s in _SET_PROMOTION:
+        s_shape = "matrix" if type_base.is_matrix() else "vector" if type_base.is_vector() else "scalar"
+        ta_class = (type_.array_dim(), s_shape, "fraction" if type_base.is_fraction() else "integer")
+
+    _D_TYPE_CLASSES[s_type] = ta_class
+    return ta_class
+
+
+def promotion_classes(s_type):
+    """
+    The classes (see type_class) of all types a port that takes s_type accepts as it or
+    promotes to it. A type whose class is not in here cant end up as s_type
+    """
+    set_classes = _D_PROMOTION_CLASSES.get(s_type)
+    if set_classes is not None:
+        return set_classes
+
+    # vector looking enum names ("SomeEnum3") raise, they dont have a class anyway
+    try:
+        type_ = Type.of(s_type)
+        ta_class = type_class(type_)
+    except Exception:
+        ta_class = None
+
+    set_classes = frozenset()
+    if ta_class is not None:
+        type_base = _element_type(type_)
+        set_element = _D_ELEMENT_PROMOTION_CLASSES.get(type_base.s)
+        if set_element is None:
+            set_element = {ta_class[1:]} | {type_class(t)[1:] for t in PROMOTION_PRIORITY_LIST if promotable(t, type_base)}
+            set_element = _D_ELEMENT_PROMOTION_CLASSES[type_base.s] = frozenset(set_element)
+        set_classes = frozenset((ta_class[0],) + ta for ta in set_element)
+
+    _D_PROMOTION_CLASSES[s_type] = set_classes
+    return set_classes
+
+
 def get_numeric_base_type(type_lhs, type_rhs, b_char_as_bool=False):
     s_prefix = ""
     s_suffix = ""
@@ -355,29 +518,29 @@ def get_numeric_base_type(type_lhs, type_rhs, b_char_as_bool=False):
         s_prefix = f"Math::{s_prefix}"
         s_suffix = str(max(i_size_lhs, i_size_rhs))
 
-    return Type(s_prefix + s_base + s_suffix)
+    return Type.of(s_prefix + s_base + s_suffix)
 
 
 if __name__ == "__main__":
-    t_float = Type("float")
-    t_float_arr1 = Type("array<float>")
-    t_float_arr2 = Type("array<array<float>>")
+    t_float = Type.of("float")
+    t_float_arr1 = Type.of("array<float>")
+    t_float_arr2 = Type.of("array<array<float>>")
 
-    t_float3 = Type("Math::float3")
-    t_float3_arr1 = Type("array<Math::float3>")
-    t_float3_arr2 = Type("array<array<Math::float3>>")
+    t_float3 = Type.of("Math::float3")
+    t_float3_arr1 = Type.of("array<Math::float3>")
+    t_float3_arr2 = Type.of("array<array<Math::float3>>")
 
-    t_uint = Type("uint")
-    t_uint_arr1 = Type("array<uint>")
-    t_uint_arr2 = Type("array<array<uint>>")
+    t_uint = Type.of("uint")
+    t_uint_arr1 = Type.of("array<uint>")
+    t_uint_arr2 = Type.of("array<array<uint>>")
 
-    t_int = Type("int")
-    t_int_arr1 = Type("array<int>")
-    t_int_arr2 = Type("array<array<int>>")
+    t_int = Type.of("int")
+    t_int_arr1 = Type.of("array<int>")
+    t_int_arr2 = Type.of("array<array<int>>")
     
-    t_long = Type("long")
-    t_long_arr1 = Type("array<long>")
-    t_long_arr2 = Type("array<array<long>>")
+    t_long = Type.of("long")
+    t_long_arr1 = Type.of("array<long>")
+    t_long_arr2 = Type.of("array<array<long>>")
 
     print(compatibility(type_target=t_float, type_value=t_float3))
     print(compatibility(type_target=t_float, type_value=t_uint))
@@ -385,4 +548,3 @@ if __name__ == "__main__":
     print(compatibility(type_target=t_int_arr1, type_value=t_uint))
     print(compatibility(type_target=t_long, type_value=t_uint))
     print(compatibility(type_target=t_float3, type_value=t_float))
-
@@ -3,10 +3,12 @@
 #   - add arg/kwarg as separate rule
 #   - implement more BAD grammars
 #   - optimizations
+import hashlib
 import itertools
 import json
 import os
 import pathlib
+import pickle
 import re
 
 from BSL import _grammar, _node, _error, _constants, _special_types, _bifast, _type, _file_io
@@ -19,6 +21,169 @@ ENUMS = _bifres.ENUMS
 # self._functions = _special_types.Namespaces()
 
 
+_MODULE_CACHE_VERSION = 1
+
+
+class ModuleCache:
+    """
+    Process wide cache of imported modules so a library imported from ten files
+    only gets parsed and analysed once. Entries are keyed by the resolved path and
+    remember the content hash of the module and of everything it imports itself,
+    editing any file in that chain invalidates the entry.
+
+    Entries are also pickled to _constants.PATH_MODULE_CACHE so a new Maya session
+    doesnt have to analyse unchanged libraries again. Those are additionally keyed
+    by the BSL sources and the collected Bifrost data, see _get_signature().
+    """
+    _d_modules = {}
+    _d_digests = {}
+    _signature = None
+
+    i_hits = 0
+    i_disk_hits = 0
+    i_misses = 0
+
+    def __new__(cls, *args, **kwargs):
+        raise _error.Error("ModuleCache acts like a singleton. Use class methods directly")
+
+    @classmethod
+    def digest(cls, path):
+        """
+        Content hash of a file. Only rehashes when mtime or size changed
+        """
+        s_path = str(path)
+        stat = os.stat(s_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cls._d_digests.get(s_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        s_digest = hashlib.sha1(pathlib.Path(s_path).read_bytes()).hexdigest()
+        cls._d_digests[s_path] = (stamp, s_digest)
+        return s_digest
+
+    @classmethod
+    def _get_signature(cls):
+        """
+        What an analysed module depends on besides its own sources: the transpiler
+        itself (there is no other BSL version to go by), the grammar, the collected
+        Bifrost types, enums and nodes and BSLPATH, which decides what its imports
+        resolve to. The nodes get reloaded by Overlord.init(), so the signature is
+        tied to that
+        """
+        s_bslpath = os.environ.get("BSLPATH", "")
+        if cls._signature is None or cls._signature[0] is not Overlord._d_operators or cls._signature[1] != s_bslpath:
+            s_signature = _file_io.signature(f"{_MODULE_CACHE_VERSION}:{s_bslpath}", sorted(_constants.PATH_BASE.glob("**/*.py")) + [
+                _constants.PATH_BASE/"res"/"grammar.y",
+                _constants.PATH_BASE/"res"/"types.txt",
+                _constants.PATH_BIFROST_TYPES,
+                _constants.PATH_BIFROST_ENUMS,
+                _constants.PATH_BIFROST_NODES,
+            ])
+            cls._signature = (Overlord._d_operators, s_bslpath, s_signature)
+
+        return cls._signature[2]
+
+    @classmethod
+    def _get_disk_path(cls, path):
+        return _constants.PATH_MODULE_CACHE/f"{hashlib.sha1(str(path).encode()).hexdigest()}.pickle"
+
+    @classmethod
+    def _is_valid(cls, entry):
+        try:
+            if not all(cls.digest(s_path) == s_digest for s_path, s_digest in entry["digests"].items()):
+                return False
+        except OSError:
+            return False
+
+        # the overloads the module put on builtin operators have to be there again.
+        # If Overlord.init() got new nodes without that operator, the entry is useless
+        return all(s_func in Overlord._d_operators for s_func, _, _ in entry["operator_overloads"])
+
+    @classmethod
+    def _read(cls, path):
+        path_cache = cls._get_disk_path(path)
+        if not path_cache.exists():
+            return None
+
+        # a broken or outdated cache is not an error, we just analyse the module again
+        try:
+            entry = pickle.loads(path_cache.read_bytes())
+        except Exception:
+            return None
+
+        if not isinstance(entry, dict) or entry.get("signature") != cls._get_signature():
+            return None
+
+        return entry
+
+    @classmethod
+    def _write(cls, path, entry):
+        path_cache = cls._get_disk_path(path)
+        path_tmp = path_cache.with_suffix(".tmp")
+        try:
+            path_cache.parent.mkdir(parents=True, exist_ok=True)
+            path_tmp.write_bytes(pickle.dumps({**entry, "signature": cls._get_signature()}, protocol=pickle.HIGHEST_PROTOCOL))
+            path_tmp.replace(path_cache)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            # read-only install or a scope tree pickle cant handle, it just stays in memory
+            pass
+
+    @classmethod
+    def get(cls, path):
+        if not _constants.CACHE_IMPORTS:
+            return None
+
+        entry = cls._d_modules.get(str(path))
+        if entry is not None and cls._is_valid(entry):
+            cls.i_hits += 1
+
+        else:
+            entry = cls._read(path)
+            if entry is None or not cls._is_valid(entry):
+                cls.i_misses += 1
+                return None
+
+            cls._d_modules[str(path)] = entry
+            cls.i_disk_hits += 1
+
+        # we skipped v_overload, so redo what it did to the builtin operators
+        for s_func, s_key, sa_types_out in entry["operator_overloads"]:
+            Overlord.add_overload(s_func, s_key, sa_types_out)
+
+        return entry
+
+    @classmethod
+    def add(cls, path, sub_graph, s_digest):
+        entry = {
+            "functions": sub_graph._functions,
+            "digests": {str(path): s_digest, **sub_graph._import_digests},
+            "operator_overloads": sub_graph._operator_overloads,
+        }
+        if _constants.CACHE_IMPORTS:
+            cls._d_modules[str(path)] = entry
+            cls._write(path, entry)
+        return entry
+
+    @classmethod
+    def stats(cls):
+        return {"hits": cls.i_hits, "disk_hits": cls.i_disk_hits, "misses": cls.i_misses, "modules": len(cls._d_modules)}
+
+    @classmethod
+    def clear(cls, b_disk=False):
+        cls._d_modules.clear()
+        cls._d_digests.clear()
+        cls._signature = None
+        cls.i_hits = 0
+        cls.i_disk_hits = 0
+        cls.i_misses = 0
+
+        if b_disk:
+            for path in _constants.PATH_MODULE_CACHE.glob("*.pickle"):
+                path.unlink()
+
+
 class Ast(_node.NodeVisitor):
     @classmethod
     def run(cls, source, _imported=False):
@@ -36,11 +201,14 @@ class Ast(_node.NodeVisitor):
 
         source = str(source)
         if "\n" in source:
-            inst._source_code = source
-            result = inst.visit(parser.parse(source))
+            tree = parser.parse(source)
         else:
-            inst._source_code = (_constants.PATH_BASE/source).resolve().read_text()
-            result = inst.visit(parser.parse((_constants.PATH_BASE/source).resolve()))
+            tree = parser.parse((_constants.PATH_BASE/source).resolve())
+
+        # grab the line index before visiting, imports reuse the same lexer
+        inst._source_lines = _grammar.get_line_index()
+        inst._source_code = inst._source_lines.source
+        result = inst.visit(tree)
 
         if _imported:
             return inst
@@ -50,6 +218,10 @@ class Ast(_node.NodeVisitor):
 
     def _setup(self):
         self._functions = _special_types.Namespaces()
+        # content hashes of everything this module imports, directly or not
+        self._import_digests = {}
+        # (operator, signature, out types) this module and its imports put on builtin operators
+        self._operator_overloads = []
 
         self._feedback_lock = []
 
@@ -83,9 +255,8 @@ class Ast(_node.NodeVisitor):
         }
 
     def _get_source_location(self, node):
-        _s_before = self._source_code[:node.start]
-        nl = "\n"
-        return f"line: {_s_before.count(nl)+1}:{len(_s_before.rpartition(nl)[2])+1}"
+        i_line, i_column = self._source_lines.location(node.start)
+        return f"line: {i_line}:{i_column+1}"
 
     def format_log(self, node, s_log):
         def _expand_node(node_):
@@ -121,8 +292,8 @@ class Ast(_node.NodeVisitor):
         i_line_end = flat[-1].lineno
         in_last_line = [node for node in flat if node.lineno == i_line_end]
 
-        s_prev = self._source_code[:in_last_line[0].start].rpartition("\n")[2]
-        s_line = self._source_code.split("\n")[i_line_end - 1]
+        s_prev = self._source_lines.prefix(in_last_line[0].start)
+        s_line = self._source_lines.line(i_line_end)
         s_underline = "".join([(c if c == "\t" else " ") for c in s_prev])
 
         i_underline = in_last_line[-1].end - in_last_line[0].start
@@ -242,6 +413,7 @@ class Ast(_node.NodeVisitor):
         if not (path and path.exists()):
             s_err = self.format_error(node, f"Could not find a '{s_path}' to import")
             raise _error.BfNameError(s_err, b_stacktrace=False)
+        path = path.resolve()
 
         if len(node.children) == 3:
             s_namespace = pathlib.Path(s_path).name.partition(".")[0]
@@ -258,10 +430,19 @@ class Ast(_node.NodeVisitor):
         else:
             raise NotImplementedError
 
-        sub_graph = self.__class__.run(source=path, _imported=True)
+        entry = ModuleCache.get(path)
+        if entry is None:
+            # hash before parsing, an edit while parsing then just misses next time
+            s_digest = ModuleCache.digest(path)
+            sub_graph = self.__class__.run(source=path, _imported=True)
+            entry = ModuleCache.add(path, sub_graph, s_digest)
+
+        self._import_digests.update(entry["digests"])
+        self._operator_overloads.extend(entry["operator_overloads"])
 
-        for s_name, scope in sub_graph._functions.items():
-            self._functions[f"{s_namespace}::{s_name}"] = scope
+        for s_name, d_function in entry["functions"].items():
+            # v_overload and function calls write into these, dont let that leak into the cache
+            self._functions[f"{s_namespace}::{s_name}"] = {**d_function, "overloads": dict(d_function["overloads"])}
 
 
     # ==================== overload =========================
@@ -403,9 +584,10 @@ class Ast(_node.NodeVisitor):
                 sa_types_in[i] = s_type
 
             if b_is_custom:
-                self._functions[s_func]["overloads"][tuple(sa_types_in)] = [_type.Type(s) for s in sa_types_out]
+                self._functions[s_func]["overloads"][tuple(sa_types_in)] = [_type.Type.of(s) for s in sa_types_out]
             else:
-                Overlord._d_operators[s_func]["overloads"]["-".join(sa_types_in)] = sa_types_out
+                Overlord.add_overload(s_func, "-".join(sa_types_in), sa_types_out)
+                self._operator_overloads.append((s_func, "-".join(sa_types_in), list(sa_types_out)))
 
 
     # ================ functions/scopes =====================
@@ -708,7 +890,7 @@ class Ast(_node.NodeVisitor):
         return _bifast.LoopIndex(node, s_name, value)
 
     def v_safe_loop_settings(self, node):
-        index = _bifast.LoopIndex(node, "current_index", _bifast.Value(node, 0, _type.Type("long")))
+        index = _bifast.LoopIndex(node, "current_index", _bifast.Value(node, 0, _type.Type.of("long")))
         if len(node.children) == 3:
             index = self.visit(node["current_index"])
         return self.visit(node["max_iterations"]), index
@@ -717,7 +899,7 @@ class Ast(_node.NodeVisitor):
         s_rule = node.children[0].type
 
         if s_rule == "EMPTY":
-            return None, _bifast.LoopIndex(node, "current_index", _bifast.Value(node, 0, _type.Type("long")))
+            return None, _bifast.LoopIndex(node, "current_index", _bifast.Value(node, 0, _type.Type.of("long")))
 
         elif s_rule == "safe_loop_settings":
             return self.visit(node["safe_loop_settings"])
@@ -855,21 +1037,21 @@ class Ast(_node.NodeVisitor):
             raise _error.Error(s_error, b_stacktrace=False)
 
         _bifast.push_scope()
-        _bifast.set_static_variable("#", _type.Type("long"), )
-        _bifast.set_static_variable(current_index.name(), _type.Type("long"))
+        _bifast.set_static_variable("#", _type.Type.of("long"), )
+        _bifast.set_static_variable(current_index.name(), _type.Type.of("long"))
 
         # add the settings
         if max_iterations is not None:
-            _bifast.set_static_variable("max_iterations", _type.Type("long"))
+            _bifast.set_static_variable("max_iterations", _type.Type.of("long"))
 
         # add the inputs
         for parm in parameters:
             s_type = parm.value_type().s
-            _bifast.set_static_variable(parm.name(), _type.Type(s_type[6:-1] if parm.is_iteration_target() else s_type))
+            _bifast.set_static_variable(parm.name(), _type.Type.of(s_type[6:-1] if parm.is_iteration_target() else s_type))
 
         # add the result
         for res in results:
-            _bifast.set_static_variable(res.name(), _type.Type(res.value_type().s[6:-1]), b_write_only=True)
+            _bifast.set_static_variable(res.name(), _type.Type.of(res.value_type().s[6:-1]), b_write_only=True)
 
         # run the body of the loop
         self._feedback_lock.append(None)
@@ -955,22 +1137,22 @@ class Ast(_node.NodeVisitor):
             raise _error.Error(s_error, b_stacktrace=False)
 
         _bifast.push_scope()
-        _bifast.set_static_variable("#", _type.Type("long"))
-        _bifast.set_static_variable(current_index.name(), _type.Type("long"))
+        _bifast.set_static_variable("#", _type.Type.of("long"))
+        _bifast.set_static_variable(current_index.name(), _type.Type.of("long"))
 
         # add the settings
         if max_iterations is not None:
-            _bifast.set_static_variable("max_iterations", _type.Type("long"))
+            _bifast.set_static_variable("max_iterations", _type.Type.of("long"))
 
         # add the inputs
         for parm in parameters:
             s_type = parm.value_type().s
-            _bifast.set_static_variable(parm.name(), _type.Type(s_type[6:-1] if parm.is_iteration_target() else s_type))
+            _bifast.set_static_variable(parm.name(), _type.Type.of(s_type[6:-1] if parm.is_iteration_target() else s_type))
 
         # add the result
         for res in results:
             s_type = res.value_type().s
-            _bifast.set_static_variable(res.name(), _type.Type(s_type[6:-1] if res.is_iteration_target() else s_type), b_write_only=True)
+            _bifast.set_static_variable(res.name(), _type.Type.of(s_type[6:-1] if res.is_iteration_target() else s_type), b_write_only=True)
 
         # run the body of the loop
         self._feedback_lock.append(None)
@@ -1054,16 +1236,16 @@ class Ast(_node.NodeVisitor):
         _bifast.push_scope()
 
         # add the settings
-        _bifast.set_static_variable("#", _type.Type("long"))
-        _bifast.set_static_variable(current_index.name(), _type.Type("long"))
+        _bifast.set_static_variable("#", _type.Type.of("long"))
+        _bifast.set_static_variable(current_index.name(), _type.Type.of("long"))
 
         if max_iterations is not None:
-            _bifast.set_static_variable("max_iterations", _type.Type("long"))
+            _bifast.set_static_variable("max_iterations", _type.Type.of("long"))
 
         # add the inputs
         for parm in parameters:
             s_type = parm.value_type().s
-            _bifast.set_static_variable(parm.name(), _type.Type(s_type[6:-1] if parm.is_iteration_target() else s_type))
+            _bifast.set_static_variable(parm.name(), _type.Type.of(s_type[6:-1] if parm.is_iteration_target() else s_type))
 
         # add the results
         for res in results:
@@ -1391,7 +1573,7 @@ class Ast(_node.NodeVisitor):
             else:
                 raise NotImplementedError(s_func_name)
 
-            return _bifast.Value(node, s, _type.Type("string"))
+            return _bifast.Value(node, s, _type.Type.of("string"))
 
         if self._functions.resolves(s_func_name):
             x_func = lambda v, t, n, inst=self, nd=node: _validate_type_cast(inst, nd, type_value=v, type_target=t, s_port=n)
@@ -1591,7 +1773,7 @@ class Ast(_node.NodeVisitor):
             raise _error.BfTypeError(s_error, b_stacktrace=False)
 
         if node.children[3].type != "expression":
-            value_or_type = _type.Type(value_or_type)
+            value_or_type = _type.Type.of(value_or_type)
 
         return _bifast.AccessRHS_Default(node, key, value_or_type)
 
@@ -1812,7 +1994,7 @@ class Ast(_node.NodeVisitor):
         if s_component_type.count("<") > 2:
             raise _error.BfTypeError(self.format_error(node, "Max array dimension is 3"), b_stacktrace=False)
 
-        type_value = _type.Type(visited_children[1])
+        type_value = _type.Type.of(visited_children[1])
         value_count = visited_children[3] if len(node.children) == 5 else _bifast.Value(node, 0, "long")
         return _bifast.EmptyArray(node, value_count, type_value)
 
@@ -1842,7 +2024,7 @@ class Ast(_node.NodeVisitor):
     def v_vector(self, node):
         values = self.visit(node["_vector"])  # type: list[_bifast.Value]
         s_type_hint = self.visit(node.children[2])[1:].lower()
-        type_target = _type.Type(self.type_hint_to_port_type(s_type_hint))
+        type_target = _type.Type.of(self.type_hint_to_port_type(s_type_hint))
         status, result = _bifast.Vector.create(node, values, type_component=type_target)
         if not status:
             s_err = self.format_error(node, result)
@@ -1934,7 +2116,7 @@ class Ast(_node.NodeVisitor):
     def v_matrix(self, node):
         values = self.visit(node["_matrix"])  # type: list[_bifast.Value]
         s_type_hint = self.visit(node.children[2])[1:].lower()
-        type_target = _type.Type(self.type_hint_to_port_type(s_type_hint))
+        type_target = _type.Type.of(self.type_hint_to_port_type(s_type_hint))
         status, result = _bifast.Matrix.create(node, values, type_component=type_target)
         if not status:
             s_err = self.format_error(node, result)
@@ -60,9 +60,9 @@ INDEX = [#]
 STATE = @
 
 # (([a-zA-Z_][a-zA-Z0-9_]*::)+[a-zA-Z_][a-zA-Z0-9_]*)|(([a-zA-Z_][a-zA-Z0-9_]*\.)+[a-zA-Z_][a-zA-Z0-9_]*)
-ENUM_VALUE = ({__ENUMS__})\.[a-zA-Z_][a-zA-Z0-9_]*
-#ENUM = ({__ENUMS__})
-#TYPE = ({__TYPES__})
+# matches any <name>.<name>, _t_ENUM_VALUE checks the first part against the known enums
+ENUM_VALUE = ([a-zA-Z_][a-zA-Z0-9_]*::)*[a-zA-Z_][a-zA-Z0-9_]*\.[a-zA-Z_][a-zA-Z0-9_]*
+# ENUM and TYPE are not matched by a regex. _t_NAME patches the token type
 #NAMESPACE = ([a-zA-Z_][a-zA-Z0-9_]*::)+
 #NAME = \$?[a-zA-Z_][a-zA-Z0-9_]*
 NAME = (([a-zA-Z_][a-zA-Z0-9_]*::)*[a-zA-Z_][a-zA-Z0-9_]*)|\$?[a-zA-Z_][a-zA-Z0-9_]*
@@ -0,0 +1,160 @@
+"""
+Runs the self tests of all overloads the Overlord defines, see Overlord.verify(),
+after checking the type compatibility table against the rules it was built from.
+They used to run on every import, now they only run here, so run this after
+collecting new nodes or changing overloads/resolvers:
+    mayapy -m BSL.verify_overloads [nodes.json] [--jobs 8] [--filter Core::Math]
+
+Importing BSL needs maya.cmds, so this runs in mayapy but not in a plain Python.
+The functions are sharded across a process pool, every function gets its own
+pass/fail line with the time it took. The exit code is 1 if anything failed.
+"""
+import argparse
+import concurrent.futures
+import os
+import pathlib
+import sys
+import time
+
+from BSL import _constants, _error, _type
+from BSL._overlord import Overlord
+
+
+def _compare(s_call, x_table, x_rules):
+    # both have to give the same, raising counts as an answer too
+    results = []
+    for x in (x_table, x_rules):
+        try:
+            results.append(("returned", x()))
+        except Exception as e:
+            results.append(("raised", type(e).__name__))
+
+    if results[0] != results[1]:
+        (s_table, table), (s_rules, rules) = results
+        raise _error.Error(f"{s_call} doesnt match: the table {s_table} {table}, the rules {s_rules} {rules}", b_stacktrace=False)
+
+
+def _promotable_to_one_of(type_, targets):
+    # promotable_to_one_of() straight from the rules
+    i_arr_dim = type_.array_dim()
+    _x_arr = lambda s, i: i * "array<" + s + i * ">"
+    for t in [t for t in _type.PROMOTION_PRIORITY_LIST if _x_arr(t.s, i_arr_dim) in targets]:
+        if not (_type._compatibility(t, _type._element_type(type_)) & _type._NOT_PROMOTABLE):
+            return _type.Type.of(_x_arr(t.s, i_arr_dim))
+    return False
+
+
+def verify_compatibility_table():
+    """
+    Compares the table lookups of _type.compatibility() and promotable_to_one_of()
+    against the actual rules for every pair of numeric types (up to 2D arrays) and
+    every known type against a few others. Raises on the first mismatch
+    """
+    if _type._D_NUMERIC_IDS is None:
+        _type._build_compatibility_table()
+
+    sa_numeric = list(_type._D_NUMERIC_IDS)
+    types = [_type.Type.of(i * "array<" + s + i * ">") for s in sa_numeric for i in range(3)]
+    for type_target in types:
+        for type_value in types:
+            _compare(f"compatibility({type_target}, {type_value})",
+                     lambda: _type.compatibility(type_target, type_value),
+                     lambda: _type._compatibility(type_target, type_value))
+
+    sa_targets = [s for s in sa_numeric if "x" not in s] + ["array<float>", "array<Math::float3>"]
+    for type_ in types:
+        _compare(f"promotable_to_one_of({type_})",
+                 lambda: _type.promotable_to_one_of(type_, sa_targets),
+                 lambda: _promotable_to_one_of(type_, sa_targets))
+
+    others = [_type.Type.of(s) for s in ["bool", "float", "Math::float3", "string", "array<string>"]]
+    i_others = 0
+    for s_type in set(_type._D_TYPES) | set(_type._D_TYPE_DICT):
+        # vector looking enum names ("SomeEnum3") dont even make it to a Type
+        try:
+            type_ = _type.Type.of(s_type)
+        except Exception:
+            continue
+
+        i_others += 1
+        for other in others:
+            for type_target, type_value in ((type_, other), (other, type_)):
+                _compare(f"compatibility({type_target}, {type_value})",
+                         lambda: _type.compatibility(type_target, type_value),
+                         lambda: _type._compatibility(type_target, type_value))
+
+    print(f"compatibility table matches for {len(types)} numeric and {i_others} other types")
+
+
+def _init_worker(s_path_nodes):
+    # forked workers already have the tables, spawned ones get them from the snapshot
+    Overlord.init(pathlib.Path(s_path_nodes))
+
+
+def _verify(s_func):
+    f_start = time.perf_counter()
+    try:
+        s_status = "ok" if Overlord.verify(s_func) else "skip"
+        s_msg = ""
+    except Exception as e:
+        s_status = "FAIL"
+        s_msg = f"{type(e).__name__}: {e}"
+
+    return s_func, s_status, s_msg, time.perf_counter() - f_start
+
+
+def verify(path_nodes=None, i_jobs=None, s_filter=""):
+    """
+    Verifies all overloaded functions and prints a report. Returns a list of
+    (s_func, s_status, s_msg, f_time) with s_status being "ok", "skip" or "FAIL"
+    """
+    path_nodes = pathlib.Path(path_nodes or _constants.PATH_BIFROST_NODES)
+    i_jobs = i_jobs or os.cpu_count() or 1
+
+    # everything below depends on it, a mismatch raises right here
+    verify_compatibility_table()
+
+    # load everything once up here, that writes the snapshot the workers start from
+    Overlord.init(path_nodes)
+    sa_funcs = [s for s in Overlord.overloaded_functions() if s_filter in s]
+
+    f_start = time.perf_counter()
+    if i_jobs == 1:
+        results = [_verify(s_func) for s_func in sa_funcs]
+    else:
+        i_chunk = max(1, len(sa_funcs) // (4 * i_jobs))
+        with concurrent.futures.ProcessPoolExecutor(i_jobs, initializer=_init_worker, initargs=(str(path_nodes),)) as pool:
+            results = list(pool.map(_verify, sa_funcs, chunksize=i_chunk))
+    f_total = time.perf_counter() - f_start
+
+    for s_func, s_status, s_msg, f_time in results:
+        print(f"{s_status:>4} {f_time * 1000:8.1f}ms  {s_func}")
+        if s_msg:
+            print("      " + s_msg.replace("\n", "\n      "))
+
+    d_counts = {s: 0 for s in ("ok", "skip", "FAIL")}
+    for _, s_status, _, _ in results:
+        d_counts[s_status] += 1
+
+    print(f"\nPassed {d_counts['ok']}, failed {d_counts['FAIL']}, skipped {d_counts['skip']} "
+          f"in {f_total:.2f}s ({i_jobs} processes)")
+
+    for s_func, _, _, f_time in sorted(results, key=lambda r: -r[3])[:5]:
+        print(f"    slowest: {f_time * 1000:8.1f}ms  {s_func}")
+
+    return results
+
+
+def main(sa_args=None):
+    parser = argparse.ArgumentParser(prog="BSL.verify_overloads", description="Self tests of the Overlord overloads")
+    parser.add_argument("nodes", nargs="?", default=None, help="nodes.json to test against, the collected one by default")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes, all cores by default")
+    parser.add_argument("-f", "--filter", default="", help="only functions containing this")
+    args = parser.parse_args(sa_args)
+
+    results = verify(args.nodes, args.jobs, args.filter)
+    return 1 if any(s_status == "FAIL" for _, s_status, _, _ in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())